@@ -0,0 +1,51 @@
+from pydantic_settings import BaseSettings
+
+class GatewayConfig(BaseSettings):
+    upstream_timeout: float = 60.0
+    upstream_max_connections: int = 100
+    upstream_max_keepalive_connections: int = 20
+    stream_chunk_size: int = 8192
+    stream_buffer_chunks: int = 16  # Max chunks held in memory per relayed stream
+    disconnect_poll_interval: float = 0.5  # Seconds between client disconnect checks
+    ws_sample_rate: int = 16000  # WebSocket voice frames are 16-bit mono PCM at this rate
+    ws_partial_interval_seconds: float = 1.5
+    ws_max_segment_seconds: float = 10.0  # Most new audio sent in one partial transcription
+    ws_max_audio_seconds: int = 120
+    output_cache_dir: str = ""  # Cache generated PDFs/audio here; empty disables caching
+    output_cache_max_mb: int = 1024
+    pdf_page_concurrency: int = 8  # Per-page upstream calls in flight for one document
+    pdf_page_retries: int = 2
+    pdf_page_retry_backoff: float = 0.5
+    pdf_text_layer_enabled: bool = True  # Use a page's embedded text instead of OCR when it looks reliable
+    pdf_text_layer_min_chars: int = 50
+    pdf_text_layer_min_coverage: float = 0.95  # Share of characters that are not garbage/private-use
+    pdf_text_layer_min_script_ratio: float = 0.6  # Share of letters in the requested language's script
+    pdf_text_layer_max_orphan_marks: float = 0.05  # Share of Indic vowel signs without a preceding letter
+    vision_model: str = "google/gemma-3-4b-it"  # Model name sent to EXTERNAL_VISION_API_BASE_URL
+    vision_max_tokens: int = 2048
+    raster_dpi: int = 150
+    raster_format: str = "png"  # png or jpeg
+    raster_workers: int = 0  # Rasterization processes; 0 uses one per CPU
+    image_max_side: int = 1024  # Batch visual query images are downsized to this longer side; 0 sends them as uploaded
+    image_jpeg_quality: int = 85
+    summary_context_tokens: int = 4096  # Context window of the summarization model
+    summary_max_tokens: int = 512  # Upstream max_tokens for each generated summary
+    summary_chars_per_token: int = 2  # Low enough for Indic scripts, which take more tokens per character than English
+    summary_max_prompt_chars: int = 1000  # Longest prompt sent to the upstream /v1/chat, instruction included
+    job_db_path: str = "jobs.db"  # SQLite file holding queued and finished document jobs
+    job_workers: int = 2  # Jobs processed at the same time
+    job_poll_interval: float = 1.0  # Seconds between updates on a job event stream
+    retrieval_top_k: int = 3  # Pages sent to the model when a PDF prompt has no page number
+    retrieval_cache_size: int = 32  # Documents whose page index is kept in memory
+    translate_batch_window: float = 0.01  # Seconds to gather concurrent translate calls per language pair; 0 disables batching
+    translate_max_batch_size: int = 64  # Sentences that trigger sending a batch before the window closes
+    translate_bucket_size: int = 16  # Sentences per length bucket sent upstream
+    translate_bucket_concurrency: int = 4  # Length buckets of one batch in flight upstream at the same time
+    translate_split_sentences: bool = True  # Translate multi-sentence inputs sentence by sentence
+    batch_concurrency: int = 8  # Items of a batch request processed at the same time
+    batch_max_items: int = 100  # Items accepted in one batch request
+    batch_retries: int = 2  # Retries per failed batch item
+    batch_retry_backoff: float = 0.5
+    batch_max_archive_mb: int = 512  # Uncompressed size accepted for an uploaded zip archive
+
+config = GatewayConfig()
@@ -1,18 +1,32 @@
 import argparse
+import re
 import os
 from typing import List
 from abc import ABC, abstractmethod
 import uvicorn
-from fastapi import FastAPI, File, HTTPException, Query, Request, UploadFile, Form, Depends
+from fastapi import FastAPI, File, HTTPException, Query, Request, UploadFile, Form, Depends, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse, StreamingResponse
 from pydantic import BaseModel, Field
-import requests
+import httpx
 from time import time
 
 # Assuming these are in your project structure
 from config.tts_config import SPEED, ResponseFormat, config as tts_config
+from config.gateway_config import config as gateway_config
 from config.logging_config import logger
+from utils.fanout import map_concurrently
+from utils.file_response import ranged_file_response
+from utils.output_cache import output_cache
+from utils.raster import shutdown_pool
+from utils.pdf import single_page_pdf, split_pdf_pages
+from utils.speech_session import run_speech_to_speech_session
+from utils.metrics import metrics_snapshot
+from utils.summarize import summarize_pages_text
+from utils.text_layer import usable_text_layer
+from utils.translation import translate_sentences
+from utils.vision import PAGE_EXTRACTION_PROMPT, vision_enabled, vision_extract_text
+from utils.upstream import cancel_on_disconnect, close_client, open_stream, post_upstream, relay_stream
 
 # FastAPI app setup with enhanced docs
 app = FastAPI(
@@ -115,24 +129,23 @@ class VisualQueryResponse(BaseModel):
 # TTS Service Interface
 class TTSService(ABC):
     @abstractmethod
-    async def generate_speech(self, payload: dict) -> requests.Response:
+    async def generate_speech(self, payload: dict) -> httpx.Response:
         pass
 
 class ExternalTTSService(TTSService):
-    async def generate_speech(self, payload: dict) -> requests.Response:
+    async def generate_speech(self, payload: dict) -> httpx.Response:
         try:
             base_url = f"{os.getenv('EXTERNAL_API_BASE_URL')}/v1/audio/speech"
-            return requests.post(
+            return await open_stream(
+                "POST",
                 base_url,
                 json=payload,
-                headers={"accept": "*/*", "Content-Type": "application/json"},
-                stream=True,
-                timeout=60
+                headers={"accept": "*/*", "Content-Type": "application/json"}
             )
-        except requests.Timeout:
+        except httpx.TimeoutException:
             logger.error("External TTS API timeout")
             raise HTTPException(status_code=504, detail="External TTS API timeout")
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"External TTS API error: {str(e)}")
             raise HTTPException(status_code=502, detail=f"External TTS service error: {str(e)}")
 
@@ -148,6 +161,14 @@ def get_tts_service() -> TTSService:
 async def health_check():
     return {"status": "healthy", "model": "llm_model_name"}  # Placeholder model name
 
+@app.get("/v1/metrics",
+         summary="Gateway Metrics",
+         description="Returns gateway counters, including upstream calls cancelled because the client disconnected.",
+         tags=["Utility"],
+         response_model=dict)
+async def get_metrics():
+    return metrics_snapshot()
+
 @app.get("/",
          summary="Redirect to Docs",
          description="Redirects to the Swagger UI documentation.",
@@ -155,6 +176,42 @@ async def health_check():
 async def home():
     return RedirectResponse(url="/docs")
 
+@app.on_event("shutdown")
+async def shutdown_upstream_client():
+    await close_client()
+
+@app.on_event("shutdown")
+async def stop_raster_pool():
+    shutdown_pool()
+
+OUTPUT_MEDIA_TYPES = {".pdf": "application/pdf", ".mp3": "audio/mp3"}
+
+@app.get("/v1/outputs/{name}",
+         summary="Download a Generated Output",
+         description="Download a cached generated file (speech MP3 or PDF) by the name returned in the Content-Location header. Supports Range, If-Range and If-None-Match for resumed downloads.",
+         tags=["Utility"],
+         responses={
+             200: {"description": "Generated file"},
+             206: {"description": "Requested byte range of the generated file"},
+             304: {"description": "Client copy is current"},
+             404: {"description": "Output not found or expired"},
+             416: {"description": "Requested range not satisfiable"}
+         })
+async def get_output(request: Request, name: str):
+    key, suffix = os.path.splitext(name)
+    if suffix not in OUTPUT_MEDIA_TYPES or not re.fullmatch(r"[0-9a-f]{64}", key):
+        raise HTTPException(status_code=404, detail="Output not found")
+    response = output_cache.file_response(
+        request,
+        key,
+        suffix,
+        OUTPUT_MEDIA_TYPES[suffix],
+        headers={"Content-Disposition": f"attachment; filename=\"{name}\""}
+    )
+    if response is None:
+        raise HTTPException(status_code=404, detail="Output not found")
+    return response
+
 from fastapi.responses import FileResponse
 from fastapi.background import BackgroundTasks
 import tempfile
@@ -190,51 +247,65 @@ async def generate_audio(
     
     payload = {"text": input}
     
+    headers = {
+        "Content-Disposition": "attachment; filename=\"speech.mp3\"",
+        "Cache-Control": "no-cache",
+    }
+    
+    # Cached clips are served with Range/ETag support so clients can resume or seek
+    cache_key = output_cache.key_for("audio/speech", input)
+    cached_response = output_cache.file_response(
+        request, cache_key, ".mp3", "audio/mp3",
+        headers={**headers, "Content-Location": f"/v1/outputs/{cache_key}.mp3"}
+    )
+    if cached_response is not None:
+        logger.info(f"Serving cached speech: {cache_key}")
+        return cached_response
+    
+    response = await tts_service.generate_speech(payload)
+    
+    if output_cache.enabled:
+        try:
+            cached_path = await output_cache.store(response.aiter_bytes(8192), cache_key, ".mp3")
+        except httpx.HTTPError as e:
+            logger.error(f"External TTS request failed: {str(e)}")
+            raise HTTPException(status_code=502, detail=f"External TTS service error: {str(e)}")
+        finally:
+            await response.aclose()
+        headers["Content-Location"] = f"/v1/outputs/{cache_key}.mp3"
+        return ranged_file_response(request, cached_path, "audio/mp3", etag=cache_key, headers=headers)
+    
     # Create a temporary file to store the audio
     temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".mp3")
     temp_file_path = temp_file.name
     
+    # Schedule file cleanup as a background task
+    def cleanup_file(file_path: str):
+        try:
+            if os.path.exists(file_path):
+                os.unlink(file_path)
+                logger.info(f"Deleted temporary file: {file_path}")
+        except Exception as e:
+            logger.error(f"Failed to delete temporary file {file_path}: {str(e)}")
+    
     try:
-        response = await tts_service.generate_speech(payload)
-        response.raise_for_status()
-        
         # Write audio content to the temporary file
-        with open(temp_file_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
-        
-        # Prepare headers for the response
-        headers = {
-            "Content-Disposition": "attachment; filename=\"speech.mp3\"",
-            "Cache-Control": "no-cache",
-        }
-        
-        # Schedule file cleanup as a background task
-        def cleanup_file(file_path: str):
-            try:
-                if os.path.exists(file_path):
-                    os.unlink(file_path)
-                    logger.info(f"Deleted temporary file: {file_path}")
-            except Exception as e:
-                logger.error(f"Failed to delete temporary file {file_path}: {str(e)}")
-        
-        background_tasks.add_task(cleanup_file, temp_file_path)
-        
-        # Return the file as a FileResponse
-        return FileResponse(
-            path=temp_file_path,
-            filename="speech.mp3",
-            media_type="audio/mp3",
-            headers=headers
-        )
-    
-    except requests.HTTPError as e:
+        async for chunk in response.aiter_bytes(8192):
+            if chunk:
+                temp_file.write(chunk)
+    except httpx.HTTPError as e:
         logger.error(f"External TTS request failed: {str(e)}")
+        temp_file.close()
+        cleanup_file(temp_file_path)
         raise HTTPException(status_code=502, detail=f"External TTS service error: {str(e)}")
     finally:
         # Close the temporary file to ensure it's fully written
         temp_file.close()
+        await response.aclose()
+    
+    background_tasks.add_task(cleanup_file, temp_file_path)
+    
+    return ranged_file_response(request, temp_file_path, "audio/mp3", headers=headers)
 
 @app.post("/v1/chat", 
           response_model=ChatResponse,
@@ -265,14 +336,14 @@ async def chat(
             "tgt_lang": chat_request.tgt_lang
         }
         
-        response = requests.post(
+        response = await post_upstream(
+            request,
             external_url,
             json=payload,
             headers={
                 "accept": "application/json",
                 "Content-Type": "application/json"
-            },
-            timeout=60
+            }
         )
         response.raise_for_status()
         
@@ -281,12 +352,14 @@ async def chat(
         logger.info(f"Generated Chat response from external API: {response_text}")
         return ChatResponse(response=response_text)
     
-    except requests.Timeout:
+    except httpx.TimeoutException:
         logger.error("External chat API request timed out")
         raise HTTPException(status_code=504, detail="Chat service timeout")
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Error calling external chat API: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Chat failed: {str(e)}")
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error processing request: {str(e)}")
         raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
@@ -302,6 +375,7 @@ async def chat(
               504: {"description": "Transcription service timeout"}
           })
 async def transcribe_audio(
+    request: Request,
     file: UploadFile = File(..., description="Audio file to transcribe"),
     language: str = Query(..., description="Language of the audio (kannada, hindi, tamil)")
 ):
@@ -316,11 +390,11 @@ async def transcribe_audio(
         files = {"file": (file.filename, file_content, file.content_type)}
         
         external_url = f"{os.getenv('EXTERNAL_API_BASE_URL')}/v1/transcribe/?language={language}"
-        response = requests.post(
+        response = await post_upstream(
+            request,
             external_url,
             files=files,
-            headers={"accept": "application/json"},
-            timeout=60
+            headers={"accept": "application/json"}
         )
         response.raise_for_status()
         
@@ -328,10 +402,10 @@ async def transcribe_audio(
         logger.info(f"Transcription completed in {time() - start_time:.2f} seconds")
         return TranscriptionResponse(text=transcription)
     
-    except requests.Timeout:
+    except httpx.TimeoutException:
         logger.error("Transcription service timed out")
         raise HTTPException(status_code=504, detail="Transcription service timeout")
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Transcription request failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
 
@@ -347,10 +421,11 @@ async def transcribe_audio(
               504: {"description": "Translation service timeout"}
           })
 async def translate(
-    request: TranslationRequest
+    request: Request,
+    translation_request: TranslationRequest
 ):
     # Validate inputs
-    if not request.sentences:
+    if not translation_request.sentences:
         raise HTTPException(status_code=400, detail="Sentences cannot be empty")
     
     # Validate language codes
@@ -359,45 +434,26 @@ async def translate(
         "deu_Latn", "fra_Latn", "nld_Latn", "spa_Latn", "ita_Latn", "por_Latn",
         "rus_Cyrl", "pol_Latn"
     ]
-    if request.src_lang not in supported_languages or request.tgt_lang not in supported_languages:
-        raise HTTPException(status_code=400, detail=f"Unsupported language codes: src={request.src_lang}, tgt={request.tgt_lang}")
-
-    logger.info(f"Received translation request: {len(request.sentences)} sentences, src_lang: {request.src_lang}, tgt_lang: {request.tgt_lang}")
-
-    external_url = f"{os.getenv('EXTERNAL_API_BASE_URL')}/v1/translate"
+    if translation_request.src_lang not in supported_languages or translation_request.tgt_lang not in supported_languages:
+        raise HTTPException(status_code=400, detail=f"Unsupported language codes: src={translation_request.src_lang}, tgt={translation_request.tgt_lang}")
 
-    payload = {
-        "sentences": request.sentences,
-        "src_lang": request.src_lang,
-        "tgt_lang": request.tgt_lang
-    }
+    logger.info(f"Received translation request: {len(translation_request.sentences)} sentences, src_lang: {translation_request.src_lang}, tgt_lang: {translation_request.tgt_lang}")
 
     try:
-        response = requests.post(
-            external_url,
-            json=payload,
-            headers={
-                "accept": "application/json",
-                "Content-Type": "application/json"
-            },
-            timeout=60
-        )
-        response.raise_for_status()
-
-        response_data = response.json()
-        translations = response_data.get("translations", [])
-
-        if not translations or len(translations) != len(request.sentences):
-            logger.warning(f"Unexpected response format: {response_data}")
-            raise HTTPException(status_code=500, detail="Invalid response from translation service")
+        # Sentences are split and batched with concurrent requests for the same language pair
+        translations = await cancel_on_disconnect(request, translate_sentences(
+            translation_request.sentences,
+            translation_request.src_lang,
+            translation_request.tgt_lang
+        ))
 
         logger.info(f"Translation successful: {translations}")
         return TranslationResponse(translations=translations)
 
-    except requests.Timeout:
+    except httpx.TimeoutException:
         logger.error("Translation request timed out")
         raise HTTPException(status_code=504, detail="Translation service timeout")
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Error during translation: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Translation failed: {str(e)}")
     except ValueError as e:
@@ -406,11 +462,13 @@ async def translate(
 
 class PDFTextExtractionResponse(BaseModel):
     page_content: str = Field(..., description="Extracted text from the specified PDF page")
+    extraction_method: str = Field("ocr", description="How the text was extracted: text_layer (embedded PDF text) or ocr (vision model)")
 
     class Config:
         schema_extra = {
             "example": {
-                "page_content": "Google Interview Preparation Guide\nCustomer Engineer Specialist\n\nOur hiring process\n..."
+                "page_content": "Google Interview Preparation Guide\nCustomer Engineer Specialist\n\nOur hiring process\n...",
+                "extraction_method": "text_layer"
             }
         }
 
@@ -445,15 +503,29 @@ async def extract_text(
     
     start_time = time()
     try:
-        file_content = await file.read()
-        files = {"file": (file.filename, file_content, file.content_type)}
+        # Forward only the requested page, which is page 1 of the sliced PDF
+        page_pdf = await single_page_pdf(await file.read(), page_number)
+
+        # Born-digital pages carry a reliable text layer, which makes OCR unnecessary
+        text_layer = await usable_text_layer(page_pdf, language)
+        if text_layer:
+            logger.info(f"PDF text extraction completed from the text layer in {time() - start_time:.2f} seconds")
+            return PDFTextExtractionResponse(page_content=text_layer, extraction_method="text_layer")
+
+        if vision_enabled():
+            # Render the page here and send the image straight to the vision model
+            extracted_text = await vision_extract_text(request, page_pdf)
+            logger.info(f"PDF text extraction completed with the vision model in {time() - start_time:.2f} seconds")
+            return PDFTextExtractionResponse(page_content=extracted_text.strip(), extraction_method="ocr")
+
+        files = {"file": (file.filename, page_pdf, "application/pdf")}
         
-        external_url = f"{os.getenv('EXTERNAL_API_BASE_URL')}/extract-text/?page_number={page_number}&language={language}"
-        response = requests.post(
+        external_url = f"{os.getenv('EXTERNAL_API_BASE_URL')}/extract-text/?page_number=1&language={language}"
+        response = await post_upstream(
+            request,
             external_url,
             files=files,
-            headers={"accept": "application/json"},
-            timeout=60
+            headers={"accept": "application/json"}
         )
         response.raise_for_status()
         
@@ -464,12 +536,12 @@ async def extract_text(
             extracted_text = ""
         
         logger.info(f"PDF text extraction completed in {time() - start_time:.2f} seconds")
-        return PDFTextExtractionResponse(page_content=extracted_text.strip())
+        return PDFTextExtractionResponse(page_content=extracted_text.strip(), extraction_method="ocr")
     
-    except requests.Timeout:
+    except httpx.TimeoutException:
         logger.error("External PDF extraction API timed out")
         raise HTTPException(status_code=504, detail="External API timeout")
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"External PDF extraction API error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"External API error: {str(e)}")
     except ValueError as e:
@@ -532,12 +604,12 @@ async def visual_query(
         files = {"file": (file.filename, file_content, file.content_type)}
         data = {"query": query}
         
-        response = requests.post(
+        response = await post_upstream(
+            request,
             external_url,
             files=files,
             data=data,
-            headers={"accept": "application/json"},
-            timeout=60
+            headers={"accept": "application/json"}
         )
         response.raise_for_status()
         
@@ -551,10 +623,10 @@ async def visual_query(
         logger.info(f"Visual query successful: {answer}")
         return VisualQueryResponse(answer=answer)
     
-    except requests.Timeout:
+    except httpx.TimeoutException:
         logger.error("Visual query request timed out")
         raise HTTPException(status_code=504, detail="Visual query service timeout")
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Error during visual query: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Visual query failed: {str(e)}")
     except ValueError as e:
@@ -618,12 +690,12 @@ async def document_query(
         files = {"file": (file.filename, file_content, file.content_type)}
         data = {"query": query}
         
-        response = requests.post(
+        response = await post_upstream(
+            request,
             external_url,
             files=files,
             data=data,
-            headers={"accept": "application/json"},
-            timeout=60
+            headers={"accept": "application/json"}
         )
         response.raise_for_status()
         
@@ -637,10 +709,10 @@ async def document_query(
         logger.info(f"document_query query successful: {answer}")
         return VisualQueryResponse(answer=answer)
     
-    except requests.Timeout:
+    except httpx.TimeoutException:
         logger.error("document_query query request timed out")
         raise HTTPException(status_code=504, detail="document_query query service timeout")
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Error during document_query query: {str(e)}")
         raise HTTPException(status_code=500, detail=f"document_query query failed: {str(e)}")
     except ValueError as e:
@@ -687,14 +759,12 @@ async def speech_to_speech(
         files = {"file": (file.filename, file_content, file.content_type)}
         external_url = f"{os.getenv('EXTERNAL_API_BASE_URL')}/v1/speech_to_speech?language={language}"
 
-        response = requests.post(
+        response = await open_stream(
+            "POST",
             external_url,
             files=files,
-            headers={"accept": "application/json"},
-            stream=True,
-            timeout=60
+            headers={"accept": "application/json"}
         )
-        response.raise_for_status()
 
         headers = {
             "Content-Disposition": f"inline; filename=\"speech.mp3\"",
@@ -702,18 +772,27 @@ async def speech_to_speech(
             "Content-Type": "audio/mp3"
         }
 
+        # Relay upstream chunks asynchronously; the upstream request is closed if the client hangs up
         return StreamingResponse(
-            response.iter_content(chunk_size=8192),
+            relay_stream(request, response),
             media_type="audio/mp3",
             headers=headers
         )
 
-    except requests.Timeout:
+    except httpx.TimeoutException:
         logger.error("External speech-to-speech API timed out")
         raise HTTPException(status_code=504, detail="External API timeout")
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"External speech-to-speech API error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"External API error: {str(e)}")
+
+@app.websocket("/v1/ws/speech_to_speech")
+async def speech_to_speech_ws(
+    websocket: WebSocket,
+    language: str = Query(..., description="Language of the audio (kannada, hindi, tamil)")
+):
+    """Full-duplex speech-to-speech session; see run_speech_to_speech_session for the protocol."""
+    await run_speech_to_speech_session(websocket, language, [lang.value for lang in SupportedLanguage])
     
 from fastapi import FastAPI, File, HTTPException, Request, UploadFile, Form, Query
 from pydantic import BaseModel, Field
@@ -723,12 +802,14 @@ from typing import List
 class DocumentProcessPage(BaseModel):
     page_number: int = Field(..., description="Page number of the extracted text")
     page_text: str = Field(..., description="Extracted text from the page")
+    extraction_method: str = Field("ocr", description="How the text was extracted: text_layer (embedded PDF text) or ocr (vision model)")
 
     class Config:
         schema_extra = {
             "example": {
                 "page_number": 1,
-                "page_text": "Okay, here's the plain text representation of the document..."
+                "page_text": "Okay, here's the plain text representation of the document...",
+                "extraction_method": "ocr"
             }
         }
 
@@ -747,6 +828,54 @@ class DocumentProcessResponse(BaseModel):
             }
         }
 
+async def extract_pages_text(
+    file_name: str,
+    page_pdfs: List[bytes],
+    src_lang: str,
+    tgt_lang: str,
+    prompt: str
+) -> List[tuple]:
+    """Extract the text of each single-page PDF concurrently, returned in page order.
+
+    Returns (page_text, extraction_method) pairs. Pages whose embedded text
+    layer is reliable are read locally; the rest are sent to the upstream one
+    at a time rather than as a single document, so a large PDF is spread
+    across upstream replicas and no single call has to finish the whole
+    document within the timeout.
+    """
+    external_url = f"{os.getenv('EXTERNAL_PDF_API_BASE_URL')}/extract-text-all-pages-batch/"
+    data = {"src_lang": src_lang, "tgt_lang": tgt_lang, "prompt": prompt}
+
+    async def extract(page: tuple) -> tuple:
+        page_number, page_pdf = page
+        text_layer = await usable_text_layer(page_pdf, src_lang)
+        if text_layer:
+            return text_layer, "text_layer"
+        if vision_enabled():
+            return (await vision_extract_text(None, page_pdf, prompt)).strip(), "ocr"
+
+        response = await post_upstream(
+            None,
+            external_url,
+            files={"file": (file_name, page_pdf, "application/pdf")},
+            data=data,
+            headers={"accept": "application/json"}
+        )
+        response.raise_for_status()
+        pages = response.json().get("pages", [])
+        if not pages:
+            logger.warning(f"No text found in external API response for page {page_number}")
+            return "", "ocr"
+        return pages[0].get("page_text", ""), "ocr"
+
+    return await map_concurrently(
+        extract,
+        list(enumerate(page_pdfs, start=1)),
+        concurrency=gateway_config.pdf_page_concurrency,
+        retries=gateway_config.pdf_page_retries,
+        retry_backoff=gateway_config.pdf_page_retry_backoff
+    )
+
 @app.post("/v1/document_process",
           response_model=DocumentProcessResponse,
           summary="Extract Text from All Pages of a PDF",
@@ -795,46 +924,28 @@ async def document_process(
         "client_ip": request.client.host
     })
 
-
-    external_url = f"{os.getenv('EXTERNAL_PDF_API_BASE_URL')}/extract-text-all-pages-batch/"
     start_time = time()
+    page_pdfs = await split_pdf_pages(await file.read())
 
     try:
-        file_content = await file.read()
-        files = {"file": (file.filename, file_content, "application/pdf")}
-        data = {"src_lang": src_lang, "tgt_lang": tgt_lang, "prompt": prompt}
-
-        response = requests.post(
-            external_url,
-            files=files,
-            data=data,
-            headers={"accept": "application/json"},
-            timeout=60
+        extracted_pages = await cancel_on_disconnect(
+            request,
+            extract_pages_text(file.filename, page_pdfs, src_lang, tgt_lang, prompt)
         )
-        response.raise_for_status()
-
-        response_data = response.json()
-        pages = response_data.get("pages", [])
 
-        if not pages:
-            logger.warning("No pages found in external API response")
-            return DocumentProcessResponse(pages=[])
-
-        # Validate and format response
         formatted_pages = [
-            DocumentProcessPage(
-                page_number=page.get("page_number"),
-                page_text=page.get("page_text", "")
-            ) for page in pages
+            DocumentProcessPage(page_number=page_number, page_text=page_text, extraction_method=extraction_method)
+            for page_number, (page_text, extraction_method) in enumerate(extracted_pages, start=1)
         ]
 
-        logger.info(f"Document process completed in {time() - start_time:.2f} seconds, pages extracted: {len(formatted_pages)}")
+        text_layer_pages = sum(1 for page in formatted_pages if page.extraction_method == "text_layer")
+        logger.info(f"Document process completed in {time() - start_time:.2f} seconds, pages extracted: {len(formatted_pages)}, from text layer: {text_layer_pages}")
         return DocumentProcessResponse(pages=formatted_pages)
 
-    except requests.Timeout:
+    except httpx.TimeoutException:
         logger.error("External document process API timed out")
         raise HTTPException(status_code=504, detail="External API timeout")
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"External document process API error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"External API error: {str(e)}")
     except ValueError as e:
@@ -849,12 +960,14 @@ from typing import List
 class DocumentSummaryPage(BaseModel):
     page_number: int = Field(..., description="Page number of the extracted text")
     page_text: str = Field(..., description="Extracted text from the page")
+    extraction_method: str = Field("ocr", description="How the text was extracted: text_layer (embedded PDF text) or ocr (vision model)")
 
     class Config:
         schema_extra = {
             "example": {
                 "page_number": 1,
-                "page_text": "Okay, here's the plain text representation of the document...\n\nDB Online-Ticket\n..."
+                "page_text": "Okay, here's the plain text representation of the document...\n\nDB Online-Ticket\n...",
+                "extraction_method": "ocr"
             }
         }
 
@@ -875,29 +988,22 @@ class DocumentSummaryResponse(BaseModel):
             }
         }
 
-@app.post("/v1/document_summary",
-          response_model=DocumentSummaryResponse,
-          summary="Summarize All Pages of a PDF",
-          description="Summarize the content of all pages of a PDF file using an external API, based on the provided prompt and language codes.",
-          tags=["PDF"],
-          responses={
-              200: {"description": "Extracted text and summary of all pages", "model": DocumentSummaryResponse},
-              400: {"description": "Invalid PDF, prompt, or language codes"},
-              500: {"description": "External API error"},
-              504: {"description": "External API timeout"}
-          })
-async def document_summary(
+async def summarize_document(
     request: Request,
-    file: UploadFile = File(..., description="PDF file to summarize"),
-    src_lang: str = Form(..., description="Source language code (e.g., eng_Latn)"),
-    tgt_lang: str = Form(..., description="Target language code (e.g., eng_Latn)"),
-    prompt: str = Form(..., description="Prompt for summarization (e.g., 'Summarize the document in 3 sentences.')")
-):
+    endpoint: str,
+    file: UploadFile,
+    src_lang: str,
+    tgt_lang: str,
+    prompt: str
+) -> DocumentSummaryResponse:
+    """Extract every page of a PDF concurrently and summarize the text with the prompt."""
     # Validate inputs
     if not prompt.strip():
         raise HTTPException(status_code=400, detail="Prompt cannot be empty")
-    if len(prompt) > 1000:
-        raise HTTPException(status_code=400, detail="Prompt cannot exceed 1000 characters")
+    # Half of each upstream chat prompt is kept for the document text
+    max_prompt_length = min(1000, gateway_config.summary_max_prompt_chars // 2)
+    if len(prompt) > max_prompt_length:
+        raise HTTPException(status_code=400, detail=f"Prompt cannot exceed {max_prompt_length} characters")
 
     # Validate language codes
     supported_languages = [
@@ -915,7 +1021,7 @@ async def document_summary(
         raise HTTPException(status_code=400, detail="File must be a PDF")
 
     logger.info("Processing document summary request", extra={
-        "endpoint": "/v1/document_summary",
+        "endpoint": endpoint,
         "file_name": file.filename,
         "prompt_length": len(prompt),
         "src_lang": src_lang,
@@ -923,52 +1029,65 @@ async def document_summary(
         "client_ip": request.client.host
     })
 
-    external_url = f"{os.getenv('EXTERNAL_PDF_API_BASE_URL')}/summarize-all-pages/"
     start_time = time()
+    page_pdfs = await split_pdf_pages(await file.read())
 
     try:
-        file_content = await file.read()
-        files = {"file": (file.filename, file_content, "application/pdf")}
-        data = {"src_lang": src_lang, "tgt_lang": tgt_lang, "prompt": prompt}
-
-        response = requests.post(
-            external_url,
-            files=files,
-            data=data,
-            headers={"accept": "application/json"},
-            timeout=60
+        # Extract pages concurrently, then summarize them map-reduce style within the model context
+        extracted_pages = await cancel_on_disconnect(
+            request,
+            extract_pages_text(file.filename, page_pdfs, src_lang, tgt_lang, PAGE_EXTRACTION_PROMPT)
         )
-        response.raise_for_status()
-
-        response_data = response.json()
-        pages = response_data.get("pages", [])
-        summary = response_data.get("summary", "")
-
-        if not pages or not summary:
-            logger.warning(f"Incomplete response from external API: pages={len(pages)}, summary={'present' if summary else 'missing'}")
-            return DocumentSummaryResponse(pages=[], summary=summary or "No summary provided by the external API")
-
-        # Validate and format response
+        page_texts = [page_text for page_text, _ in extracted_pages]
         formatted_pages = [
-            DocumentSummaryPage(
-                page_number=page.get("page_number"),
-                page_text=page.get("page_text", "")
-            ) for page in pages
+            DocumentSummaryPage(page_number=page_number, page_text=page_text, extraction_method=extraction_method)
+            for page_number, (page_text, extraction_method) in enumerate(extracted_pages, start=1)
         ]
 
+        if not any(page_text.strip() for page_text in page_texts):
+            logger.warning("No text extracted from any page, skipping summary")
+            return DocumentSummaryResponse(pages=formatted_pages, summary="No text extracted from the document")
+
+        summary = await cancel_on_disconnect(
+            request,
+            summarize_pages_text(page_texts, prompt, src_lang, tgt_lang, f"{os.getenv('EXTERNAL_API_BASE_URL')}/v1/chat")
+        )
+        if not summary:
+            logger.warning("No summary found in external API response")
+            return DocumentSummaryResponse(pages=formatted_pages, summary="No summary provided by the external API")
+
         logger.info(f"Document summary completed in {time() - start_time:.2f} seconds, pages extracted: {len(formatted_pages)}, summary length: {len(summary)}")
         return DocumentSummaryResponse(pages=formatted_pages, summary=summary)
 
-    except requests.Timeout:
+    except httpx.TimeoutException:
         logger.error("External document summary API timed out")
         raise HTTPException(status_code=504, detail="External API timeout")
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"External document summary API error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"External API error: {str(e)}")
     except ValueError as e:
         logger.error(f"Invalid JSON response from external API: {str(e)}")
         raise HTTPException(status_code=500, detail="Invalid response format from external API")
-    
+
+@app.post("/v1/document_summary",
+          response_model=DocumentSummaryResponse,
+          summary="Summarize All Pages of a PDF",
+          description="Summarize the content of all pages of a PDF file using an external API, based on the provided prompt and language codes.",
+          tags=["PDF"],
+          responses={
+              200: {"description": "Extracted text and summary of all pages", "model": DocumentSummaryResponse},
+              400: {"description": "Invalid PDF, prompt, or language codes"},
+              500: {"description": "External API error"},
+              504: {"description": "External API timeout"}
+          })
+async def document_summary(
+    request: Request,
+    file: UploadFile = File(..., description="PDF file to summarize"),
+    src_lang: str = Form(..., description="Source language code (e.g., eng_Latn)"),
+    tgt_lang: str = Form(..., description="Target language code (e.g., eng_Latn)"),
+    prompt: str = Form(..., description="Prompt for summarization (e.g., 'Summarize the document in 3 sentences.')")
+):
+    return await summarize_document(request, "/v1/document_summary", file, src_lang, tgt_lang, prompt)
 
 @app.post("/v1/document_summary_v0",
           response_model=DocumentSummaryResponse,
@@ -988,82 +1107,7 @@ async def document_summary_v0(
     tgt_lang: str = Form(..., description="Target language code (e.g., eng_Latn)"),
     prompt: str = Form(..., description="Prompt for summarization (e.g., 'Summarize the document in 3 sentences.')")
 ):
-    # Validate inputs
-    if not prompt.strip():
-        raise HTTPException(status_code=400, detail="Prompt cannot be empty")
-    if len(prompt) > 1000:
-        raise HTTPException(status_code=400, detail="Prompt cannot exceed 1000 characters")
-
-    # Validate language codes
-    supported_languages = [
-        "eng_Latn", "hin_Deva", "kan_Knda", "tam_Taml", "mal_Mlym", "tel_Telu",
-        "deu_Latn", "fra_Latn", "nld_Latn", "spa_Latn", "ita_Latn", "por_Latn",
-        "rus_Cyrl", "pol_Latn"
-    ]
-    if src_lang not in supported_languages:
-        raise HTTPException(status_code=400, detail=f"Unsupported source language: {src_lang}. Must be one of {supported_languages}")
-    if tgt_lang not in supported_languages:
-        raise HTTPException(status_code=400, detail=f"Unsupported target language: {tgt_lang}. Must be one of {supported_languages}")
-
-    # Validate file
-    if not file.filename.lower().endswith('.pdf'):
-        raise HTTPException(status_code=400, detail="File must be a PDF")
-
-    logger.info("Processing document summary request", extra={
-        "endpoint": "/v1/document_summary_v0",
-        "file_name": file.filename,
-        "prompt_length": len(prompt),
-        "src_lang": src_lang,
-        "tgt_lang": tgt_lang,
-        "client_ip": request.client.host
-    })
-
-    external_url = f"{os.getenv('EXTERNAL_PDF_API_BASE_URL')}/summarize-all-pages_v0/"
-    start_time = time()
-
-    try:
-        file_content = await file.read()
-        files = {"file": (file.filename, file_content, "application/pdf")}
-        data = {"src_lang": src_lang, "tgt_lang": tgt_lang, "prompt": prompt}
-
-        response = requests.post(
-            external_url,
-            files=files,
-            data=data,
-            headers={"accept": "application/json"},
-            timeout=60
-        )
-        response.raise_for_status()
-
-        response_data = response.json()
-        pages = response_data.get("pages", [])
-        summary = response_data.get("summary", "")
-
-        if not pages or not summary:
-            logger.warning(f"Incomplete response from external API: pages={len(pages)}, summary={'present' if summary else 'missing'}")
-            return DocumentSummaryResponse(pages=[], summary=summary or "No summary provided by the external API")
-
-        # Validate and format response
-        formatted_pages = [
-            DocumentSummaryPage(
-                page_number=page.get("page_number"),
-                page_text=page.get("page_text", "")
-            ) for page in pages
-        ]
-
-        logger.info(f"Document summary completed in {time() - start_time:.2f} seconds, pages extracted: {len(formatted_pages)}, summary length: {len(summary)}")
-        return DocumentSummaryResponse(pages=formatted_pages, summary=summary)
-
-    except requests.Timeout:
-        logger.error("External document summary API timed out")
-        raise HTTPException(status_code=504, detail="External API timeout")
-    except requests.RequestException as e:
-        logger.error(f"External document summary API error: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"External API error: {str(e)}")
-    except ValueError as e:
-        logger.error(f"Invalid JSON response from external API: {str(e)}")
-        raise HTTPException(status_code=500, detail="Invalid response format from external API")
-    
+    return await summarize_document(request, "/v1/document_summary_v0", file, src_lang, tgt_lang, prompt)
 
 
 if __name__ == "__main__":
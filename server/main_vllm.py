@@ -1,18 +1,39 @@
 import argparse
+import hashlib
+import re
+import asyncio
+import json
 import os
+from pathlib import Path
 from typing import List
 from abc import ABC, abstractmethod
 import uvicorn
-from fastapi import FastAPI, File, HTTPException, Query, Request, UploadFile, Form, Depends
+from fastapi import FastAPI, File, HTTPException, Query, Request, UploadFile, Form, Depends, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse, StreamingResponse
 from pydantic import BaseModel, Field
-import requests
+import httpx
 from time import time
-from typing import Optional
+from typing import Optional, Union
 # Assuming these are in your project structure
 from config.tts_config import SPEED, ResponseFormat, config as tts_config
 from config.logging_config import logger
+from config.gateway_config import config as gateway_config
+from utils.archive import ZipStreamWriter, zip_entries
+from utils.fanout import iterate_as_completed, iterate_concurrently, map_concurrently
+from utils.file_response import ranged_file_response
+from utils.output_cache import output_cache
+from utils.raster import resize_image, shutdown_pool
+from utils.jobs import TERMINAL_STATUSES, job_manager
+from utils.pdf import PdfStreamWriter, resolve_page_selection, selected_page_pdfs, single_page_pdf, split_pdf_pages
+from utils.metrics import metrics_snapshot
+from utils.retrieval import BM25Index, page_indexes
+from utils.speech_session import run_speech_to_speech_session
+from utils.summarize import SECTION_SUMMARY_PROMPT, summarize_pages_text
+from utils.text_layer import usable_text_layer
+from utils.translation import translate_sentences
+from utils.vision import vision_enabled, vision_extract_text
+from utils.upstream import cancel_on_disconnect, close_client, get_client, open_stream, post_upstream, relay_stream
 
 # FastAPI app setup with enhanced docs
 app = FastAPI(
@@ -115,24 +136,23 @@ class VisualQueryResponse(BaseModel):
 # TTS Service Interface
 class TTSService(ABC):
     @abstractmethod
-    async def generate_speech(self, payload: dict) -> requests.Response:
+    async def generate_speech(self, payload: dict) -> httpx.Response:
         pass
 
 class ExternalTTSService(TTSService):
-    async def generate_speech(self, payload: dict) -> requests.Response:
+    async def generate_speech(self, payload: dict) -> httpx.Response:
         try:
             base_url = f"{os.getenv('EXTERNAL_API_BASE_URL')}/v1/audio/speech"
-            return requests.post(
+            return await open_stream(
+                "POST",
                 base_url,
                 json=payload,
-                headers={"accept": "*/*", "Content-Type": "application/json"},
-                stream=True,
-                timeout=60
+                headers={"accept": "*/*", "Content-Type": "application/json"}
             )
-        except requests.Timeout:
+        except httpx.TimeoutException:
             logger.error("External TTS API timeout")
             raise HTTPException(status_code=504, detail="External TTS API timeout")
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"External TTS API error: {str(e)}")
             raise HTTPException(status_code=502, detail=f"External TTS service error: {str(e)}")
 
@@ -148,6 +168,14 @@ def get_tts_service() -> TTSService:
 async def health_check():
     return {"status": "healthy", "model": "llm_model_name"}  # Placeholder model name
 
+@app.get("/v1/metrics",
+         summary="Gateway Metrics",
+         description="Returns gateway counters, including upstream calls cancelled because the client disconnected.",
+         tags=["Utility"],
+         response_model=dict)
+async def get_metrics():
+    return metrics_snapshot()
+
 @app.get("/",
          summary="Redirect to Docs",
          description="Redirects to the Swagger UI documentation.",
@@ -155,6 +183,50 @@ async def health_check():
 async def home():
     return RedirectResponse(url="/docs")
 
+@app.on_event("startup")
+async def start_job_workers():
+    await job_manager.start()
+
+@app.on_event("shutdown")
+async def stop_job_workers():
+    await job_manager.stop()
+
+@app.on_event("shutdown")
+async def shutdown_upstream_client():
+    await close_client()
+
+@app.on_event("shutdown")
+async def stop_raster_pool():
+    shutdown_pool()
+
+OUTPUT_MEDIA_TYPES = {".pdf": "application/pdf", ".mp3": "audio/mp3"}
+
+@app.get("/v1/outputs/{name}",
+         summary="Download a Generated Output",
+         description="Download a cached generated file (speech MP3 or PDF) by the name returned in the Content-Location header. Supports Range, If-Range and If-None-Match for resumed downloads.",
+         tags=["Utility"],
+         responses={
+             200: {"description": "Generated file"},
+             206: {"description": "Requested byte range of the generated file"},
+             304: {"description": "Client copy is current"},
+             404: {"description": "Output not found or expired"},
+             416: {"description": "Requested range not satisfiable"}
+         })
+async def get_output(request: Request, name: str):
+    key, suffix = os.path.splitext(name)
+    if suffix not in OUTPUT_MEDIA_TYPES or not re.fullmatch(r"[0-9a-f]{64}", key):
+        raise HTTPException(status_code=404, detail="Output not found")
+    response = output_cache.file_response(
+        request,
+        key,
+        suffix,
+        OUTPUT_MEDIA_TYPES[suffix],
+        headers={"Content-Disposition": f"attachment; filename=\"{name}\""}
+    )
+    if response is None:
+        raise HTTPException(status_code=404, detail="Output not found")
+    return response
+
 from fastapi.responses import FileResponse
 from fastapi.background import BackgroundTasks
 import tempfile
@@ -190,51 +262,176 @@ async def generate_audio(
     
     payload = {"text": input}
     
+    headers = {
+        "Content-Disposition": "attachment; filename=\"speech.mp3\"",
+        "Cache-Control": "no-cache",
+    }
+    
+    # Cached clips are served with Range/ETag support so clients can resume or seek
+    cache_key = output_cache.key_for("audio/speech", input)
+    cached_response = output_cache.file_response(
+        request, cache_key, ".mp3", "audio/mp3",
+        headers={**headers, "Content-Location": f"/v1/outputs/{cache_key}.mp3"}
+    )
+    if cached_response is not None:
+        logger.info(f"Serving cached speech: {cache_key}")
+        return cached_response
+    
+    response = await tts_service.generate_speech(payload)
+    
+    if output_cache.enabled:
+        try:
+            cached_path = await output_cache.store(response.aiter_bytes(8192), cache_key, ".mp3")
+        except httpx.HTTPError as e:
+            logger.error(f"External TTS request failed: {str(e)}")
+            raise HTTPException(status_code=502, detail=f"External TTS service error: {str(e)}")
+        finally:
+            await response.aclose()
+        headers["Content-Location"] = f"/v1/outputs/{cache_key}.mp3"
+        return ranged_file_response(request, cached_path, "audio/mp3", etag=cache_key, headers=headers)
+    
     # Create a temporary file to store the audio
     temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".mp3")
     temp_file_path = temp_file.name
     
+    # Schedule file cleanup as a background task
+    def cleanup_file(file_path: str):
+        try:
+            if os.path.exists(file_path):
+                os.unlink(file_path)
+                logger.info(f"Deleted temporary file: {file_path}")
+        except Exception as e:
+            logger.error(f"Failed to delete temporary file {file_path}: {str(e)}")
+    
     try:
-        response = await tts_service.generate_speech(payload)
-        response.raise_for_status()
-        
         # Write audio content to the temporary file
-        with open(temp_file_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
-        
-        # Prepare headers for the response
-        headers = {
-            "Content-Disposition": "attachment; filename=\"speech.mp3\"",
-            "Cache-Control": "no-cache",
-        }
-        
-        # Schedule file cleanup as a background task
-        def cleanup_file(file_path: str):
-            try:
-                if os.path.exists(file_path):
-                    os.unlink(file_path)
-                    logger.info(f"Deleted temporary file: {file_path}")
-            except Exception as e:
-                logger.error(f"Failed to delete temporary file {file_path}: {str(e)}")
-        
-        background_tasks.add_task(cleanup_file, temp_file_path)
-        
-        # Return the file as a FileResponse
-        return FileResponse(
-            path=temp_file_path,
-            filename="speech.mp3",
-            media_type="audio/mp3",
-            headers=headers
-        )
-    
-    except requests.HTTPError as e:
+        async for chunk in response.aiter_bytes(8192):
+            if chunk:
+                temp_file.write(chunk)
+    except httpx.HTTPError as e:
         logger.error(f"External TTS request failed: {str(e)}")
+        temp_file.close()
+        cleanup_file(temp_file_path)
         raise HTTPException(status_code=502, detail=f"External TTS service error: {str(e)}")
     finally:
         # Close the temporary file to ensure it's fully written
         temp_file.close()
+        await response.aclose()
+    
+    background_tasks.add_task(cleanup_file, temp_file_path)
+    
+    return ranged_file_response(request, temp_file_path, "audio/mp3", headers=headers)
+
+class BatchSpeechRequest(BaseModel):
+    inputs: List[str] = Field(..., description="Texts to convert to speech (max 1000 characters each)")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "inputs": [
+                    "ನಮಸ್ಕಾರ, ಡ್ವಾನಿ ಸೇವೆಗೆ ಸ್ವಾಗತ",
+                    "ಕನ್ನಡಕ್ಕಾಗಿ ಒಂದನ್ನು ಒತ್ತಿ"
+                ]
+            }
+        }
+
+@app.post("/v1/audio/speech/batch",
+          summary="Generate Speech for Many Texts",
+          description="Convert a list of texts to speech concurrently and stream the clips back as a zip archive. "
+                      "Each clip (NNN.mp3, numbered by input position) is added as soon as it is ready; "
+                      "a closing manifest.json lists every input with its file name or error.",
+          tags=["Audio"],
+          responses={
+              200: {"description": "Zip archive of audio clips", "content": {"application/zip": {"example": "Binary zip data"}}},
+              400: {"description": "No inputs, or too many inputs"}
+          })
+async def generate_audio_batch(
+    request: Request,
+    batch_request: BatchSpeechRequest,
+    tts_service: TTSService = Depends(get_tts_service)
+):
+    inputs = batch_request.inputs
+    if not inputs:
+        raise HTTPException(status_code=400, detail="Inputs cannot be empty")
+    if len(inputs) > gateway_config.batch_max_items:
+        raise HTTPException(status_code=400, detail=f"At most {gateway_config.batch_max_items} inputs can be processed per request")
+
+    logger.info("Processing batch speech request", extra={
+        "endpoint": "/v1/audio/speech/batch",
+        "inputs": len(inputs),
+        "client_ip": request.client.host
+    })
+    start_time = time()
+
+    manifest = [{"index": index, "input": text, "file_name": None, "error": None} for index, text in enumerate(inputs)]
+    for entry in manifest:
+        if not entry["input"].strip():
+            entry["error"] = "Input cannot be empty"
+        elif len(entry["input"]) > 1000:
+            entry["error"] = "Input cannot exceed 1000 characters"
+
+    # Repeated texts are synthesized once and written under each of their positions
+    positions = {}
+    for entry in manifest:
+        if entry["error"] is None:
+            positions.setdefault(entry["input"], []).append(entry["index"])
+    texts = list(positions)
+
+    async def synthesize(text: str) -> bytes:
+        cache_key = output_cache.key_for("audio/speech", text)
+        cached_path = output_cache.get(cache_key, ".mp3")
+        if cached_path:
+            try:
+                return await asyncio.to_thread(Path(cached_path).read_bytes)
+            except FileNotFoundError:
+                pass  # Pruned since the lookup, synthesize it again
+
+        response = await tts_service.generate_speech({"text": text})
+        try:
+            chunks = response.aiter_bytes(gateway_config.stream_chunk_size)
+            if output_cache.enabled:
+                chunks = output_cache.tee(chunks, cache_key, ".mp3")
+            return b"".join([chunk async for chunk in chunks])
+        finally:
+            await response.aclose()
+
+    clips = iterate_as_completed(
+        synthesize,
+        texts,
+        concurrency=gateway_config.batch_concurrency,
+        retries=gateway_config.batch_retries,
+        retry_backoff=gateway_config.batch_retry_backoff
+    )
+
+    async def stream_archive():
+        archive = ZipStreamWriter()
+        try:
+            async for text_index, outcome in clips:
+                for index in positions[texts[text_index]]:
+                    entry = manifest[index]
+                    if isinstance(outcome, HTTPException):
+                        entry["error"] = outcome.detail
+                    elif isinstance(outcome, Exception):
+                        entry["error"] = f"External TTS service error: {str(outcome) or type(outcome).__name__}"
+                    else:
+                        entry["file_name"] = f"{index:03d}.mp3"
+                        yield archive.add(entry["file_name"], outcome)
+                    if entry["error"]:
+                        logger.error(f"Batch speech input {index} failed: {entry['error']}")
+            yield archive.add("manifest.json", json.dumps(manifest, ensure_ascii=False, indent=2).encode())
+            yield archive.close()
+            logger.info(f"Batch speech completed in {time() - start_time:.2f} seconds, inputs: {len(inputs)}, synthesized: {len(texts)}")
+        finally:
+            await clips.aclose()
+
+    return StreamingResponse(
+        stream_archive(),
+        media_type="application/zip",
+        headers={
+            "Content-Disposition": "attachment; filename=\"speech.zip\"",
+            "Cache-Control": "no-cache",
+        }
+    )
 
 @app.post("/v1/indic_chat", 
           response_model=ChatResponse,
@@ -250,10 +447,9 @@ async def chat(
     request: Request,
     chat_request: ChatRequest
 ):
-    if not chat_request.prompt:
-        raise HTTPException(status_code=400, detail="Prompt cannot be empty")
-    if len(chat_request.prompt) > 1000:
-        raise HTTPException(status_code=400, detail="Prompt cannot exceed 1000 characters")
+    prompt_error = chat_prompt_error(chat_request)
+    if prompt_error:
+        raise HTTPException(status_code=400, detail=prompt_error)
     
     logger.info(f"Received prompt: {chat_request.prompt}, src_lang: {chat_request.src_lang}")
     
@@ -265,14 +461,14 @@ async def chat(
             "tgt_lang": chat_request.tgt_lang
         }
         
-        response = requests.post(
+        response = await post_upstream(
+            request,
             external_url,
             json=payload,
             headers={
                 "accept": "application/json",
                 "Content-Type": "application/json"
-            },
-            timeout=60
+            }
         )
         response.raise_for_status()
         
@@ -281,16 +477,123 @@ async def chat(
         logger.info(f"Generated Chat response from external API: {response_text}")
         return ChatResponse(response=response_text)
     
-    except requests.Timeout:
+    except httpx.TimeoutException:
         logger.error("External chat API request timed out")
         raise HTTPException(status_code=504, detail="Chat service timeout")
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Error calling external chat API: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Chat failed: {str(e)}")
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error processing request: {str(e)}")
         raise HTTPException(status_code=500, detail=f"An error occurred: {str(e)}")
 
+def chat_prompt_error(chat_request: ChatRequest) -> Optional[str]:
+    if not chat_request.prompt:
+        return "Prompt cannot be empty"
+    if len(chat_request.prompt) > 1000:
+        return "Prompt cannot exceed 1000 characters"
+    return None
+
+class BatchChatRequest(BaseModel):
+    items: List[ChatRequest] = Field(..., description="Prompts to answer, each with its language codes")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "items": [
+                    {"prompt": "ಕರ್ನಾಟಕದ ರಾಜಧಾನಿ ಯಾವುದು?", "src_lang": "kan_Knda", "tgt_lang": "kan_Knda"},
+                    {"prompt": "What is the capital of Karnataka?", "src_lang": "eng_Latn", "tgt_lang": "kan_Knda"}
+                ]
+            }
+        }
+
+class BatchChatItem(BaseModel):
+    index: int = Field(..., description="Position of the item in the request")
+    response: Optional[str] = Field(None, description="Generated chat response, if successful")
+    error: Optional[str] = Field(None, description="Error message if this item failed")
+
+class BatchChatResponse(BaseModel):
+    results: List[BatchChatItem] = Field(..., description="Per-item results, in request order")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "results": [
+                    {"index": 0, "response": "ಬೆಂಗಳೂರು", "error": None},
+                    {"index": 1, "response": None, "error": "Chat service timeout"}
+                ]
+            }
+        }
+
+@app.post("/v1/indic_chat/batch",
+          response_model=BatchChatResponse,
+          summary="Chat with AI for Many Prompts",
+          description="Generate chat responses for a list of prompts concurrently. Results are returned in request order; "
+                      "an item that fails carries an error instead of failing the whole batch.",
+          tags=["Chat"],
+          responses={
+              200: {"description": "Per-item chat responses or errors", "model": BatchChatResponse},
+              400: {"description": "No items, or too many items"}
+          })
+async def chat_batch(
+    request: Request,
+    batch_request: BatchChatRequest
+):
+    if not batch_request.items:
+        raise HTTPException(status_code=400, detail="Items cannot be empty")
+    if len(batch_request.items) > gateway_config.batch_max_items:
+        raise HTTPException(status_code=400, detail=f"At most {gateway_config.batch_max_items} items can be processed per request")
+
+    logger.info(f"Received batch chat request: {len(batch_request.items)} items")
+    start_time = time()
+
+    results = [
+        BatchChatItem(index=index, error=chat_prompt_error(item))
+        for index, item in enumerate(batch_request.items)
+    ]
+    valid = [(result.index, item) for result, item in zip(results, batch_request.items) if result.error is None]
+
+    async def chat_item(indexed_item: tuple) -> str:
+        _, item = indexed_item
+        response = await post_upstream(
+            None,
+            f"{os.getenv('EXTERNAL_API_BASE_URL')}/v1/indic_chat",
+            json={"prompt": item.prompt, "src_lang": item.src_lang, "tgt_lang": item.tgt_lang},
+            headers={
+                "accept": "application/json",
+                "Content-Type": "application/json"
+            }
+        )
+        response.raise_for_status()
+        return response.json().get("response", "")
+
+    outcomes = await cancel_on_disconnect(request, map_concurrently(
+        chat_item,
+        valid,
+        concurrency=gateway_config.batch_concurrency,
+        retries=gateway_config.batch_retries,
+        retry_backoff=gateway_config.batch_retry_backoff,
+        return_exceptions=True
+    ))
+    for (index, _), outcome in zip(valid, outcomes):
+        if isinstance(outcome, httpx.TimeoutException):
+            results[index].error = "Chat service timeout"
+        elif isinstance(outcome, httpx.HTTPError):
+            results[index].error = f"Chat failed: {str(outcome)}"
+        elif isinstance(outcome, ValueError):
+            results[index].error = "Invalid response format from external API"
+        elif isinstance(outcome, Exception):
+            results[index].error = f"An error occurred: {str(outcome) or type(outcome).__name__}"
+        else:
+            results[index].response = outcome
+        if results[index].error:
+            logger.error(f"Batch chat item {index} failed: {results[index].error}")
+
+    logger.info(f"Batch chat completed in {time() - start_time:.2f} seconds, items: {len(results)}, failed: {sum(1 for result in results if result.error)}")
+    return BatchChatResponse(results=results)
+
 @app.post("/v1/transcribe/", 
           response_model=TranscriptionResponse,
           summary="Transcribe Audio File",
@@ -302,6 +605,7 @@ async def chat(
               504: {"description": "Transcription service timeout"}
           })
 async def transcribe_audio(
+    request: Request,
     file: UploadFile = File(..., description="Audio file to transcribe"),
     language: str = Query(..., description="Language of the audio (kannada, hindi, tamil)")
 ):
@@ -316,11 +620,11 @@ async def transcribe_audio(
         files = {"file": (file.filename, file_content, file.content_type)}
         
         external_url = f"{os.getenv('EXTERNAL_API_BASE_URL')}/v1/transcribe/?language={language}"
-        response = requests.post(
+        response = await post_upstream(
+            request,
             external_url,
             files=files,
-            headers={"accept": "application/json"},
-            timeout=60
+            headers={"accept": "application/json"}
         )
         response.raise_for_status()
         
@@ -328,13 +632,136 @@ async def transcribe_audio(
         logger.info(f"Transcription completed in {time() - start_time:.2f} seconds")
         return TranscriptionResponse(text=transcription)
     
-    except requests.Timeout:
+    except httpx.TimeoutException:
         logger.error("Transcription service timed out")
         raise HTTPException(status_code=504, detail="Transcription service timeout")
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Transcription request failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Transcription failed: {str(e)}")
 
+async def post_transcription(file_name: str, content: bytes, content_type: Optional[str], language: str) -> str:
+    external_url = f"{os.getenv('EXTERNAL_API_BASE_URL')}/v1/transcribe/?language={language}"
+    response = await get_client().post(
+        external_url,
+        files={"file": (file_name, content, content_type)},
+        headers={"accept": "application/json"}
+    )
+    response.raise_for_status()
+    return response.json().get("text", "")
+
+class BatchTranscriptionItem(BaseModel):
+    index: int = Field(..., description="Position of the file in the request (or archive)")
+    file_name: str = Field(..., description="Name of the audio file")
+    language: str = Field(..., description="Language the file was transcribed in")
+    text: Optional[str] = Field(None, description="Transcribed text, if successful")
+    error: Optional[str] = Field(None, description="Error message if this file failed")
+
+class BatchTranscriptionResponse(BaseModel):
+    results: List[BatchTranscriptionItem] = Field(..., description="Per-file results, in request order")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "results": [
+                    {"index": 0, "file_name": "call1.wav", "language": "kannada", "text": "ನಮಸ್ಕಾರ", "error": None},
+                    {"index": 1, "file_name": "call2.wav", "language": "hindi", "text": None, "error": "Transcription service timeout"}
+                ]
+            }
+        }
+
+@app.post("/v1/transcribe/batch",
+          response_model=BatchTranscriptionResponse,
+          summary="Transcribe Many Audio Files",
+          description="Transcribe several audio files, or the files in a zip archive, concurrently. "
+                      "Results are returned in request order, or streamed as NDJSON lines as each file completes.",
+          tags=["Audio"],
+          responses={
+              200: {"description": "Per-file transcription results (JSON, or NDJSON when streaming); a failed file carries an error instead of text",
+                    "content": {"application/x-ndjson": {}}},
+              400: {"description": "No files, too many files, invalid archive or invalid language"}
+          })
+async def transcribe_batch(
+    request: Request,
+    files: Optional[List[UploadFile]] = File(None, description="Audio files to transcribe"),
+    archive: Optional[UploadFile] = File(None, description="Zip archive of audio files to transcribe"),
+    language: str = Form("kannada", description="Language of the audio (kannada, hindi, tamil)"),
+    languages: Optional[str] = Form(None, description="JSON object mapping file names to languages, overriding language per file"),
+    stream: bool = Form(False, description="Stream NDJSON results as each file completes instead of returning them together")
+):
+    allowed_languages = ["kannada", "hindi", "tamil"]
+    try:
+        file_languages = json.loads(languages) if languages else {}
+    except ValueError:
+        raise HTTPException(status_code=400, detail="languages must be a JSON object mapping file names to languages")
+    if not isinstance(file_languages, dict):
+        raise HTTPException(status_code=400, detail="languages must be a JSON object mapping file names to languages")
+
+    uploads = [(upload.filename, await upload.read(), upload.content_type) for upload in files or []]
+    if archive is not None:
+        entries = await zip_entries(
+            await archive.read(), gateway_config.batch_max_items, gateway_config.batch_max_archive_mb * 1024 * 1024
+        )
+        uploads.extend((name, content, None) for name, content in entries)
+    if not uploads:
+        raise HTTPException(status_code=400, detail="Provide audio files or a zip archive")
+    if len(uploads) > gateway_config.batch_max_items:
+        raise HTTPException(status_code=400, detail=f"At most {gateway_config.batch_max_items} files can be transcribed per request")
+
+    items = [(file_name, content, content_type, file_languages.get(file_name, language)) for file_name, content, content_type in uploads]
+    invalid = sorted({item[3] for item in items if item[3] not in allowed_languages})
+    if invalid:
+        raise HTTPException(status_code=400, detail=f"Unsupported languages {invalid}, must be one of {allowed_languages}")
+
+    logger.info(f"Received batch transcription request: {len(items)} files, stream: {stream}")
+    start_time = time()
+
+    async def transcribe_item(item: tuple) -> str:
+        file_name, content, content_type, file_language = item
+        return await post_transcription(file_name, content, content_type, file_language)
+
+    def item_result(index: int, outcome) -> BatchTranscriptionItem:
+        file_name, _, _, file_language = items[index]
+        if isinstance(outcome, httpx.TimeoutException):
+            error = "Transcription service timeout"
+        elif isinstance(outcome, Exception):
+            error = f"Transcription failed: {str(outcome) or type(outcome).__name__}"
+        else:
+            return BatchTranscriptionItem(index=index, file_name=file_name, language=file_language, text=outcome)
+        logger.error(f"Batch transcription of {file_name} failed: {error}")
+        return BatchTranscriptionItem(index=index, file_name=file_name, language=file_language, error=error)
+
+    outcomes = iterate_as_completed(
+        transcribe_item,
+        items,
+        concurrency=gateway_config.batch_concurrency,
+        retries=gateway_config.batch_retries,
+        retry_backoff=gateway_config.batch_retry_backoff
+    )
+
+    if stream:
+        async def stream_results():
+            try:
+                async for index, outcome in outcomes:
+                    yield json.dumps(item_result(index, outcome).model_dump(), ensure_ascii=False) + "\n"
+                logger.info(f"Batch transcription completed in {time() - start_time:.2f} seconds, files: {len(items)}")
+            finally:
+                await outcomes.aclose()
+
+        return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+    async def collect_results() -> List[BatchTranscriptionItem]:
+        results = [None] * len(items)
+        async for index, outcome in outcomes:
+            results[index] = item_result(index, outcome)
+        return results
+
+    try:
+        results = await cancel_on_disconnect(request, collect_results())
+    finally:
+        await outcomes.aclose()
+    logger.info(f"Batch transcription completed in {time() - start_time:.2f} seconds, files: {len(items)}")
+    return BatchTranscriptionResponse(results=results)
+
 @app.post("/v1/translate", 
           response_model=TranslationResponse,
           summary="Translate Text",
@@ -347,10 +774,11 @@ async def transcribe_audio(
               504: {"description": "Translation service timeout"}
           })
 async def translate(
-    request: TranslationRequest
+    request: Request,
+    translation_request: TranslationRequest
 ):
     # Validate inputs
-    if not request.sentences:
+    if not translation_request.sentences:
         raise HTTPException(status_code=400, detail="Sentences cannot be empty")
     
     # Validate language codes
@@ -359,45 +787,26 @@ async def translate(
         "deu_Latn", "fra_Latn", "nld_Latn", "spa_Latn", "ita_Latn", "por_Latn",
         "rus_Cyrl", "pol_Latn"
     ]
-    if request.src_lang not in supported_languages or request.tgt_lang not in supported_languages:
-        raise HTTPException(status_code=400, detail=f"Unsupported language codes: src={request.src_lang}, tgt={request.tgt_lang}")
-
-    logger.info(f"Received translation request: {len(request.sentences)} sentences, src_lang: {request.src_lang}, tgt_lang: {request.tgt_lang}")
+    if translation_request.src_lang not in supported_languages or translation_request.tgt_lang not in supported_languages:
+        raise HTTPException(status_code=400, detail=f"Unsupported language codes: src={translation_request.src_lang}, tgt={translation_request.tgt_lang}")
 
-    external_url = f"{os.getenv('EXTERNAL_API_BASE_URL')}/v1/translate"
-
-    payload = {
-        "sentences": request.sentences,
-        "src_lang": request.src_lang,
-        "tgt_lang": request.tgt_lang
-    }
+    logger.info(f"Received translation request: {len(translation_request.sentences)} sentences, src_lang: {translation_request.src_lang}, tgt_lang: {translation_request.tgt_lang}")
 
     try:
-        response = requests.post(
-            external_url,
-            json=payload,
-            headers={
-                "accept": "application/json",
-                "Content-Type": "application/json"
-            },
-            timeout=60
-        )
-        response.raise_for_status()
-
-        response_data = response.json()
-        translations = response_data.get("translations", [])
-
-        if not translations or len(translations) != len(request.sentences):
-            logger.warning(f"Unexpected response format: {response_data}")
-            raise HTTPException(status_code=500, detail="Invalid response from translation service")
+        # Sentences are split and batched with concurrent requests for the same language pair
+        translations = await cancel_on_disconnect(request, translate_sentences(
+            translation_request.sentences,
+            translation_request.src_lang,
+            translation_request.tgt_lang
+        ))
 
         logger.info(f"Translation successful: {translations}")
         return TranslationResponse(translations=translations)
 
-    except requests.Timeout:
+    except httpx.TimeoutException:
         logger.error("Translation request timed out")
         raise HTTPException(status_code=504, detail="Translation service timeout")
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Error during translation: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Translation failed: {str(e)}")
     except ValueError as e:
@@ -460,12 +869,12 @@ async def visual_query(
         files = {"file": (file.filename, file_content, file.content_type)}
         data = {"query": query}
         
-        response = requests.post(
+        response = await post_upstream(
+            request,
             external_url,
             files=files,
             data=data,
-            headers={"accept": "application/json"},
-            timeout=60
+            headers={"accept": "application/json"}
         )
         response.raise_for_status()
         
@@ -479,16 +888,158 @@ async def visual_query(
         logger.info(f"Visual query successful: {answer}")
         return VisualQueryResponse(answer=answer)
     
-    except requests.Timeout:
+    except httpx.TimeoutException:
         logger.error("Visual query request timed out")
         raise HTTPException(status_code=504, detail="Visual query service timeout")
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"Error during visual query: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Visual query failed: {str(e)}")
     except ValueError as e:
         logger.error(f"Invalid JSON response: {str(e)}")
         raise HTTPException(status_code=500, detail="Invalid response format from visual query service")
 
+async def post_visual_query(file_name: str, image: bytes, mime_type: str, query: str, src_lang: str, tgt_lang: str) -> str:
+    external_url = f"{os.getenv('EXTERNAL_API_BASE_URL')}/v1/indic_visual_query/?src_lang={src_lang}&tgt_lang={tgt_lang}"
+    response = await post_upstream(
+        None,
+        external_url,
+        files={"file": (file_name, image, mime_type)},
+        data={"query": query},
+        headers={"accept": "application/json"}
+    )
+    response.raise_for_status()
+    answer = response.json().get("answer", "")
+    if not answer:
+        raise ValueError("No answer provided by visual query service")
+    return answer
+
+class BatchVisualQueryItem(BaseModel):
+    index: int = Field(..., description="Position of the image in the request (or archive)")
+    file_name: str = Field(..., description="Name of the image file")
+    query: str = Field(..., description="Query asked of this image")
+    answer: Optional[str] = Field(None, description="Answer for this image, if successful")
+    error: Optional[str] = Field(None, description="Error message if this image failed")
+
+class BatchVisualQueryResponse(BaseModel):
+    results: List[BatchVisualQueryItem] = Field(..., description="Per-image results, in request order")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "results": [
+                    {"index": 0, "file_name": "pump1.jpg", "query": "Is there visible corrosion?", "answer": "Yes, around the outlet flange.", "error": None},
+                    {"index": 1, "file_name": "pump2.jpg", "query": "Is there visible corrosion?", "answer": None, "error": "Visual query service timeout"}
+                ]
+            }
+        }
+
+@app.post("/v1/indic_visual_query/batch",
+          response_model=BatchVisualQueryResponse,
+          summary="Visual Query over Many Images",
+          description="Ask one query of many images, or a query per image, concurrently. Images are downsized in the gateway before "
+                      "they are sent. Results are streamed as NDJSON lines as each image completes, or returned together in request order.",
+          tags=["Chat"],
+          responses={
+              200: {"description": "Per-image answers (NDJSON when streaming, JSON otherwise); a failed image carries an error instead of an answer",
+                    "content": {"application/x-ndjson": {}}},
+              400: {"description": "No images, too many images, invalid archive, missing or invalid queries, or invalid language codes"}
+          })
+async def visual_query_batch(
+    request: Request,
+    files: Optional[List[UploadFile]] = File(None, description="Image files to analyze (e.g., PNG, JPEG)"),
+    archive: Optional[UploadFile] = File(None, description="Zip archive of images to analyze"),
+    query: Optional[str] = Form(None, description="Text query asked of every image"),
+    queries: Optional[str] = Form(None, description="JSON object mapping file names to queries, overriding query per image"),
+    stream: bool = Form(True, description="Stream NDJSON results as each image completes instead of returning them together"),
+    src_lang: str = Query(..., description="Source language code (e.g., kan_Knda, en)"),
+    tgt_lang: str = Query(..., description="Target language code (e.g., kan_Knda, en)")
+):
+    supported_languages = ["kan_Knda", "hin_Deva", "tam_Taml", "eng_Latn"]
+    if src_lang not in supported_languages:
+        raise HTTPException(status_code=400, detail=f"Unsupported source language: {src_lang}. Must be one of {supported_languages}")
+    if tgt_lang not in supported_languages:
+        raise HTTPException(status_code=400, detail=f"Unsupported target language: {tgt_lang}. Must be one of {supported_languages}")
+
+    try:
+        image_queries = json.loads(queries) if queries else {}
+    except ValueError:
+        raise HTTPException(status_code=400, detail="queries must be a JSON object mapping file names to queries")
+    if not isinstance(image_queries, dict):
+        raise HTTPException(status_code=400, detail="queries must be a JSON object mapping file names to queries")
+
+    uploads = [(upload.filename, await upload.read()) for upload in files or []]
+    if archive is not None:
+        uploads.extend(await zip_entries(
+            await archive.read(), gateway_config.batch_max_items, gateway_config.batch_max_archive_mb * 1024 * 1024
+        ))
+    if not uploads:
+        raise HTTPException(status_code=400, detail="Provide image files or a zip archive")
+    if len(uploads) > gateway_config.batch_max_items:
+        raise HTTPException(status_code=400, detail=f"At most {gateway_config.batch_max_items} images can be queried per request")
+
+    items = [(file_name, content, str(image_queries.get(file_name, query) or "")) for file_name, content in uploads]
+    missing = [file_name for file_name, _, item_query in items if not item_query.strip()]
+    if missing:
+        raise HTTPException(status_code=400, detail=f"No query given for {missing}")
+    if any(len(item_query) > 1000 for _, _, item_query in items):
+        raise HTTPException(status_code=400, detail="Query cannot exceed 1000 characters")
+
+    logger.info(f"Received batch visual query request: {len(items)} images, stream: {stream}")
+    start_time = time()
+
+    # Downsized once per image, so a retried upstream call does not resize again
+    resized = {}
+
+    async def answer_item(index: int) -> str:
+        file_name, content, item_query = items[index]
+        if index not in resized:
+            resized[index] = await resize_image(content)
+        image, mime_type = resized[index]
+        return await post_visual_query(file_name, image, mime_type, item_query, src_lang, tgt_lang)
+
+    def item_result(index: int, outcome) -> BatchVisualQueryItem:
+        file_name, _, item_query = items[index]
+        if isinstance(outcome, httpx.TimeoutException):
+            error = "Visual query service timeout"
+        elif isinstance(outcome, Exception):
+            error = f"Visual query failed: {str(outcome) or type(outcome).__name__}"
+        else:
+            return BatchVisualQueryItem(index=index, file_name=file_name, query=item_query, answer=outcome)
+        logger.error(f"Batch visual query of {file_name} failed: {error}")
+        return BatchVisualQueryItem(index=index, file_name=file_name, query=item_query, error=error)
+
+    outcomes = iterate_as_completed(
+        answer_item,
+        range(len(items)),
+        concurrency=gateway_config.batch_concurrency,
+        retries=gateway_config.batch_retries,
+        retry_backoff=gateway_config.batch_retry_backoff
+    )
+
+    if stream:
+        async def stream_results():
+            try:
+                async for index, outcome in outcomes:
+                    yield json.dumps(item_result(index, outcome).model_dump(), ensure_ascii=False) + "\n"
+                logger.info(f"Batch visual query completed in {time() - start_time:.2f} seconds, images: {len(items)}")
+            finally:
+                await outcomes.aclose()
+
+        return StreamingResponse(stream_results(), media_type="application/x-ndjson")
+
+    async def collect_results() -> List[BatchVisualQueryItem]:
+        results = [None] * len(items)
+        async for index, outcome in outcomes:
+            results[index] = item_result(index, outcome)
+        return results
+
+    try:
+        results = await cancel_on_disconnect(request, collect_results())
+    finally:
+        await outcomes.aclose()
+    logger.info(f"Batch visual query completed in {time() - start_time:.2f} seconds, images: {len(items)}")
+    return BatchVisualQueryResponse(results=results)
+
 from enum import Enum
 
 class SupportedLanguage(str, Enum):
@@ -528,14 +1079,12 @@ async def speech_to_speech(
         files = {"file": (file.filename, file_content, file.content_type)}
         external_url = f"{os.getenv('EXTERNAL_API_BASE_URL')}/v1/speech_to_speech?language={language}"
 
-        response = requests.post(
+        response = await open_stream(
+            "POST",
             external_url,
             files=files,
-            headers={"accept": "application/json"},
-            stream=True,
-            timeout=60
+            headers={"accept": "application/json"}
         )
-        response.raise_for_status()
 
         headers = {
             "Content-Disposition": f"inline; filename=\"speech.mp3\"",
@@ -543,19 +1092,28 @@ async def speech_to_speech(
             "Content-Type": "audio/mp3"
         }
 
+        # Relay upstream chunks asynchronously; the upstream request is closed if the client hangs up
         return StreamingResponse(
-            response.iter_content(chunk_size=8192),
+            relay_stream(request, response),
             media_type="audio/mp3",
             headers=headers
         )
 
-    except requests.Timeout:
+    except httpx.TimeoutException:
         logger.error("External speech-to-speech API timed out")
         raise HTTPException(status_code=504, detail="External API timeout")
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"External speech-to-speech API error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"External API error: {str(e)}")
-    
+
+@app.websocket("/v1/ws/speech_to_speech")
+async def speech_to_speech_ws(
+    websocket: WebSocket,
+    language: str = Query(..., description="Language of the audio (kannada, hindi, tamil)")
+):
+    """Full-duplex speech-to-speech session; see run_speech_to_speech_session for the protocol."""
+    await run_speech_to_speech_session(websocket, language, [lang.value for lang in SupportedLanguage])
+
 
 '''
 Upgrading system to use Vllm server
@@ -563,11 +1121,13 @@ Upgrading system to use Vllm server
 
 class PDFTextExtractionResponse(BaseModel):
     page_content: str = Field(..., description="Extracted text from the specified PDF page")
+    extraction_method: str = Field("ocr", description="How the text was extracted: text_layer (embedded PDF text) or ocr (vision model)")
 
     class Config:
         schema_extra = {
             "example": {
-                "page_content": "Google Interview Preparation Guide\nCustomer Engineer Specialist\n\nOur hiring process\n..."
+                "page_content": "Google Interview Preparation Guide\nCustomer Engineer Specialist\n\nOur hiring process\n...",
+                "extraction_method": "text_layer"
             }
         }
 
@@ -585,7 +1145,8 @@ class PDFTextExtractionResponse(BaseModel):
 async def extract_text(
     request: Request,
     file: UploadFile = File(..., description="PDF file to extract text from"),
-    page_number: int = Query(1, description="Page number to extract text from (1-based indexing)")
+    page_number: int = Query(1, description="Page number to extract text from (1-based indexing)"),
+    language: Optional[str] = Query(None, description="Language of the PDF content (kannada, hindi, tamil); without it the page is always OCRed")
 ):
     # Validate page number
     if page_number < 1:
@@ -595,20 +1156,35 @@ async def extract_text(
         "endpoint": "/v1/extract-text",
         "file_name": file.filename,
         "page_number": page_number,
+        "language": language,
         "client_ip": request.client.host
     })
     
     start_time = time()
     try:
-        file_content = await file.read()
-        files = {"file": (file.filename, file_content, file.content_type)}
+        # Forward only the requested page, which is page 1 of the sliced PDF
+        page_pdf = await single_page_pdf(await file.read(), page_number)
+
+        # Born-digital pages carry a reliable text layer, which makes OCR unnecessary
+        text_layer = await usable_text_layer(page_pdf, language)
+        if text_layer:
+            logger.info(f"PDF text extraction completed from the text layer in {time() - start_time:.2f} seconds")
+            return PDFTextExtractionResponse(page_content=text_layer, extraction_method="text_layer")
+
+        if vision_enabled():
+            # Render the page here and send the image straight to the vision model
+            extracted_text = await vision_extract_text(request, page_pdf)
+            logger.info(f"PDF text extraction completed with the vision model in {time() - start_time:.2f} seconds")
+            return PDFTextExtractionResponse(page_content=extracted_text.strip(), extraction_method="ocr")
+
+        files = {"file": (file.filename, page_pdf, "application/pdf")}
         
-        external_url = f"{os.getenv('EXTERNAL_PDF_API_BASE_URL')}/extract-text/?page_number={page_number}"
-        response = requests.post(
+        external_url = f"{os.getenv('EXTERNAL_PDF_API_BASE_URL')}/extract-text/?page_number=1"
+        response = await post_upstream(
+            request,
             external_url,
             files=files,
-            headers={"accept": "application/json"},
-            timeout=60
+            headers={"accept": "application/json"}
         )
         response.raise_for_status()
         
@@ -619,12 +1195,12 @@ async def extract_text(
             extracted_text = ""
         
         logger.info(f"PDF text extraction completed in {time() - start_time:.2f} seconds")
-        return PDFTextExtractionResponse(page_content=extracted_text.strip())
+        return PDFTextExtractionResponse(page_content=extracted_text.strip(), extraction_method="ocr")
     
-    except requests.Timeout:
+    except httpx.TimeoutException:
         logger.error("External PDF extraction API timed out")
         raise HTTPException(status_code=504, detail="External API timeout")
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"External PDF extraction API error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"External API error: {str(e)}")
     except ValueError as e:
@@ -664,6 +1240,7 @@ class DocumentProcessResponse(BaseModel):
 
 @app.post("/v1/indic-extract-text/", response_model=DocumentProcessResponse, tags=["PDF"])
 async def extract_and_translate(
+    request: Request,
     file: UploadFile = File(...),
     page_number: int = 1,
     src_lang: str = "eng_Latn",
@@ -687,17 +1264,19 @@ async def extract_and_translate(
         }
 
         # Prepare form data
+        # Forward only the requested page, which is page 1 of the sliced PDF
+        page_pdf = await single_page_pdf(await file.read(), page_number)
         files = {
-            "file": (file.filename, await file.read(), "application/pdf")
+            "file": (file.filename, page_pdf, "application/pdf")
         }
         data = {
-            "page_number": str(page_number),
+            "page_number": "1",
             "src_lang": src_lang,
             "tgt_lang": tgt_lang
         }
 
         # Make the POST request to the external API
-        response = requests.post(url, headers=headers, files=files, data=data)
+        response = await post_upstream(request, url, headers=headers, files=files, data=data)
 
         # Check for successful response
         if response.status_code != 200:
@@ -726,7 +1305,9 @@ async def extract_and_translate(
 
         return result
 
-    except requests.RequestException as e:
+    except HTTPException:
+        raise
+    except httpx.HTTPError as e:
         raise HTTPException(status_code=500, detail=f"Error calling external API: {str(e)}")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
@@ -735,6 +1316,206 @@ async def extract_and_translate(
         await file.close()
 
 
+async def pdf_pages_to_process(file_content: bytes, page_number: Optional[int], pages: Optional[str]) -> List[tuple]:
+    """Return (page_number, single-page PDF) pairs for a page selection, or for a single page."""
+    if pages is not None:
+        return await selected_page_pdfs(file_content, pages)
+    return [(page_number, await single_page_pdf(file_content, page_number))]
+
+async def process_pdf_pages(request: Request, process_page, page_pdfs: List[tuple]) -> list:
+    """Run process_page over the sliced pages concurrently, results in page order."""
+    return await cancel_on_disconnect(request, map_concurrently(
+        process_page,
+        page_pdfs,
+        concurrency=gateway_config.pdf_page_concurrency,
+        retries=gateway_config.pdf_page_retries,
+        retry_backoff=gateway_config.pdf_page_retry_backoff
+    ))
+
+async def combine_page_results(
+    request: Request,
+    instruction: str,
+    page_results: List[tuple],
+    src_lang: str = "eng_Latn",
+    tgt_lang: str = "eng_Latn",
+    section_prompt: str = SECTION_SUMMARY_PROMPT
+) -> str:
+    """Produce a single result across pages by passing the per-page results to the chat upstream.
+
+    The results are combined with map-reduce under the same prompt and context
+    budget as document summaries, so any number of pages can be combined.
+    """
+    sections = [f"Page {page_number}:\n{text}" for page_number, text in page_results if text.strip()]
+    return await cancel_on_disconnect(request, summarize_pages_text(
+        sections,
+        instruction,
+        src_lang,
+        tgt_lang,
+        f"{os.getenv('EXTERNAL_API_BASE_URL')}/v1/indic_chat",
+        section_prompt=section_prompt
+    ))
+
+async def extract_page_text(file_name: str, page_pdf: bytes, language: Optional[str] = None) -> tuple:
+    """Return (text, extraction_method) for a single-page PDF: text layer, then vision, then the OCR upstream.
+
+    The text layer is only used when the language is known, see usable_text_layer.
+    """
+    text_layer = await usable_text_layer(page_pdf, language)
+    if text_layer:
+        return text_layer, "text_layer"
+    if vision_enabled():
+        extracted_text = await vision_extract_text(None, page_pdf)
+        return extracted_text.strip(), "ocr"
+
+    response = await post_upstream(
+        None,
+        f"{os.getenv('EXTERNAL_PDF_API_BASE_URL')}/extract-text/?page_number=1",
+        files={"file": (file_name, page_pdf, "application/pdf")},
+        headers={"accept": "application/json"}
+    )
+    response.raise_for_status()
+    return response.json().get("page_content", "").strip(), "ocr"
+
+async def page_index(file_name: str, file_content: bytes, language: Optional[str] = None) -> BM25Index:
+    """Return the retrieval index over every page of a PDF, building it on first use.
+
+    Indexes are cached by content hash and language, so further prompts
+    against the same document skip the per-page extraction.
+    """
+    key = f"{hashlib.sha256(file_content).hexdigest()}:{language or ''}"
+    index = page_indexes.get(key)
+    if index is not None:
+        return index
+
+    start_time = time()
+    page_pdfs = await split_pdf_pages(file_content)
+    page_texts = await map_concurrently(
+        lambda page_pdf: extract_page_text(file_name, page_pdf, language),
+        page_pdfs,
+        concurrency=gateway_config.pdf_page_concurrency,
+        retries=gateway_config.pdf_page_retries,
+        retry_backoff=gateway_config.pdf_page_retry_backoff
+    )
+    index = await asyncio.to_thread(BM25Index, [text for text, _ in page_texts])
+    page_indexes.put(key, index)
+    logger.info(f"Page index for {file_name} built in {time() - start_time:.2f} seconds, pages: {len(page_pdfs)}")
+    return index
+
+
+class DocumentSummaryPage(BaseModel):
+    page_number: int = Field(..., description="Page number of the extracted text")
+    page_text: str = Field(..., description="Extracted text from the page")
+    extraction_method: str = Field("ocr", description="How the text was extracted: text_layer (embedded PDF text) or ocr")
+
+class DocumentSummaryResponse(BaseModel):
+    pages: List[DocumentSummaryPage] = Field(..., description="List of pages with extracted text")
+    summary: str = Field(..., description="Summary of the document based on the provided prompt")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "pages": [
+                    {
+                        "page_number": 1,
+                        "page_text": "Okay, here's the plain text representation of the document...\n\nDB Online-Ticket\n...",
+                        "extraction_method": "ocr"
+                    }
+                ],
+                "summary": "This document is a digital train ticket for ICE 1126, traveling from Köln Hbf to Berlin Hbf..."
+            }
+        }
+
+@app.post("/v1/document_summary_v0",
+          response_model=DocumentSummaryResponse,
+          summary="Summarize All Pages of a PDF",
+          description="Extract the text of every page of a PDF concurrently and summarize it with the provided prompt, map-reduce style within the model context.",
+          tags=["PDF"],
+          responses={
+              200: {"description": "Extracted text and summary of all pages", "model": DocumentSummaryResponse},
+              400: {"description": "Invalid PDF, prompt, or language codes"},
+              500: {"description": "External API error"},
+              504: {"description": "External API timeout"}
+          })
+async def document_summary_v0(
+    request: Request,
+    file: UploadFile = File(..., description="PDF file to summarize"),
+    src_lang: str = Form(..., description="Source language code (e.g., eng_Latn)"),
+    tgt_lang: str = Form(..., description="Target language code (e.g., eng_Latn)"),
+    prompt: str = Form(..., description="Prompt for summarization (e.g., 'Summarize the document in 3 sentences.')")
+):
+    # Validate inputs
+    if not prompt.strip():
+        raise HTTPException(status_code=400, detail="Prompt cannot be empty")
+    # Half of each upstream chat prompt is kept for the document text
+    max_prompt_length = min(1000, gateway_config.summary_max_prompt_chars // 2)
+    if len(prompt) > max_prompt_length:
+        raise HTTPException(status_code=400, detail=f"Prompt cannot exceed {max_prompt_length} characters")
+
+    # Validate language codes
+    supported_languages = [
+        "eng_Latn", "hin_Deva", "kan_Knda", "tam_Taml", "mal_Mlym", "tel_Telu",
+        "deu_Latn", "fra_Latn", "nld_Latn", "spa_Latn", "ita_Latn", "por_Latn",
+        "rus_Cyrl", "pol_Latn"
+    ]
+    if src_lang not in supported_languages:
+        raise HTTPException(status_code=400, detail=f"Unsupported source language: {src_lang}. Must be one of {supported_languages}")
+    if tgt_lang not in supported_languages:
+        raise HTTPException(status_code=400, detail=f"Unsupported target language: {tgt_lang}. Must be one of {supported_languages}")
+
+    # Validate file
+    if not file.filename.lower().endswith('.pdf'):
+        raise HTTPException(status_code=400, detail="File must be a PDF")
+
+    logger.info("Processing document summary request", extra={
+        "endpoint": "/v1/document_summary_v0",
+        "file_name": file.filename,
+        "prompt_length": len(prompt),
+        "src_lang": src_lang,
+        "tgt_lang": tgt_lang,
+        "client_ip": request.client.host
+    })
+
+    start_time = time()
+    page_pdfs = await split_pdf_pages(await file.read())
+
+    try:
+        extracted_pages = await process_pdf_pages(
+            request,
+            lambda page_pdf: extract_page_text(file.filename, page_pdf, src_lang),
+            page_pdfs
+        )
+        page_texts = [page_text for page_text, _ in extracted_pages]
+        formatted_pages = [
+            DocumentSummaryPage(page_number=page_number, page_text=page_text, extraction_method=extraction_method)
+            for page_number, (page_text, extraction_method) in enumerate(extracted_pages, start=1)
+        ]
+
+        if not any(page_text.strip() for page_text in page_texts):
+            logger.warning("No text extracted from any page, skipping summary")
+            return DocumentSummaryResponse(pages=formatted_pages, summary="No text extracted from the document")
+
+        summary = await cancel_on_disconnect(
+            request,
+            summarize_pages_text(page_texts, prompt, src_lang, tgt_lang, f"{os.getenv('EXTERNAL_API_BASE_URL')}/v1/indic_chat")
+        )
+        if not summary:
+            logger.warning("No summary found in external API response")
+            return DocumentSummaryResponse(pages=formatted_pages, summary="No summary provided by the external API")
+
+        logger.info(f"Document summary completed in {time() - start_time:.2f} seconds, pages extracted: {len(formatted_pages)}, summary length: {len(summary)}")
+        return DocumentSummaryResponse(pages=formatted_pages, summary=summary)
+
+    except httpx.TimeoutException:
+        logger.error("External document summary API timed out")
+        raise HTTPException(status_code=504, detail="External API timeout")
+    except httpx.HTTPError as e:
+        logger.error(f"External document summary API error: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"External API error: {str(e)}")
+    except ValueError as e:
+        logger.error(f"Invalid JSON response from external API: {str(e)}")
+        raise HTTPException(status_code=500, detail="Invalid response format from external API")
+
+
 class SummarizePDFResponse(BaseModel):
     original_text: str = Field(..., description="Extracted text from the specified page")
     summary: str = Field(..., description="Summary of the specified page")
@@ -749,78 +1530,114 @@ class SummarizePDFResponse(BaseModel):
             }
         }
 
+class SummarizePDFPagesResponse(BaseModel):
+    pages: List[SummarizePDFResponse] = Field(..., description="Results for each selected page, in page order")
+    combined_summary: Optional[str] = Field(None, description="Summary across all selected pages, if requested")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "pages": [
+                    {
+                        "original_text": "Okay, here's a plain text representation of the document...\n\nElectronic Reservation Slip (ERS)...",
+                        "summary": "This ERS details a sleeper class train booking (17307/Basava Express) from KSR Bengaluru to Kalaburagi...",
+                        "processed_page": 1
+                    }
+                ],
+                "combined_summary": "The document is a sleeper class train booking from KSR Bengaluru to Kalaburagi..."
+            }
+        }
+
 @app.post("/v1/summarize-pdf",
-          response_model=SummarizePDFResponse,
-          summary="Summarize a Specific Page of a PDF",
-          description="Summarize the content of a specific page of a PDF file using an external API.",
+          response_model=Union[SummarizePDFResponse, SummarizePDFPagesResponse],
+          summary="Summarize Specific Pages of a PDF",
+          description="Summarize the content of a specific page, or a selection of pages, of a PDF file using an external API.",
           tags=["PDF"],
           responses={
-              200: {"description": "Extracted text and summary of the specified page", "model": SummarizePDFResponse},
-              400: {"description": "Invalid PDF or page number"},
+              200: {"description": "Extracted text and summary of the specified page, or of each selected page"},
+              400: {"description": "Invalid PDF, page number or page selection"},
               500: {"description": "External API error"},
               504: {"description": "External API timeout"}
           })
 async def summarize_pdf(
     request: Request,
     file: UploadFile = File(..., description="PDF file to summarize"),
-    page_number: int = Form(..., description="Page number to summarize (1-based indexing)")
+    page_number: Optional[int] = Form(None, description="Page number to summarize (1-based indexing)"),
+    pages: Optional[str] = Form(None, description="Pages to summarize as a list or ranges (e.g., '1-5,8'); returns per-page results"),
+    combine: bool = Form(False, description="With pages, also summarize the selected pages as a whole")
 ):
     # Validate file
     if not file.filename.lower().endswith('.pdf'):
         raise HTTPException(status_code=400, detail="File must be a PDF")
 
     # Validate page number
-    if page_number < 1:
+    if page_number is None and pages is None:
+        raise HTTPException(status_code=400, detail="Either page_number or pages must be provided")
+    if page_number is not None and page_number < 1:
         raise HTTPException(status_code=400, detail="Page number must be at least 1")
 
     logger.info("Processing PDF summary request", extra={
         "endpoint": "/summarize-pdf",
         "file_name": file.filename,
         "page_number": page_number,
+        "pages": pages,
         "client_ip": request.client.host
     })
 
     external_url = f"{os.getenv('EXTERNAL_PDF_API_BASE_URL')}/summarize-pdf"
     start_time = time()
 
-    try:
-        file_content = await file.read()
-        files = {"file": (file.filename, file_content, "application/pdf")}
-        data = {"page_number": page_number}
+    # Forward only the selected pages, each as page 1 of its own sliced PDF
+    page_pdfs = await pdf_pages_to_process(await file.read(), page_number, pages)
 
-        response = requests.post(
+    async def summarize_page(page: tuple) -> SummarizePDFResponse:
+        processed_page, page_pdf = page
+        files = {"file": (file.filename, page_pdf, "application/pdf")}
+        data = {"page_number": 1}
+
+        response = await post_upstream(
+            None,
             external_url,
             files=files,
             data=data,
-            headers={"accept": "application/json"},
-            timeout=60
+            headers={"accept": "application/json"}
         )
         response.raise_for_status()
 
         response_data = response.json()
         original_text = response_data.get("original_text", "")
         summary = response_data.get("summary", "")
-        processed_page = response_data.get("processed_page", page_number)
 
         if not original_text or not summary:
-            logger.warning(f"Incomplete response from external API: original_text={'present' if original_text else 'missing'}, summary={'present' if summary else 'missing'}")
-            return SummarizePDFResponse(
-                original_text=original_text or "No text extracted",
-                summary=summary or "No summary provided",
-                processed_page=processed_page
-            )
-
-        logger.info(f"PDF summary completed in {time() - start_time:.2f} seconds, page processed: {processed_page}, summary length: {len(summary)}")
+            logger.warning(f"Incomplete response from external API for page {processed_page}: original_text={'present' if original_text else 'missing'}, summary={'present' if summary else 'missing'}")
         return SummarizePDFResponse(
-            original_text=original_text,
-            summary=summary,
+            original_text=original_text or "No text extracted",
+            summary=summary or "No summary provided",
             processed_page=processed_page
         )
 
-    except requests.Timeout:
+    try:
+        results = await process_pdf_pages(request, summarize_page, page_pdfs)
+        if pages is None:
+            result = results[0]
+            logger.info(f"PDF summary completed in {time() - start_time:.2f} seconds, page processed: {result.processed_page}, summary length: {len(result.summary)}")
+            return result
+
+        combined_summary = None
+        if combine:
+            combined_summary = await combine_page_results(
+                request,
+                "Combine these page summaries into a single summary of the document.",
+                [(result.processed_page, result.summary) for result in results]
+            )
+
+        logger.info(f"PDF summary completed in {time() - start_time:.2f} seconds, pages processed: {len(results)}")
+        return SummarizePDFPagesResponse(pages=results, combined_summary=combined_summary)
+
+    except httpx.TimeoutException:
         logger.error("External PDF summary API timed out")
         raise HTTPException(status_code=504, detail="External API timeout")
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"External PDF summary API error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"External API error: {str(e)}")
     except ValueError as e:
@@ -844,30 +1661,53 @@ class IndicSummarizePDFResponse(BaseModel):
             }
         }
 
+class IndicSummarizePDFPagesResponse(BaseModel):
+    pages: List[IndicSummarizePDFResponse] = Field(..., description="Results for each selected page, in page order")
+    combined_summary: Optional[str] = Field(None, description="Summary across all selected pages in the target language, if requested")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "pages": [
+                    {
+                        "original_text": "Okay, here's a plain text representation of the document...\n\nElectronic Reservation Slip (ERS)...",
+                        "summary": "This ERS details a Sleeper Class train booking for passenger Anand on Train 17307 (Basava Express)...",
+                        "translated_summary": "ಎಲೆಕ್ಟ್ರಾನಿಕ್ ಮೀಸಲಾತಿ ಸ್ಲಿಪ್ (ಇಆರ್ಎಸ್) ನ 4-ವಾಕ್ಯಗಳ ಸಾರಾಂಶ ಹೀಗಿದೆ...",
+                        "processed_page": 1
+                    }
+                ],
+                "combined_summary": "ಈ ದಾಖಲೆಯು ಬಸವ ಎಕ್ಸ್‌ಪ್ರೆಸ್ ರೈಲಿನ ಸ್ಲೀಪರ್ ದರ್ಜೆಯ ಬುಕಿಂಗ್ ಆಗಿದೆ..."
+            }
+        }
+
 @app.post("/v1/indic-summarize-pdf",
-          response_model=IndicSummarizePDFResponse,
-          summary="Summarize and Translate a Specific Page of a PDF",
-          description="Summarize the content of a specific page of a PDF file and translate the summary into the target language using an external API.",
+          response_model=Union[IndicSummarizePDFResponse, IndicSummarizePDFPagesResponse],
+          summary="Summarize and Translate Specific Pages of a PDF",
+          description="Summarize the content of a specific page, or a selection of pages, of a PDF file and translate the summary into the target language using an external API.",
           tags=["PDF"],
           responses={
-              200: {"description": "Extracted text, summary, and translated summary of the specified page", "model": IndicSummarizePDFResponse},
-              400: {"description": "Invalid PDF, page number, or language codes"},
+              200: {"description": "Extracted text, summary, and translated summary of the specified page, or of each selected page"},
+              400: {"description": "Invalid PDF, page number, page selection, or language codes"},
               500: {"description": "External API error"},
               504: {"description": "External API timeout"}
           })
 async def indic_summarize_pdf(
     request: Request,
     file: UploadFile = File(..., description="PDF file to summarize"),
-    page_number: int = Form(..., description="Page number to summarize (1-based indexing)"),
+    page_number: Optional[int] = Form(None, description="Page number to summarize (1-based indexing)"),
     src_lang: str = Form(..., description="Source language code (e.g., eng_Latn)"),
-    tgt_lang: str = Form(..., description="Target language code (e.g., kan_Knda)")
+    tgt_lang: str = Form(..., description="Target language code (e.g., kan_Knda)"),
+    pages: Optional[str] = Form(None, description="Pages to summarize as a list or ranges (e.g., '1-5,8'); returns per-page results"),
+    combine: bool = Form(False, description="With pages, also summarize the selected pages as a whole in the target language")
 ):
     # Validate file
     if not file.filename.lower().endswith('.pdf'):
         raise HTTPException(status_code=400, detail="File must be a PDF")
 
     # Validate page number
-    if page_number < 1:
+    if page_number is None and pages is None:
+        raise HTTPException(status_code=400, detail="Either page_number or pages must be provided")
+    if page_number is not None and page_number < 1:
         raise HTTPException(status_code=400, detail="Page number must be at least 1")
 
     # Validate language codes
@@ -885,6 +1725,7 @@ async def indic_summarize_pdf(
         "endpoint": "/indic-summarize-pdf",
         "file_name": file.filename,
         "page_number": page_number,
+        "pages": pages,
         "src_lang": src_lang,
         "tgt_lang": tgt_lang,
         "client_ip": request.client.host
@@ -893,21 +1734,24 @@ async def indic_summarize_pdf(
     external_url = f"{os.getenv('EXTERNAL_PDF_API_BASE_URL')}/indic-summarize-pdf"
     start_time = time()
 
-    try:
-        file_content = await file.read()
-        files = {"file": (file.filename, file_content, "application/pdf")}
+    # Forward only the selected pages, each as page 1 of its own sliced PDF
+    page_pdfs = await pdf_pages_to_process(await file.read(), page_number, pages)
+
+    async def summarize_page(page: tuple) -> IndicSummarizePDFResponse:
+        processed_page, page_pdf = page
+        files = {"file": (file.filename, page_pdf, "application/pdf")}
         data = {
-            "page_number": page_number,
+            "page_number": 1,
             "src_lang": src_lang,
             "tgt_lang": tgt_lang
         }
 
-        response = requests.post(
+        response = await post_upstream(
+            None,
             external_url,
             files=files,
             data=data,
-            headers={"accept": "application/json"},
-            timeout=60
+            headers={"accept": "application/json"}
         )
         response.raise_for_status()
 
@@ -915,29 +1759,40 @@ async def indic_summarize_pdf(
         original_text = response_data.get("original_text", "")
         summary = response_data.get("summary", "")
         translated_summary = response_data.get("translated_summary", "")
-        processed_page = response_data.get("processed_page", page_number)
 
         if not original_text or not summary or not translated_summary:
-            logger.warning(f"Incomplete response from external API: original_text={'present' if original_text else 'missing'}, summary={'present' if summary else 'missing'}, translated_summary={'present' if translated_summary else 'missing'}")
-            return IndicSummarizePDFResponse(
-                original_text=original_text or "No text extracted",
-                summary=summary or "No summary provided",
-                translated_summary=translated_summary or "No translated summary provided",
-                processed_page=processed_page
-            )
-
-        logger.info(f"Indic PDF summary completed in {time() - start_time:.2f} seconds, page processed: {processed_page}, summary length: {len(summary)}, translated summary length: {len(translated_summary)}")
+            logger.warning(f"Incomplete response from external API for page {processed_page}: original_text={'present' if original_text else 'missing'}, summary={'present' if summary else 'missing'}, translated_summary={'present' if translated_summary else 'missing'}")
         return IndicSummarizePDFResponse(
-            original_text=original_text,
-            summary=summary,
-            translated_summary=translated_summary,
+            original_text=original_text or "No text extracted",
+            summary=summary or "No summary provided",
+            translated_summary=translated_summary or "No translated summary provided",
             processed_page=processed_page
         )
 
-    except requests.Timeout:
+    try:
+        results = await process_pdf_pages(request, summarize_page, page_pdfs)
+        if pages is None:
+            result = results[0]
+            logger.info(f"Indic PDF summary completed in {time() - start_time:.2f} seconds, page processed: {result.processed_page}, summary length: {len(result.summary)}, translated summary length: {len(result.translated_summary)}")
+            return result
+
+        combined_summary = None
+        if combine:
+            combined_summary = await combine_page_results(
+                request,
+                "Combine these page summaries into a single summary of the document.",
+                [(result.processed_page, result.summary) for result in results],
+                src_lang=src_lang,
+                tgt_lang=tgt_lang
+            )
+
+        logger.info(f"Indic PDF summary completed in {time() - start_time:.2f} seconds, pages processed: {len(results)}")
+        return IndicSummarizePDFPagesResponse(pages=results, combined_summary=combined_summary)
+
+    except httpx.TimeoutException:
         logger.error("External Indic PDF summary API timed out")
         raise HTTPException(status_code=504, detail="External API timeout")
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"External Indic PDF summary API error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"External API error: {str(e)}")
     except ValueError as e:
@@ -959,85 +1814,181 @@ class CustomPromptPDFResponse(BaseModel):
             }
         }
 
+class CustomPromptPDFPagesResponse(BaseModel):
+    pages: List[CustomPromptPDFResponse] = Field(..., description="Results for each selected page, in page order")
+    combined_response: Optional[str] = Field(None, description="Response to the prompt across all selected pages, if requested")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "pages": [
+                    {
+                        "original_text": "Okay, here's a plain text representation of the document...\n\n**Clevertronic**\nBestellnummer: 801772347...",
+                        "response": "Okay, here’s a list of the key points from the document:\n* Company Information: Clevertronic GmbH...",
+                        "processed_page": 1
+                    }
+                ],
+                "combined_response": "Key points across the document:\n* Company Information: Clevertronic GmbH..."
+            }
+        }
+
+class CustomPromptPDFRetrievalResponse(BaseModel):
+    original_text: str = Field(..., description="Extracted text of the retrieved pages")
+    response: str = Field(..., description="Response based on the custom prompt and the retrieved pages")
+    retrieved_pages: List[int] = Field(..., description="Pages most relevant to the prompt that the answer was drawn from, best match first")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "original_text": "Page 3:\nBestellnummer: 801772347...",
+                "response": "The order number is 801772347.",
+                "retrieved_pages": [3, 1]
+            }
+        }
+
 
 @app.post("/v1/custom-prompt-pdf",
-             response_model=CustomPromptPDFResponse,
+             response_model=Union[CustomPromptPDFResponse, CustomPromptPDFPagesResponse, CustomPromptPDFRetrievalResponse],
              summary="Process a PDF with a Custom Prompt",
-             description="Extract text from a specific page of a PDF and process it with a custom prompt using an external API.",
+             description="Extract text from a specific page, or a selection of pages, of a PDF and process it with a custom prompt using an external API. "
+                         "Without a page number or selection, the pages most relevant to the prompt are retrieved and answered from in a single call.",
              tags=["PDF"],
              responses={
-                 200: {"description": "Extracted text and custom prompt response for the specified page", "model": CustomPromptPDFResponse},
-                 400: {"description": "Invalid PDF, page number, or prompt"},
+                 200: {"description": "Custom prompt response for the specified page, for each selected page, or for the retrieved pages"},
+                 400: {"description": "Invalid PDF, page number, page selection, or prompt, or no text found in the retrieved pages"},
                  500: {"description": "External API error"},
                  504: {"description": "External API timeout"}
              })
 async def custom_prompt_pdf(
     request: Request,
     file: UploadFile = File(..., description="PDF file to process"),
-    page_number: int = Form(..., description="Page number to process (1-based indexing)"),
-    prompt: str = Form(..., description="Custom prompt to process the page content")
+    page_number: Optional[int] = Form(None, description="Page number to process (1-based indexing)"),
+    prompt: str = Form(..., description="Custom prompt to process the page content"),
+    pages: Optional[str] = Form(None, description="Pages to process as a list or ranges (e.g., '1-5,8'); returns per-page results"),
+    combine: bool = Form(False, description="With pages, also answer the prompt across the selected pages as a whole"),
+    top_k: int = Form(gateway_config.retrieval_top_k, description="Without page_number or pages, number of most relevant pages to answer from"),
+    src_lang: Optional[str] = Form(None, description="Language code of the document (e.g., kan_Knda), used when retrieving pages; without it pages are always OCRed")
 ):
     # Validate file
     if not file.filename.lower().endswith('.pdf'):
         raise HTTPException(status_code=400, detail="File must be a PDF")
 
     # Validate page number
-    if page_number < 1:
+    if page_number is not None and page_number < 1:
         raise HTTPException(status_code=400, detail="Page number must be at least 1")
+    if top_k < 1:
+        raise HTTPException(status_code=400, detail="top_k must be at least 1")
 
     # Validate prompt
     if not prompt.strip():
         raise HTTPException(status_code=400, detail="Prompt cannot be empty")
+    # Half of each upstream chat prompt is kept for the page results being combined or retrieved
+    max_prompt_length = gateway_config.summary_max_prompt_chars // 2
+    if (combine or (page_number is None and pages is None)) and len(prompt) > max_prompt_length:
+        raise HTTPException(status_code=400, detail=f"Prompt cannot exceed {max_prompt_length} characters when combining or retrieving pages")
 
     logger.info("Processing custom prompt PDF request", extra={
         "endpoint": "/custom-prompt-pdf",
         "file_name": file.filename,
         "page_number": page_number,
+        "pages": pages,
         "prompt": prompt,
+        "src_lang": src_lang,
         "client_ip": request.client.host
     })
 
     external_url = f"{os.getenv('EXTERNAL_PDF_API_BASE_URL')}/custom-prompt-pdf"
     start_time = time()
+    file_content = await file.read()
 
-    try:
-        file_content = await file.read()
-        files = {"file": (file.filename, file_content, "application/pdf")}
-        data = {"page_number": page_number, "prompt": prompt}
-
-        response = requests.post(
+    if page_number is None and pages is None:
+        # No page given: answer from the pages that best match the prompt, in one call when
+        # their text fits the prompt budget, otherwise by condensing them first
+        try:
+            index = await cancel_on_disconnect(request, page_index(file.filename, file_content, src_lang))
+            # Pages without text are not sent, so they are not reported as retrieved either
+            ranked = index.top_k(prompt, len(index.documents))
+            retrieved_pages = [i + 1 for i in ranked if index.documents[i]][:top_k]
+            if not retrieved_pages:
+                raise HTTPException(status_code=400, detail="No text could be extracted from the PDF to answer the prompt")
+            page_results = [(n, index.documents[n - 1]) for n in sorted(retrieved_pages)]
+            document_lang = src_lang or "eng_Latn"
+            custom_response = await combine_page_results(
+                request,
+                f"{prompt}\n\nAnswer using only the following pages of the document.",
+                page_results,
+                src_lang=document_lang,
+                tgt_lang=document_lang,
+                section_prompt=f"Keep only the parts of the following pages that help answer: {prompt}"
+            )
+            logger.info(f"Custom prompt PDF processing completed in {time() - start_time:.2f} seconds, pages retrieved: {retrieved_pages}")
+            return CustomPromptPDFRetrievalResponse(
+                original_text="\n\n".join(f"Page {n}:\n{text}" for n, text in page_results),
+                response=custom_response or "No response provided",
+                retrieved_pages=retrieved_pages
+            )
+        except httpx.TimeoutException:
+            logger.error("External custom prompt PDF API timed out")
+            raise HTTPException(status_code=504, detail="External API timeout")
+        except httpx.HTTPError as e:
+            logger.error(f"External custom prompt PDF API error: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"External API error: {str(e)}")
+        except ValueError as e:
+            logger.error(f"Invalid JSON response from external API: {str(e)}")
+            raise HTTPException(status_code=500, detail="Invalid response format from external API")
+
+    # Forward only the selected pages, each as page 1 of its own sliced PDF
+    page_pdfs = await pdf_pages_to_process(file_content, page_number, pages)
+
+    async def prompt_page(page: tuple) -> CustomPromptPDFResponse:
+        processed_page, page_pdf = page
+        files = {"file": (file.filename, page_pdf, "application/pdf")}
+        data = {"page_number": 1, "prompt": prompt}
+
+        response = await post_upstream(
+            None,
             external_url,
             files=files,
             data=data,
-            headers={"accept": "application/json"},
-            timeout=60
+            headers={"accept": "application/json"}
         )
         response.raise_for_status()
 
         response_data = response.json()
         original_text = response_data.get("original_text", "")
         custom_response = response_data.get("response", "")
-        processed_page = response_data.get("processed_page", page_number)
 
         if not original_text or not custom_response:
-            logger.warning(f"Incomplete response from external API: original_text={'present' if original_text else 'missing'}, response={'present' if custom_response else 'missing'}")
-            return CustomPromptPDFResponse(
-                original_text=original_text or "No text extracted",
-                response=custom_response or "No response provided",
-                processed_page=processed_page
-            )
-
-        logger.info(f"Custom prompt PDF processing completed in {time() - start_time:.2f} seconds, page processed: {processed_page}, response length: {len(custom_response)}")
+            logger.warning(f"Incomplete response from external API for page {processed_page}: original_text={'present' if original_text else 'missing'}, response={'present' if custom_response else 'missing'}")
         return CustomPromptPDFResponse(
-            original_text=original_text,
-            response=custom_response,
+            original_text=original_text or "No text extracted",
+            response=custom_response or "No response provided",
             processed_page=processed_page
         )
 
-    except requests.Timeout:
+    try:
+        results = await process_pdf_pages(request, prompt_page, page_pdfs)
+        if pages is None:
+            result = results[0]
+            logger.info(f"Custom prompt PDF processing completed in {time() - start_time:.2f} seconds, page processed: {result.processed_page}, response length: {len(result.response)}")
+            return result
+
+        combined_response = None
+        if combine:
+            combined_response = await combine_page_results(
+                request,
+                f"Combine these answers from individual pages into a single answer to the prompt: {prompt}",
+                [(result.processed_page, result.response) for result in results],
+                section_prompt=f"Merge these answers from individual pages, keeping what is relevant to the prompt: {prompt}"
+            )
+
+        logger.info(f"Custom prompt PDF processing completed in {time() - start_time:.2f} seconds, pages processed: {len(results)}")
+        return CustomPromptPDFPagesResponse(pages=results, combined_response=combined_response)
+
+    except httpx.TimeoutException:
         logger.error("External custom prompt PDF API timed out")
         raise HTTPException(status_code=504, detail="External API timeout")
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"External custom prompt PDF API error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"External API error: {str(e)}")
     except ValueError as e:
@@ -1061,37 +2012,64 @@ class IndicCustomPromptPDFResponse(BaseModel):
             }
         }
 
+class IndicCustomPromptPDFPagesResponse(BaseModel):
+    pages: List[IndicCustomPromptPDFResponse] = Field(..., description="Results for each selected page, in page order")
+    combined_response: Optional[str] = Field(None, description="Response to the prompt across all selected pages in the target language, if requested")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "pages": [
+                    {
+                        "original_text": "Okay, here's a plain text representation of the document...\n\n**Clevertronic. Voll. Venture GmbH**...",
+                        "response": "Okay, here’s a list of key points from the document:\n* Company Information: Clevertronic. Voll. Venture GmbH...",
+                        "translated_response": "ಸರಿ, ಡಾಕ್ಯುಮೆಂಟ್ನ ಪ್ರಮುಖ ಅಂಶಗಳ ಪಟ್ಟಿ ಹೀಗಿದೆ...\n* ಕಂಪನಿ ಮಾಹಿತಿ: ಕ್ಲೆವರ್ಟ್ರಾನಿಕ್. ಮತಪತ್ರ. ವೆಂಚರ್ ಜಿಎಂಬಿಎಚ್...",
+                        "processed_page": 1
+                    }
+                ],
+                "combined_response": "ಡಾಕ್ಯುಮೆಂಟ್‌ನ ಪ್ರಮುಖ ಅಂಶಗಳು:\n* ಕಂಪನಿ ಮಾಹಿತಿ: ಕ್ಲೆವರ್ಟ್ರಾನಿಕ್..."
+            }
+        }
+
 
 @app.post("/v1/indic-custom-prompt-pdf",
-             response_model=IndicCustomPromptPDFResponse,
+             response_model=Union[IndicCustomPromptPDFResponse, IndicCustomPromptPDFPagesResponse],
              summary="Process a PDF with a Custom Prompt and Translation",
-             description="Extract text from a specific page of a PDF, process it with a custom prompt, and translate the response into a target language using an external API.",
+             description="Extract text from a specific page, or a selection of pages, of a PDF, process it with a custom prompt, and translate the response into a target language using an external API.",
              tags=["PDF"],
              responses={
-                 200: {"description": "Extracted text, custom prompt response, and translated response for the specified page", "model": IndicCustomPromptPDFResponse},
-                 400: {"description": "Invalid PDF, page number, prompt, or language codes"},
+                 200: {"description": "Extracted text, custom prompt response, and translated response for the specified page, or for each selected page"},
+                 400: {"description": "Invalid PDF, page number, page selection, prompt, or language codes"},
                  500: {"description": "External API error"},
                  504: {"description": "External API timeout"}
              })
 async def indic_custom_prompt_pdf(
     request: Request,
     file: UploadFile = File(..., description="PDF file to process"),
-    page_number: int = Form(..., description="Page number to process (1-based indexing)"),
+    page_number: Optional[int] = Form(None, description="Page number to process (1-based indexing)"),
     prompt: str = Form(..., description="Custom prompt to process the page content"),
     source_language: str = Form(..., description="Source language code (e.g., eng_Latn)"),
-    target_language: str = Form(..., description="Target language code (e.g., kan_Knda)")
+    target_language: str = Form(..., description="Target language code (e.g., kan_Knda)"),
+    pages: Optional[str] = Form(None, description="Pages to process as a list or ranges (e.g., '1-5,8'); returns per-page results"),
+    combine: bool = Form(False, description="With pages, also answer the prompt across the selected pages as a whole in the target language")
 ):
     # Validate file
     if not file.filename.lower().endswith('.pdf'):
         raise HTTPException(status_code=400, detail="File must be a PDF")
 
     # Validate page number
-    if page_number < 1:
+    if page_number is None and pages is None:
+        raise HTTPException(status_code=400, detail="Either page_number or pages must be provided")
+    if page_number is not None and page_number < 1:
         raise HTTPException(status_code=400, detail="Page number must be at least 1")
 
     # Validate prompt
     if not prompt.strip():
         raise HTTPException(status_code=400, detail="Prompt cannot be empty")
+    # Half of each upstream chat prompt is kept for the page results being combined
+    max_prompt_length = gateway_config.summary_max_prompt_chars // 2
+    if combine and len(prompt) > max_prompt_length:
+        raise HTTPException(status_code=400, detail=f"Prompt cannot exceed {max_prompt_length} characters when combining pages")
 
     # Validate language codes (basic check for non-empty)
     if not source_language.strip() or not target_language.strip():
@@ -1101,6 +2079,7 @@ async def indic_custom_prompt_pdf(
         "endpoint": "/indic-custom-prompt-pdf",
         "file_name": file.filename,
         "page_number": page_number,
+        "pages": pages,
         "prompt": prompt,
         "source_language": source_language,
         "target_language": target_language,
@@ -1110,22 +2089,25 @@ async def indic_custom_prompt_pdf(
     external_url = f"{os.getenv('EXTERNAL_PDF_API_BASE_URL')}/indic-custom-prompt-pdf"
     start_time = time()
 
-    try:
-        file_content = await file.read()
-        files = {"file": (file.filename, file_content, "application/pdf")}
+    # Forward only the selected pages, each as page 1 of its own sliced PDF
+    page_pdfs = await pdf_pages_to_process(await file.read(), page_number, pages)
+
+    async def prompt_page(page: tuple) -> IndicCustomPromptPDFResponse:
+        processed_page, page_pdf = page
+        files = {"file": (file.filename, page_pdf, "application/pdf")}
         data = {
-            "page_number": page_number,
+            "page_number": 1,
             "prompt": prompt,
             "source_language": source_language,
             "target_language": target_language
         }
 
-        response = requests.post(
+        response = await post_upstream(
+            None,
             external_url,
             files=files,
             data=data,
-            headers={"accept": "application/json"},
-            timeout=60
+            headers={"accept": "application/json"}
         )
         response.raise_for_status()
 
@@ -1133,34 +2115,46 @@ async def indic_custom_prompt_pdf(
         original_text = response_data.get("original_text", "")
         custom_response = response_data.get("response", "")
         translated_response = response_data.get("translated_response", "")
-        processed_page = response_data.get("processed_page", page_number)
 
         if not original_text or not custom_response or not translated_response:
-            logger.warning(f"Incomplete response from external API: "
+            logger.warning(f"Incomplete response from external API for page {processed_page}: "
                           f"original_text={'present' if original_text else 'missing'}, "
                           f"response={'present' if custom_response else 'missing'}, "
                           f"translated_response={'present' if translated_response else 'missing'}")
-            return IndicCustomPromptPDFResponse(
-                original_text=original_text or "No text extracted",
-                response=custom_response or "No response provided",
-                translated_response=translated_response or "No translated response provided",
-                processed_page=processed_page
-            )
-
-        logger.info(f"Indic custom prompt PDF processing completed in {time() - start_time:.2f} seconds, "
-                    f"page processed: {processed_page}, response length: {len(custom_response)}, "
-                    f"translated response length: {len(translated_response)}")
         return IndicCustomPromptPDFResponse(
-            original_text=original_text,
-            response=custom_response,
-            translated_response=translated_response,
+            original_text=original_text or "No text extracted",
+            response=custom_response or "No response provided",
+            translated_response=translated_response or "No translated response provided",
             processed_page=processed_page
         )
 
-    except requests.Timeout:
+    try:
+        results = await process_pdf_pages(request, prompt_page, page_pdfs)
+        if pages is None:
+            result = results[0]
+            logger.info(f"Indic custom prompt PDF processing completed in {time() - start_time:.2f} seconds, "
+                        f"page processed: {result.processed_page}, response length: {len(result.response)}, "
+                        f"translated response length: {len(result.translated_response)}")
+            return result
+
+        combined_response = None
+        if combine:
+            combined_response = await combine_page_results(
+                request,
+                f"Combine these answers from individual pages into a single answer to the prompt: {prompt}",
+                [(result.processed_page, result.response) for result in results],
+                src_lang=source_language,
+                tgt_lang=target_language,
+                section_prompt=f"Merge these answers from individual pages, keeping what is relevant to the prompt: {prompt}"
+            )
+
+        logger.info(f"Indic custom prompt PDF processing completed in {time() - start_time:.2f} seconds, pages processed: {len(results)}")
+        return IndicCustomPromptPDFPagesResponse(pages=results, combined_response=combined_response)
+
+    except httpx.TimeoutException:
         logger.error("External indic custom prompt PDF API timed out")
         raise HTTPException(status_code=504, detail="External API timeout")
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"External indic custom prompt PDF API error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"External API error: {str(e)}")
     except ValueError as e:
@@ -1169,28 +2163,31 @@ async def indic_custom_prompt_pdf(
 
 @app.post("/v1/indic-custom-prompt-kannada-pdf",
           summary="Generate Kannada PDF with Custom Prompt",
-          description="Process a PDF with a custom prompt and generate a new PDF in Kannada using an external API.",
+          description="Process a PDF with a custom prompt and generate a new PDF in Kannada using an external API. "
+                      "With a page selection, the pages are generated concurrently and streamed as one PDF, in page order.",
           tags=["PDF"],
           responses={
               200: {"description": "Generated Kannada PDF file", "content": {"application/pdf": {"example": "Binary PDF data"}}},
-              400: {"description": "Invalid PDF, page number, prompt, or language"},
+              400: {"description": "Invalid PDF, page number, page selection, prompt, or language"},
               500: {"description": "External API error"},
               504: {"description": "External API timeout"}
           })
 async def indic_custom_prompt_kannada_pdf(
     request: Request,
     file: UploadFile = File(..., description="PDF file to process"),
-    page_number: int = Form(..., description="Page number to process (1-based indexing)"),
+    page_number: Optional[int] = Form(None, description="Page number to process (1-based indexing)"),
     prompt: str = Form(..., description="Custom prompt to process the page content (e.g., 'list key points')"),
     src_lang: str = Form(..., description="Source language code (e.g., eng_Latn)"),
-    background_tasks: BackgroundTasks = BackgroundTasks()
+    pages: Optional[str] = Form(None, description="Pages to process as a list or ranges (e.g., '1-5,8'); returns one PDF covering all of them")
 ):
     # Validate file
     if not file.filename.lower().endswith('.pdf'):
         raise HTTPException(status_code=400, detail="File must be a PDF")
 
     # Validate page number
-    if page_number < 1:
+    if page_number is None and pages is None:
+        raise HTTPException(status_code=400, detail="Either page_number or pages must be provided")
+    if page_number is not None and page_number < 1:
         raise HTTPException(status_code=400, detail="Page number must be at least 1")
 
     # Validate prompt
@@ -1206,6 +2203,7 @@ async def indic_custom_prompt_kannada_pdf(
         "endpoint": "/v1/indic-custom-prompt-kannada-pdf",
         "file_name": file.filename,
         "page_number": page_number,
+        "pages": pages,
         "prompt": prompt,
         "src_lang": src_lang,
         "client_ip": request.client.host
@@ -1214,69 +2212,299 @@ async def indic_custom_prompt_kannada_pdf(
     external_url = f"{os.getenv('EXTERNAL_PDF_API_BASE_URL')}/indic-custom-prompt-kannada-pdf/"
     start_time = time()
 
-    # Create a temporary file to store the generated PDF
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-    temp_file_path = temp_file.name
+    file_content = await file.read()
+    headers = {
+        "Content-Disposition": "attachment; filename=\"generated_kannada.pdf\"",
+        "Cache-Control": "no-cache",
+    }
+
+    # Identical requests produce the same document, so serve it from the cache when present
+    cache_key = output_cache.key_for("indic-custom-prompt-kannada-pdf", file_content, page_number, pages, prompt, src_lang)
+    cached_response = output_cache.file_response(
+        request, cache_key, ".pdf", "application/pdf",
+        headers={**headers, "Content-Location": f"/v1/outputs/{cache_key}.pdf"}
+    )
+    if cached_response is not None:
+        logger.info(f"Serving cached Kannada PDF: {cache_key}")
+        return cached_response
+
+    if pages is not None:
+        page_pdfs = await selected_page_pdfs(file_content, pages)
+
+        async def generate_page(page: tuple) -> bytes:
+            _, page_pdf = page
+            response = await post_upstream(
+                None,
+                external_url,
+                files={"file": (file.filename, page_pdf, "application/pdf")},
+                data={"page_number": 1, "prompt": prompt, "src_lang": src_lang},
+                headers={"accept": "application/json"}
+            )
+            response.raise_for_status()
+            return response.content
+
+        generated_pages = iterate_concurrently(
+            generate_page,
+            page_pdfs,
+            concurrency=gateway_config.pdf_page_concurrency,
+            retries=gateway_config.pdf_page_retries,
+            retry_backoff=gateway_config.pdf_page_retry_backoff
+        )
+        try:
+            # Wait for the first page so upstream failures can still be reported with a status code
+            first_page = await cancel_on_disconnect(request, generated_pages.__anext__())
+        except httpx.TimeoutException:
+            logger.error("External Kannada PDF API timed out")
+            raise HTTPException(status_code=504, detail="External API timeout")
+        except httpx.HTTPError as e:
+            logger.error(f"External Kannada PDF API error: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"External API error: {str(e)}")
+
+        async def assemble_document():
+            # Pages are appended in page order as they finish; later pages keep generating meanwhile
+            writer = PdfStreamWriter()
+            try:
+                yield writer.header()
+                yield await asyncio.to_thread(writer.add_pages, first_page)
+                async for page_pdf in generated_pages:
+                    yield await asyncio.to_thread(writer.add_pages, page_pdf)
+                yield writer.finish()
+                logger.info(f"Kannada PDF generation completed in {time() - start_time:.2f} seconds, pages processed: {len(page_pdfs)}")
+            except (httpx.HTTPError, ValueError) as e:
+                logger.error(f"Kannada PDF generation failed mid-stream: {str(e)}")
+                raise
+            finally:
+                await generated_pages.aclose()
+
+        document = assemble_document()
+        if output_cache.enabled:
+            # No ETag or Content-Location here: a later page can still fail and cut the document
+            # short, and a truncated body must not carry a validator for the complete one.
+            # The cache entry only appears once every page made it, and repeats are served from it
+            document = output_cache.tee(document, cache_key, ".pdf")
+
+        logger.info(f"Kannada PDF generation started streaming in {time() - start_time:.2f} seconds, pages: {len(page_pdfs)}")
+        return StreamingResponse(document, media_type="application/pdf", headers=headers)
+
+    # Forward only the requested page, which is page 1 of the sliced PDF
+    page_pdf = await single_page_pdf(file_content, page_number)
 
     try:
-        file_content = await file.read()
-        files = {"file": (file.filename, file_content, "application/pdf")}
+        files = {"file": (file.filename, page_pdf, "application/pdf")}
         data = {
-            "page_number": page_number,
+            "page_number": 1,
             "prompt": prompt,
             "src_lang": src_lang
         }
 
-        response = requests.post(
+        response = await open_stream(
+            "POST",
             external_url,
             files=files,
             data=data,
-            headers={"accept": "application/json"},
-            stream=True,
-            timeout=60
+            headers={"accept": "application/json"}
         )
-        response.raise_for_status()
-
-        # Write the PDF content to the temporary file
-        with open(temp_file_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
 
-        # Prepare headers for the response
-        headers = {
-            "Content-Disposition": "attachment; filename=\"generated_kannada.pdf\"",
-            "Cache-Control": "no-cache",
-        }
-
-        # Schedule file cleanup as a background task
-        def cleanup_file(file_path: str):
-            try:
-                if os.path.exists(file_path):
-                    os.unlink(file_path)
-                    logger.info(f"Deleted temporary file: {file_path}")
-            except Exception as e:
-                logger.error(f"Failed to delete temporary file {file_path}: {str(e)}")
-
-        background_tasks.add_task(cleanup_file, temp_file_path)
-
-        logger.info(f"Kannada PDF generation completed in {time() - start_time:.2f} seconds")
-        return FileResponse(
-            path=temp_file_path,
-            filename="generated_kannada.pdf",
-            media_type="application/pdf",
-            headers=headers
-        )
-
-    except requests.Timeout:
+    except httpx.TimeoutException:
         logger.error("External Kannada PDF API timed out")
         raise HTTPException(status_code=504, detail="External API timeout")
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         logger.error(f"External Kannada PDF API error: {str(e)}")
         raise HTTPException(status_code=500, detail=f"External API error: {str(e)}")
-    finally:
-        # Close the temporary file to ensure it's fully written
-        temp_file.close()
+
+    chunks = None
+    if output_cache.enabled:
+        chunks = output_cache.tee(response.aiter_bytes(gateway_config.stream_chunk_size), cache_key, ".pdf")
+        # Once this stream completes, interrupted clients can resume from /v1/outputs with Range/If-Range
+        headers["ETag"] = f"\"{cache_key}\""
+        headers["Content-Location"] = f"/v1/outputs/{cache_key}.pdf"
+
+    logger.info(f"Kannada PDF generation started streaming in {time() - start_time:.2f} seconds")
+    # Relay the generated PDF as it arrives instead of staging it in a temporary file
+    return StreamingResponse(
+        relay_stream(request, response, chunks),
+        media_type="application/pdf",
+        headers=headers
+    )
+
+class JobPage(BaseModel):
+    page_number: int = Field(..., description="Page number in the submitted PDF")
+    status: str = Field(..., description="pending, completed or failed")
+    result: Optional[dict] = Field(None, description="Result for the page once completed")
+    error: Optional[str] = Field(None, description="Error message if the page failed")
+
+class JobStatusResponse(BaseModel):
+    job_id: str = Field(..., description="Job identifier")
+    operation: str = Field(..., description="Operation applied to each page")
+    status: str = Field(..., description="queued, running, completed or failed")
+    error: Optional[str] = Field(None, description="Error message if the job failed")
+    total_pages: int = Field(..., description="Number of pages in the job")
+    completed_pages: int = Field(..., description="Number of pages completed so far")
+    failed_pages: int = Field(..., description="Number of pages that failed")
+    pages: List[JobPage] = Field(..., description="Per-page status and results, in page order")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "job_id": "3f2b9c1e8a7d4e6f9b0c1d2e3f4a5b6c",
+                "operation": "summarize",
+                "status": "running",
+                "error": None,
+                "total_pages": 2,
+                "completed_pages": 1,
+                "failed_pages": 0,
+                "pages": [
+                    {
+                        "page_number": 1,
+                        "status": "completed",
+                        "result": {
+                            "original_text": "Okay, here's a plain text representation of the document...",
+                            "summary": "This ERS details a sleeper class train booking (17307/Basava Express)..."
+                        },
+                        "error": None
+                    },
+                    {"page_number": 2, "status": "pending", "result": None, "error": None}
+                ]
+            }
+        }
+
+def job_status_response(job: dict) -> JobStatusResponse:
+    return JobStatusResponse(
+        job_id=job["job_id"],
+        operation=job["operation"],
+        status=job["status"],
+        error=job["error"],
+        total_pages=len(job["pages"]),
+        completed_pages=sum(1 for page in job["pages"] if page["status"] == "completed"),
+        failed_pages=sum(1 for page in job["pages"] if page["status"] == "failed"),
+        pages=[JobPage(**page) for page in job["pages"]]
+    )
+
+async def extract_text_job_page(params: dict, page_pdf: bytes) -> dict:
+    page_content, extraction_method = await extract_page_text(params["file_name"], page_pdf, params.get("language"))
+    return {"page_content": page_content, "extraction_method": extraction_method}
+
+async def summarize_job_page(params: dict, page_pdf: bytes) -> dict:
+    response = await post_upstream(
+        None,
+        f"{os.getenv('EXTERNAL_PDF_API_BASE_URL')}/summarize-pdf",
+        files={"file": (params["file_name"], page_pdf, "application/pdf")},
+        data={"page_number": 1},
+        headers={"accept": "application/json"}
+    )
+    response.raise_for_status()
+    response_data = response.json()
+    return {
+        "original_text": response_data.get("original_text", ""),
+        "summary": response_data.get("summary", "")
+    }
+
+async def custom_prompt_job_page(params: dict, page_pdf: bytes) -> dict:
+    response = await post_upstream(
+        None,
+        f"{os.getenv('EXTERNAL_PDF_API_BASE_URL')}/custom-prompt-pdf",
+        files={"file": (params["file_name"], page_pdf, "application/pdf")},
+        data={"page_number": 1, "prompt": params["prompt"]},
+        headers={"accept": "application/json"}
+    )
+    response.raise_for_status()
+    response_data = response.json()
+    return {
+        "original_text": response_data.get("original_text", ""),
+        "response": response_data.get("response", "")
+    }
+
+job_manager.register("extract_text", extract_text_job_page)
+job_manager.register("summarize", summarize_job_page)
+job_manager.register("custom_prompt", custom_prompt_job_page)
+
+@app.post("/v1/jobs",
+          response_model=JobStatusResponse,
+          status_code=202,
+          summary="Submit a PDF Job",
+          description="Queue a PDF for page-by-page processing in the background. Poll /v1/jobs/{job_id} or stream /v1/jobs/{job_id}/events for per-page results. Jobs survive gateway restarts.",
+          tags=["PDF"],
+          responses={
+              202: {"description": "Job queued", "model": JobStatusResponse},
+              400: {"description": "Invalid PDF, page selection, operation, or prompt"}
+          })
+async def submit_job(
+    request: Request,
+    file: UploadFile = File(..., description="PDF file to process"),
+    operation: str = Form(..., description="Operation to apply to each page: extract_text, summarize or custom_prompt"),
+    pages: Optional[str] = Form(None, description="Pages to process as a list or ranges (e.g., '1-5,8'); defaults to all pages"),
+    prompt: Optional[str] = Form(None, description="Custom prompt, required for the custom_prompt operation"),
+    language: Optional[str] = Form(None, description="Language of the PDF content (e.g., kannada or kan_Knda); extract_text uses the text layer only when it is given")
+):
+    # Validate file
+    if not file.filename.lower().endswith('.pdf'):
+        raise HTTPException(status_code=400, detail="File must be a PDF")
+
+    # Validate operation
+    if operation not in job_manager.operations:
+        raise HTTPException(status_code=400, detail=f"Unsupported operation: {operation}. Must be one of {job_manager.operations}")
+    if operation == "custom_prompt" and not (prompt or "").strip():
+        raise HTTPException(status_code=400, detail="Prompt cannot be empty")
+
+    logger.info("Processing job submission", extra={
+        "endpoint": "/v1/jobs",
+        "file_name": file.filename,
+        "operation": operation,
+        "pages": pages,
+        "client_ip": request.client.host
+    })
+
+    file_content = await file.read()
+    page_numbers = await resolve_page_selection(file_content, pages)
+    job_id = await job_manager.submit(
+        operation, {"file_name": file.filename, "prompt": prompt, "language": language}, file_content, page_numbers
+    )
+    return job_status_response(await job_manager.get(job_id))
+
+@app.get("/v1/jobs/{job_id}",
+         response_model=JobStatusResponse,
+         summary="Get PDF Job Status",
+         description="Return the status of a job and the results of the pages completed so far.",
+         tags=["PDF"],
+         responses={
+             200: {"description": "Job status and per-page results", "model": JobStatusResponse},
+             404: {"description": "Job not found"}
+         })
+async def get_job(job_id: str):
+    job = await job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job_status_response(job)
+
+@app.get("/v1/jobs/{job_id}/events",
+         summary="Stream PDF Job Results",
+         description="Stream newline-delimited JSON events: one 'page' event per finished page as it completes, then a final 'job' event with the job status.",
+         tags=["PDF"],
+         responses={
+             200: {"description": "NDJSON event stream", "content": {"application/x-ndjson": {}}},
+             404: {"description": "Job not found"}
+         })
+async def stream_job_events(request: Request, job_id: str):
+    if await job_manager.get(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+
+    async def events():
+        sent_pages = set()
+        while True:
+            job = await job_manager.get(job_id)
+            for page in job["pages"]:
+                if page["status"] != "pending" and page["page_number"] not in sent_pages:
+                    sent_pages.add(page["page_number"])
+                    yield json.dumps({"event": "page", **page}, ensure_ascii=False) + "\n"
+            if job["status"] in TERMINAL_STATUSES:
+                summary = job_status_response(job).model_dump(exclude={"pages"})
+                yield json.dumps({"event": "job", **summary}, ensure_ascii=False) + "\n"
+                return
+            if await request.is_disconnected():
+                return
+            await asyncio.sleep(gateway_config.job_poll_interval)
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,9 @@
+import os
+import sys
+import tempfile
+
+# The gateway modules import each other relative to server/, as they do when it is the working directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Keep the log file and other relative paths the gateway writes out of the source tree
+os.chdir(tempfile.mkdtemp(prefix="dwani-tests-"))
@@ -0,0 +1,81 @@
+import asyncio
+import io
+import struct
+import zipfile
+
+import pytest
+from fastapi import HTTPException
+
+from utils.archive import ZipStreamWriter, read_zip_entries, zip_entries
+
+def make_zip(entries: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        for name, content in entries.items():
+            zf.writestr(name, content)
+    return buffer.getvalue()
+
+def patch_headers(archive: bytes, flags: int = None, method: int = None) -> bytes:
+    """Rewrite the flag bits or compression method in every local and central header."""
+    data = bytearray(archive)
+    for signature, offset in ((b"PK\x03\x04", 6), (b"PK\x01\x02", 8)):
+        start = data.find(signature)
+        while start != -1:
+            if flags is not None:
+                struct.pack_into("<H", data, start + offset, flags)
+            if method is not None:
+                struct.pack_into("<H", data, start + offset + 2, method)
+            start = data.find(signature, start + 4)
+    return bytes(data)
+
+def test_read_zip_entries_keeps_archive_order_and_skips_metadata():
+    archive = make_zip({
+        "b.png": b"second",
+        "dir/": b"",
+        "__MACOSX/a.png": b"fork",
+        "dir/._a.png": b"fork",
+        "dir/a.png": b"first",
+    })
+    assert read_zip_entries(archive, max_entries=10, max_bytes=1024) == [("b.png", b"second"), ("dir/a.png", b"first")]
+
+def test_read_zip_entries_rejects_empty_archive():
+    with pytest.raises(ValueError, match="no files"):
+        read_zip_entries(make_zip({"__MACOSX/a": b"x"}), max_entries=10, max_bytes=1024)
+
+def test_read_zip_entries_enforces_entry_limit():
+    archive = make_zip({f"{index}.png": b"x" for index in range(3)})
+    with pytest.raises(ValueError, match="at most 2"):
+        read_zip_entries(archive, max_entries=2, max_bytes=1024)
+
+def test_read_zip_entries_enforces_uncompressed_size_limit():
+    archive = make_zip({"a.txt": b"x" * 600, "b.txt": b"x" * 600})
+    with pytest.raises(ValueError, match="larger than"):
+        read_zip_entries(archive, max_entries=10, max_bytes=1000)
+
+def test_read_zip_entries_rejects_invalid_archive():
+    with pytest.raises(ValueError, match="Invalid zip"):
+        read_zip_entries(b"not a zip", max_entries=10, max_bytes=1024)
+
+def test_read_zip_entries_rejects_encrypted_archive():
+    archive = patch_headers(make_zip({"a.txt": b"secret"}), flags=0x1)
+    with pytest.raises(ValueError, match="Unsupported"):
+        read_zip_entries(archive, max_entries=10, max_bytes=1024)
+
+def test_read_zip_entries_rejects_unsupported_compression():
+    archive = patch_headers(make_zip({"a.txt": b"data"}), method=99)
+    with pytest.raises(ValueError, match="Unsupported"):
+        read_zip_entries(archive, max_entries=10, max_bytes=1024)
+
+def test_zip_entries_returns_400_for_bad_archive():
+    with pytest.raises(HTTPException) as excinfo:
+        asyncio.run(zip_entries(b"not a zip", max_entries=10, max_bytes=1024))
+    assert excinfo.value.status_code == 400
+
+def test_zip_stream_writer_output_is_a_valid_archive():
+    writer = ZipStreamWriter()
+    chunks = [writer.add("one.wav", b"first"), writer.add("two.wav", b"second" * 100), writer.close()]
+    assert all(chunks)
+    with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as zf:
+        assert zf.testzip() is None
+        assert zf.namelist() == ["one.wav", "two.wav"]
+        assert zf.read("two.wav") == b"second" * 100
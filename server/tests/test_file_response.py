@@ -0,0 +1,69 @@
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from utils.file_response import _parse_range, ranged_file_response
+
+@pytest.mark.parametrize("header, expected", [
+    ("bytes=0-9", (0, 9)),
+    ("bytes=10-", (10, 99)),
+    ("bytes=-10", (90, 99)),
+    ("bytes=-500", (0, 99)),
+    ("bytes=90-500", (90, 99)),
+    (" bytes=5-5 ", (5, 5))
+])
+def test_parse_range(header, expected):
+    assert _parse_range(header, 100) == expected
+
+@pytest.mark.parametrize("header", ["bytes=-", "bytes=0-1,5-6", "items=0-9", "bytes=a-b"])
+def test_parse_range_serves_full_body_for_unsupported_ranges(header):
+    assert _parse_range(header, 100) is None
+
+@pytest.mark.parametrize("header", ["bytes=100-", "bytes=9-5", "bytes=-0"])
+def test_parse_range_rejects_unsatisfiable_ranges(header):
+    with pytest.raises(ValueError):
+        _parse_range(header, 100)
+
+@pytest.fixture
+def client(tmp_path):
+    path = tmp_path / "clip.mp3"
+    path.write_bytes(bytes(range(100)))
+    app = FastAPI()
+
+    @app.get("/clip")
+    async def clip(request: Request):
+        return ranged_file_response(request, str(path), "audio/mp3", etag="abc")
+
+    return TestClient(app)
+
+def test_ranged_file_response_full_body(client):
+    response = client.get("/clip")
+    assert response.status_code == 200
+    assert response.content == bytes(range(100))
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["etag"] == '"abc"'
+
+def test_ranged_file_response_partial_content(client):
+    response = client.get("/clip", headers={"Range": "bytes=10-19"})
+    assert response.status_code == 206
+    assert response.content == bytes(range(10, 20))
+    assert response.headers["content-range"] == "bytes 10-19/100"
+
+def test_ranged_file_response_unsatisfiable_range(client):
+    response = client.get("/clip", headers={"Range": "bytes=200-"})
+    assert response.status_code == 416
+    assert response.headers["content-range"] == "bytes */100"
+
+def test_ranged_file_response_stale_if_range_sends_everything(client):
+    response = client.get("/clip", headers={"Range": "bytes=10-19", "If-Range": '"old"'})
+    assert response.status_code == 200
+    assert len(response.content) == 100
+
+def test_ranged_file_response_not_modified(client):
+    response = client.get("/clip", headers={"If-None-Match": '"abc"'})
+    assert response.status_code == 304
+
+def test_ranged_file_response_missing_file(tmp_path):
+    request = Request({"type": "http", "headers": []})
+    with pytest.raises(FileNotFoundError):
+        ranged_file_response(request, str(tmp_path / "gone.mp3"), "audio/mp3")
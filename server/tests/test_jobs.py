@@ -0,0 +1,107 @@
+import asyncio
+import io
+
+from PyPDF2 import PdfReader, PdfWriter
+
+from utils.jobs import JobManager, JobStore
+
+def make_pdf(pages):
+    writer = PdfWriter()
+    for index in range(pages):
+        writer.add_blank_page(100 + index, 200)
+    output = io.BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+async def wait_for_status(manager, job_id, statuses=("completed", "failed")):
+    for _ in range(200):
+        job = await manager.get(job_id)
+        if job["status"] in statuses:
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"Job {job_id} did not finish")
+
+def test_job_store_records_pages_and_drops_input(tmp_path):
+    store = JobStore(str(tmp_path / "jobs.db"))
+    job_id = store.create_job("summarize", {"prompt": "p"}, b"%PDF", [1, 2])
+    store.finish_page(job_id, 1, {"summary": "S"})
+    store.finish_page(job_id, 2, None, "boom")
+    job = store.get_job(job_id, include_input=True)
+    assert job["input"] == b"%PDF"
+    assert [(page["status"], page["result"], page["error"]) for page in job["pages"]] == [
+        ("completed", {"summary": "S"}, None),
+        ("failed", None, "boom")
+    ]
+    store.set_status(job_id, "completed")
+    assert store.get_job(job_id, include_input=True)["input"] is None
+    assert store.unfinished_job_ids() == []
+    store.close()
+
+def test_job_manager_resumes_pending_pages_after_restart(tmp_path):
+    db_path = str(tmp_path / "jobs.db")
+    store = JobStore(db_path)
+    # A job interrupted after its first page, as left behind by a previous process
+    job_id = store.create_job("echo", {}, make_pdf(3), [1, 2, 3])
+    store.set_status(job_id, "running")
+    store.finish_page(job_id, 1, {"page": "done before restart"})
+    store.close()
+
+    handled = []
+
+    async def echo(params, page_pdf):
+        handled.append(page_pdf)
+        return {"size": len(page_pdf)}
+
+    async def run():
+        manager = JobManager(db_path, workers=1)
+        manager.register("echo", echo)
+        await manager.start()
+        try:
+            return await wait_for_status(manager, job_id)
+        finally:
+            await manager.stop()
+
+    job = asyncio.run(run())
+    assert job["status"] == "completed"
+    assert len(handled) == 2
+    assert job["pages"][0]["result"] == {"page": "done before restart"}
+    assert all(page["status"] == "completed" for page in job["pages"])
+
+def test_job_manager_fails_job_when_every_page_fails(tmp_path):
+    async def fail(params, page_pdf):
+        raise ValueError("unreadable page")
+
+    async def run():
+        manager = JobManager(str(tmp_path / "jobs.db"), workers=1)
+        manager.register("fail", fail)
+        await manager.start()
+        try:
+            job_id = await manager.submit("fail", {}, make_pdf(2), [1, 2])
+            return await wait_for_status(manager, job_id)
+        finally:
+            await manager.stop()
+
+    job = asyncio.run(run())
+    assert job["status"] == "failed"
+    assert job["error"] == "All pages failed"
+    assert [page["error"] for page in job["pages"]] == ["unreadable page", "unreadable page"]
+
+def test_job_manager_completes_job_with_some_failed_pages(tmp_path):
+    async def second_page_fails(params, page_pdf):
+        if PdfReader(io.BytesIO(page_pdf)).pages[0].mediabox.width == 101:
+            raise ValueError("bad page")
+        return {"ok": True}
+
+    async def run():
+        manager = JobManager(str(tmp_path / "jobs.db"), workers=1)
+        manager.register("partial", second_page_fails)
+        await manager.start()
+        try:
+            job_id = await manager.submit("partial", {}, make_pdf(3), [1, 2, 3])
+            return await wait_for_status(manager, job_id)
+        finally:
+            await manager.stop()
+
+    job = asyncio.run(run())
+    assert job["status"] == "completed"
+    assert [page["status"] for page in job["pages"]] == ["completed", "failed", "completed"]
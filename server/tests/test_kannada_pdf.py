@@ -0,0 +1,62 @@
+import io
+import os
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from PyPDF2 import PdfReader, PdfWriter
+
+import main_vllm
+from utils.output_cache import OutputCache
+
+def make_pdf(widths):
+    writer = PdfWriter()
+    for width in widths:
+        writer.add_blank_page(width, 200)
+    output = io.BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+def page_width(pdf_bytes):
+    return float(PdfReader(io.BytesIO(pdf_bytes)).pages[0].mediabox.width)
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = OutputCache(str(tmp_path), max_bytes=10 * 1024 * 1024)
+    monkeypatch.setattr(main_vllm, "output_cache", cache)
+    return cache
+
+def fake_upstream(monkeypatch, failing_width=None):
+    """Generate each page as a copy of its input page, failing the page of failing_width."""
+    async def post_upstream(request, url, files, data, headers):
+        page_pdf = files["file"][1]
+        if page_width(page_pdf) == failing_width:
+            return httpx.Response(422, request=httpx.Request("POST", url))
+        return httpx.Response(200, content=page_pdf, request=httpx.Request("POST", url))
+
+    monkeypatch.setattr(main_vllm, "post_upstream", post_upstream)
+
+def generate(client, widths):
+    return client.post(
+        "/v1/indic-custom-prompt-kannada-pdf",
+        files={"file": ("doc.pdf", make_pdf(widths), "application/pdf")},
+        data={"prompt": "translate", "src_lang": "eng_Latn", "pages": f"1-{len(widths)}"}
+    )
+
+def test_multi_page_document_is_cached_once_complete(cache, monkeypatch):
+    fake_upstream(monkeypatch)
+    response = generate(TestClient(main_vllm.app), [100, 101, 102])
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+    assert "content-location" not in response.headers
+    assert [float(page.mediabox.width) for page in PdfReader(io.BytesIO(response.content)).pages] == [100.0, 101.0, 102.0]
+    assert [name for name in os.listdir(cache.directory) if name.endswith(".pdf")]
+
+def test_later_page_failure_leaves_no_cache_entry(cache, monkeypatch):
+    fake_upstream(monkeypatch, failing_width=102)
+    # The first page succeeds, so the failure happens after the response has started
+    response = generate(TestClient(main_vllm.app, raise_server_exceptions=False), [100, 101, 102])
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+    assert "content-location" not in response.headers
+    assert os.listdir(cache.directory) == []
@@ -0,0 +1,66 @@
+import asyncio
+import os
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from utils.output_cache import OutputCache
+
+async def chunks(*parts):
+    for part in parts:
+        yield part
+
+def test_store_and_get(tmp_path):
+    cache = OutputCache(str(tmp_path), max_bytes=1024)
+    key = cache.key_for("audio/speech", "hello")
+    assert cache.get(key, ".mp3") is None
+    path = asyncio.run(cache.store(chunks(b"ab", b"cd"), key, ".mp3"))
+    assert cache.get(key, ".mp3") == path
+    assert open(path, "rb").read() == b"abcd"
+
+def test_key_for_separates_parts():
+    assert OutputCache.key_for("ab", "c") != OutputCache.key_for("a", "bc")
+
+def test_failed_stream_leaves_no_entry(tmp_path):
+    cache = OutputCache(str(tmp_path), max_bytes=1024)
+
+    async def failing():
+        yield b"partial"
+        raise RuntimeError("upstream failed")
+
+    key = cache.key_for("pdf")
+    try:
+        asyncio.run(cache.store(failing(), key, ".pdf"))
+    except RuntimeError:
+        pass
+    assert cache.get(key, ".pdf") is None
+    assert os.listdir(tmp_path) == []
+
+def test_prune_keeps_most_recently_used(tmp_path):
+    cache = OutputCache(str(tmp_path), max_bytes=10)
+    first, second = cache.key_for("first"), cache.key_for("second")
+    asyncio.run(cache.store(chunks(b"x" * 6), first, ".mp3"))
+    os.utime(cache.path_for(first, ".mp3"), (1, 1))
+    asyncio.run(cache.store(chunks(b"y" * 6), second, ".mp3"))
+    assert cache.get(first, ".mp3") is None
+    assert cache.get(second, ".mp3") is not None
+
+def test_file_response_treats_pruned_entry_as_miss(tmp_path):
+    cache = OutputCache(str(tmp_path), max_bytes=1024)
+    key = cache.key_for("audio/speech", "hello")
+    path = asyncio.run(cache.store(chunks(b"abcd"), key, ".mp3"))
+    app = FastAPI()
+
+    @app.get("/clip")
+    async def clip(request: Request):
+        response = cache.file_response(request, key, ".mp3", "audio/mp3")
+        return response if response is not None else {"miss": True}
+
+    client = TestClient(app)
+    response = client.get("/clip", headers={"Range": "bytes=1-2"})
+    assert response.status_code == 206
+    assert response.content == b"bc"
+    assert response.headers["etag"] == f'"{key}"'
+
+    os.unlink(path)
+    assert client.get("/clip").json() == {"miss": True}
@@ -0,0 +1,46 @@
+import io
+
+import pytest
+from PyPDF2 import PdfReader, PdfWriter
+
+from utils.pdf import extract_selected_pages, parse_page_selection, select_page_numbers
+
+def make_pdf(widths):
+    writer = PdfWriter()
+    for width in widths:
+        writer.add_blank_page(width, 200)
+    output = io.BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+def page_widths(pdf_bytes):
+    return [float(page.mediabox.width) for page in PdfReader(io.BytesIO(pdf_bytes)).pages]
+
+@pytest.mark.parametrize("selection, expected", [
+    ("3", [3]),
+    ("1-3", [1, 2, 3]),
+    ("5, 1-2,8", [1, 2, 5, 8]),
+    ("2-4,3-5", [2, 3, 4, 5]),
+    ("1-1,", [1]),
+    (" 7 - 8 ", [7, 8])
+])
+def test_parse_page_selection(selection, expected):
+    assert parse_page_selection(selection, 10) == expected
+
+@pytest.mark.parametrize("selection", ["", ",", "a", "1-2-3", "0", "4-2", "-3", "1.5"])
+def test_parse_page_selection_rejects_invalid_selections(selection):
+    with pytest.raises(ValueError):
+        parse_page_selection(selection, 10)
+
+def test_parse_page_selection_rejects_pages_past_the_end():
+    with pytest.raises(ValueError, match="out of range"):
+        parse_page_selection("9-11", 10)
+
+def test_select_page_numbers_defaults_to_every_page():
+    assert select_page_numbers(make_pdf([100, 101, 102])) == [1, 2, 3]
+    assert select_page_numbers(make_pdf([100, 101, 102]), "2-3") == [2, 3]
+
+def test_extract_selected_pages_returns_single_page_pdfs():
+    pages = extract_selected_pages(make_pdf([100, 101, 102]), "3,1")
+    assert [page_number for page_number, _ in pages] == [1, 3]
+    assert [page_widths(page_pdf) for _, page_pdf in pages] == [[100.0], [102.0]]
@@ -0,0 +1,42 @@
+import io
+
+import pytest
+from PyPDF2 import PdfReader, PdfWriter
+
+from utils.pdf import PdfStreamWriter
+
+def make_pdf(widths):
+    writer = PdfWriter()
+    for width in widths:
+        writer.add_blank_page(width, 200)
+    output = io.BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+def page_widths(pdf_bytes):
+    return [float(page.mediabox.width) for page in PdfReader(io.BytesIO(pdf_bytes)).pages]
+
+def test_pdf_stream_writer_assembles_pages_in_order():
+    writer = PdfStreamWriter()
+    document = writer.header()
+    document += writer.add_pages(make_pdf([100, 101]))
+    document += writer.add_pages(make_pdf([102]))
+    document += writer.finish()
+    assert page_widths(document) == [100.0, 101.0, 102.0]
+
+def test_pdf_stream_writer_cross_reference_offsets_point_at_objects():
+    writer = PdfStreamWriter()
+    document = writer.header() + writer.add_pages(make_pdf([100, 101])) + writer.finish()
+    reader = PdfReader(io.BytesIO(document), strict=True)
+    assert len(reader.pages) == 2
+    for number, offset in writer._offsets.items():
+        assert document[offset:].startswith(f"{number} 0 obj".encode())
+
+def test_pdf_stream_writer_without_pages():
+    writer = PdfStreamWriter()
+    document = writer.header() + writer.finish()
+    assert page_widths(document) == []
+
+def test_pdf_stream_writer_rejects_invalid_pdf():
+    with pytest.raises(ValueError):
+        PdfStreamWriter().add_pages(b"not a pdf")
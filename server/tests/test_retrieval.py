@@ -0,0 +1,36 @@
+from utils.retrieval import BM25Index, IndexCache, tokenize
+
+def test_tokenize_keeps_indic_words_whole():
+    assert tokenize("ಕರ್ನಾಟಕ ರಾಜ್ಯ") == ["ಕರ್ನಾಟಕ", "ರಾಜ್ಯ"]
+
+def test_tokenize_drops_danda_and_stopwords():
+    assert tokenize("भारत की राजधानी दिल्ली है।") == ["भारत", "की", "राजधानी", "दिल्ली", "है"]
+    assert tokenize("What is the Order Number?") == ["order", "number"]
+
+def test_bm25_ranks_matching_page_first():
+    index = BM25Index([
+        "The invoice lists the items shipped.",
+        "The order number is 801772347.",
+        "Terms and conditions apply."
+    ])
+    assert index.top_k("What is the order number?", 2) == [1]
+
+def test_bm25_matches_danda_terminated_pages():
+    index = BM25Index(["यह पृष्ठ खेती के बारे में है।", "भारत की राजधानी दिल्ली।", "कुछ और"])
+    scores = index.scores("दिल्ली")
+    assert scores[1] > 0 and scores[0] == scores[2] == 0
+    assert index.top_k("दिल्ली", 1) == [1]
+
+def test_bm25_falls_back_to_first_pages_without_matches():
+    index = BM25Index(["one", "two", "three"])
+    assert index.top_k("unrelated", 2) == [0, 1]
+
+def test_index_cache_evicts_least_recently_used():
+    cache = IndexCache(max_entries=2)
+    first, second, third = BM25Index(["a"]), BM25Index(["b"]), BM25Index(["c"])
+    cache.put("first", first)
+    cache.put("second", second)
+    assert cache.get("first") is first
+    cache.put("third", third)
+    assert cache.get("second") is None
+    assert cache.get("first") is first and cache.get("third") is third
@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+import utils.summarize as summarize_module
+from config.gateway_config import config as gateway_config
+from utils.summarize import (
+    estimate_tokens,
+    map_reduce_summarize,
+    pack_texts,
+    summarize_pages_text,
+    truncate_to_tokens
+)
+
+def test_pack_texts_groups_fit_the_budget():
+    texts = [f"page {index} " + "word " * 30 for index in range(20)]
+    groups = pack_texts(texts, max_tokens=100)
+    assert len(groups) > 1
+    assert all(estimate_tokens(group) <= 100 for group in groups)
+    assert "".join(groups).replace("\n\n", "") == "".join(texts)
+
+def test_pack_texts_splits_oversized_text_without_spaces():
+    groups = pack_texts(["ಕ" * 1000], max_tokens=50)
+    assert all(estimate_tokens(group) <= 50 for group in groups)
+    assert "".join(groups) == "ಕ" * 1000
+
+def test_truncate_to_tokens():
+    text = "word " * 100
+    assert estimate_tokens(truncate_to_tokens(text, 20)) <= 20
+    assert truncate_to_tokens("short", 20) == "short"
+
+def test_map_reduce_summarize_converges_under_budget():
+    calls = []
+
+    async def summarize(text, final):
+        calls.append((len(text), final))
+        return "summary " * 5
+
+    texts = ["text " * 200 for _ in range(30)]
+    summary = asyncio.run(map_reduce_summarize(texts, summarize, max_input_tokens=200))
+    assert summary == "summary " * 5
+    assert all(estimate_tokens("x" * length) <= 200 for length, _ in calls)
+    assert [final for _, final in calls].count(True) == 1
+    assert calls[-1][1] is True
+
+def test_map_reduce_summarize_converges_when_summaries_do_not_shrink():
+    calls = []
+
+    async def summarize(text, final):
+        calls.append(len(text))
+        # As long as its input, so packing alone never reduces the number of groups
+        return text
+
+    texts = ["text " * 150 for _ in range(8)]
+    asyncio.run(map_reduce_summarize(texts, summarize, max_input_tokens=200))
+    assert all(estimate_tokens("x" * length) <= 200 for length in calls)
+
+def test_map_reduce_summarize_skips_empty_input():
+    async def summarize(text, final):
+        raise AssertionError("no call expected")
+
+    assert asyncio.run(map_reduce_summarize(["", "  "], summarize, max_input_tokens=100)) == ""
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.data
+
+def test_summarize_pages_text_keeps_prompts_within_the_limit(monkeypatch):
+    prompts = []
+
+    async def fake_post(request, url, json, headers):
+        prompts.append(json)
+        return FakeResponse({"response": "short summary"})
+
+    monkeypatch.setattr(summarize_module, "post_upstream", fake_post)
+    pages = ["ಪುಟದ ಪಠ್ಯ " * 100 for _ in range(40)]
+    summary = asyncio.run(summarize_pages_text(pages, "Summarize in 3 sentences", "kan_Knda", "eng_Latn", "http://chat"))
+    assert summary == "short summary"
+    assert all(len(prompt["prompt"]) <= gateway_config.summary_max_prompt_chars for prompt in prompts)
+    # Only the final call applies the user's prompt and translates
+    assert [prompt["tgt_lang"] for prompt in prompts].count("eng_Latn") == 1
+    assert prompts[-1]["prompt"].startswith("Summarize in 3 sentences")
+
+def test_summarize_pages_text_rejects_prompt_without_room_for_text():
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(summarize_pages_text(["text"], "p" * gateway_config.summary_max_prompt_chars, "eng_Latn", "eng_Latn", "http://chat"))
+    assert error.value.status_code == 400
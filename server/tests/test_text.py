@@ -0,0 +1,48 @@
+import pytest
+
+from utils.text import split_sentences
+
+def sentences(text):
+    return [sentence for sentence, _ in split_sentences(text)[1]]
+
+def rebuild(text):
+    leading, segments = split_sentences(text)
+    return leading + "".join(sentence + whitespace for sentence, whitespace in segments)
+
+@pytest.mark.parametrize("text", [
+    "",
+    "   ",
+    "One. Two!  Three?\n",
+    "  Leading space. And trailing  ",
+    "ನಮಸ್ಕಾರ। ಹೇಗಿದ್ದೀರಿ? ಚೆನ್ನಾಗಿದ್ದೇನೆ॥",
+    "No final punctuation"
+])
+def test_split_sentences_rebuilds_text(text):
+    assert rebuild(text) == text
+
+def test_split_sentences_on_latin_punctuation():
+    assert sentences("One. Two!  Three?") == ["One.", "Two!", "Three?"]
+
+def test_split_sentences_on_danda():
+    assert sentences("ನಮಸ್ಕಾರ। ಹೇಗಿದ್ದೀರಿ?") == ["ನಮಸ್ಕಾರ।", "ಹೇಗಿದ್ದೀರಿ?"]
+
+def test_split_sentences_keeps_closing_quotes():
+    assert sentences('He said "Stop." Then he left.') == ['He said "Stop."', "Then he left."]
+
+def test_split_sentences_ignores_period_before_lowercase():
+    assert sentences("Bring fruit, e.g. mangoes. Thanks.") == ["Bring fruit, e.g. mangoes.", "Thanks."]
+
+@pytest.mark.parametrize("text, expected", [
+    ("Hello Dr. Smith. How are you?", ["Hello Dr. Smith.", "How are you?"]),
+    ("Mrs. Rao met Prof. Iyer.", ["Mrs. Rao met Prof. Iyer."]),
+    ("Smt. Lakshmi spoke. ನಮಸ್ಕಾರ।", ["Smt. Lakshmi spoke.", "ನಮಸ್ಕಾರ।"]),
+    ("I said no. Then I left.", ["I said no.", "Then I left."])
+])
+def test_split_sentences_does_not_split_after_titles(text, expected):
+    assert sentences(text) == expected
+
+def test_split_sentences_ends_on_title_at_end_of_text():
+    assert sentences("Ask the Dr.") == ["Ask the Dr."]
+
+def test_split_sentences_keeps_unterminated_remainder():
+    assert split_sentences("  First. Second part  ") == ("  ", [("First.", " "), ("Second part", "  ")])
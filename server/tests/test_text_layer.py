@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+
+from utils.text_layer import is_usable_text, script_for_language, usable_text_layer
+
+KANNADA = "ಕರ್ನಾಟಕ ರಾಜ್ಯದ ರಾಜಧಾನಿ ಬೆಂಗಳೂರು ನಗರವಾಗಿದೆ. " * 3
+ENGLISH = "The quarterly report lists revenue, expenses and the outlook for the year. " * 2
+
+@pytest.mark.parametrize("language, script", [
+    ("kan_Knda", "Knda"),
+    ("hin_Deva", "Deva"),
+    ("kannada", "Knda"),
+    ("English", "Latn"),
+    ("xyz_Zzzz", None),
+    ("klingon", None),
+    (None, None),
+    ("", None)
+])
+def test_script_for_language(language, script):
+    assert script_for_language(language) == script
+
+def test_usable_text_in_expected_script():
+    assert is_usable_text(KANNADA, "Knda")
+    assert is_usable_text(ENGLISH, "Latn")
+
+def test_too_little_text_is_not_usable():
+    assert not is_usable_text("ಕರ್ನಾಟಕ", "Knda")
+
+def test_text_in_wrong_script_is_not_usable():
+    # Legacy Kannada fonts extract as Latin letters
+    assert not is_usable_text(ENGLISH, "Knda")
+
+def test_garbage_characters_make_text_unusable():
+    assert not is_usable_text(KANNADA + "\ue000" * 20, "Knda")
+    assert not is_usable_text(KANNADA + "\ufffd" * 20, "Knda")
+
+def test_orphaned_vowel_signs_make_text_unusable():
+    # Vowel signs separated from their consonants by broken glyph ordering
+    detached = " ".join("ಾಕಿರ" for _ in range(20))
+    assert not is_usable_text(detached, "Knda")
+
+def test_usable_text_layer_needs_a_known_language():
+    assert asyncio.run(usable_text_layer(b"%PDF", None)) is None
+    assert asyncio.run(usable_text_layer(b"%PDF", "klingon")) is None
+
+def test_usable_text_layer_ignores_unreadable_pdf():
+    assert asyncio.run(usable_text_layer(b"not a pdf", "kan_Knda")) is None
@@ -0,0 +1,95 @@
+import asyncio
+
+import httpx
+import pytest
+
+import utils.translation as translation
+from utils.translation import TranslationBatcher
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Fake /v1/translate that records each call and fails batches containing "BOOM"."""
+    calls = []
+
+    async def post_upstream(request, url, json, headers):
+        calls.append(list(json["sentences"]))
+        upstream_request = httpx.Request("POST", url)
+        if any("BOOM" in sentence for sentence in json["sentences"]):
+            return httpx.Response(500, request=upstream_request)
+        return httpx.Response(200, json={"translations": [f"T({s})" for s in json["sentences"]]}, request=upstream_request)
+
+    monkeypatch.setattr(translation, "post_upstream", post_upstream)
+    return calls
+
+def test_concurrent_calls_share_one_upstream_request(upstream):
+    batcher = TranslationBatcher(window=0.05, max_batch_size=64)
+
+    async def run():
+        return await asyncio.gather(
+            batcher.translate(["one", "two"], "eng_Latn", "kan_Knda"),
+            batcher.translate(["three"], "eng_Latn", "kan_Knda")
+        )
+
+    assert asyncio.run(run()) == [["T(one)", "T(two)"], ["T(three)"]]
+    assert len(upstream) == 1
+
+def test_language_pairs_are_batched_separately(upstream):
+    batcher = TranslationBatcher(window=0.05, max_batch_size=64)
+
+    async def run():
+        return await asyncio.gather(
+            batcher.translate(["one"], "eng_Latn", "kan_Knda"),
+            batcher.translate(["two"], "eng_Latn", "hin_Deva")
+        )
+
+    assert asyncio.run(run()) == [["T(one)"], ["T(two)"]]
+    assert len(upstream) == 2
+
+def test_full_batch_is_sent_before_the_window_closes(upstream):
+    batcher = TranslationBatcher(window=10, max_batch_size=2)
+
+    async def run():
+        return await asyncio.wait_for(batcher.translate(["one", "two"], "eng_Latn", "kan_Knda"), timeout=1)
+
+    assert asyncio.run(run()) == ["T(one)", "T(two)"]
+
+def test_batch_error_retries_each_request_alone(upstream):
+    batcher = TranslationBatcher(window=0.05, max_batch_size=64)
+
+    async def run():
+        return await asyncio.gather(
+            batcher.translate(["good"], "eng_Latn", "kan_Knda"),
+            batcher.translate(["BOOM"], "eng_Latn", "kan_Knda"),
+            return_exceptions=True
+        )
+
+    good, bad = asyncio.run(run())
+    assert good == ["T(good)"]
+    assert isinstance(bad, httpx.HTTPStatusError)
+    # The shared batch, then each request on its own
+    assert len(upstream) == 3
+
+def test_zero_window_disables_batching(upstream):
+    batcher = TranslationBatcher(window=0, max_batch_size=64)
+
+    async def run():
+        return await asyncio.gather(
+            batcher.translate(["one"], "eng_Latn", "kan_Knda"),
+            batcher.translate(["two"], "eng_Latn", "kan_Knda")
+        )
+
+    assert asyncio.run(run()) == [["T(one)"], ["T(two)"]]
+    assert len(upstream) == 2
+
+def test_cancelled_caller_does_not_abort_the_batch(upstream):
+    batcher = TranslationBatcher(window=0.05, max_batch_size=64)
+
+    async def run():
+        cancelled = asyncio.create_task(batcher.translate(["gone"], "eng_Latn", "kan_Knda"))
+        kept = asyncio.create_task(batcher.translate(["kept"], "eng_Latn", "kan_Knda"))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        return await kept
+
+    assert asyncio.run(run()) == ["T(kept)"]
+    assert upstream == [["kept"]]
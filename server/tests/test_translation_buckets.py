@@ -0,0 +1,52 @@
+import asyncio
+
+import httpx
+import pytest
+
+import utils.translation as translation
+from config.gateway_config import config as gateway_config
+from utils.translation import length_buckets, translate_deduplicated
+
+def test_length_buckets_group_similar_lengths_shortest_first():
+    sentences = ["a" * 100, "bb", "c" * 40, "dd", "e" * 90]
+    assert length_buckets(sentences, bucket_size=16) == [["bb", "dd"], ["c" * 40], ["e" * 90, "a" * 100]]
+
+def test_length_buckets_respect_bucket_size():
+    buckets = length_buckets([f"s{index}" for index in range(5)], bucket_size=2)
+    assert [len(bucket) for bucket in buckets] == [2, 2, 1]
+
+def test_length_buckets_keep_every_sentence():
+    sentences = [word * length for length in (1, 5, 20, 50, 3) for word in "xy"]
+    assert sorted(sum(length_buckets(sentences, bucket_size=3), [])) == sorted(sentences)
+
+@pytest.fixture
+def upstream(monkeypatch):
+    calls = []
+
+    async def post_upstream(request, url, json, headers):
+        calls.append(list(json["sentences"]))
+        return httpx.Response(
+            200,
+            json={"translations": [f"T({s})" for s in json["sentences"]]},
+            request=httpx.Request("POST", url)
+        )
+
+    monkeypatch.setattr(translation, "post_upstream", post_upstream)
+    return calls
+
+def test_translate_deduplicated_maps_translations_back_to_positions(upstream, monkeypatch):
+    monkeypatch.setattr(gateway_config, "translate_bucket_size", 2)
+    sentences = ["hello", "a much longer sentence than the others", "hello", "hi", "bye", "hi"]
+    result = asyncio.run(translate_deduplicated(sentences, "eng_Latn", "kan_Knda"))
+    assert result == [f"T({sentence})" for sentence in sentences]
+    sent = sum(upstream, [])
+    assert sorted(sent) == sorted(set(sentences))
+    assert all(len(call) <= 2 for call in upstream)
+
+def test_translate_deduplicated_rejects_short_upstream_response(monkeypatch):
+    async def post_upstream(request, url, json, headers):
+        return httpx.Response(200, json={"translations": ["only one"]}, request=httpx.Request("POST", url))
+
+    monkeypatch.setattr(translation, "post_upstream", post_upstream)
+    with pytest.raises(ValueError):
+        asyncio.run(translate_deduplicated(["one", "two"], "eng_Latn", "kan_Knda"))
@@ -0,0 +1,74 @@
+import asyncio
+import io
+import os
+import zipfile
+
+from fastapi import HTTPException
+
+def read_zip_entries(archive: bytes, max_entries: int, max_bytes: int) -> list[tuple[str, bytes]]:
+    """Return (name, content) for every file in a zip archive, in archive order.
+
+    Directories and macOS resource forks are skipped. Raises ValueError for
+    invalid, encrypted or unsupported archives and for archives over the entry
+    or uncompressed size limits.
+    """
+    try:
+        with zipfile.ZipFile(io.BytesIO(archive)) as zf:
+            infos = [
+                info for info in zf.infolist()
+                if not info.is_dir()
+                and not info.filename.startswith("__MACOSX/")
+                and not os.path.basename(info.filename).startswith("._")
+            ]
+            if not infos:
+                raise ValueError("Archive contains no files")
+            if len(infos) > max_entries:
+                raise ValueError(f"Archive contains {len(infos)} files, at most {max_entries} are allowed")
+            if sum(info.file_size for info in infos) > max_bytes:
+                raise ValueError(f"Archive is larger than {max_bytes // (1024 * 1024)} MB uncompressed")
+            return [(info.filename, zf.read(info)) for info in infos]
+    except zipfile.BadZipFile as e:
+        raise ValueError(f"Invalid zip archive: {str(e)}") from e
+    except (RuntimeError, NotImplementedError) as e:
+        # Encrypted entries and unsupported compression methods
+        raise ValueError(f"Unsupported zip archive: {str(e)}") from e
+
+class ZipStreamWriter:
+    """Build a zip archive incrementally, returning the bytes of each entry as it is added.
+
+    zipfile falls back to data descriptors when its output cannot seek, so
+    the archive can be streamed without knowing all entries up front.
+    Entries are stored uncompressed, as they are typically audio or images.
+    """
+
+    def __init__(self):
+        self._chunks = []
+        self._zip = zipfile.ZipFile(self, "w", compression=zipfile.ZIP_STORED)
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def _drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+    def add(self, name: str, content: bytes) -> bytes:
+        self._zip.writestr(name, content)
+        return self._drain()
+
+    def close(self) -> bytes:
+        """Write the central directory and return the final bytes of the archive."""
+        self._zip.close()
+        return self._drain()
+
+async def zip_entries(archive: bytes, max_entries: int, max_bytes: int) -> list[tuple[str, bytes]]:
+    """Unpack an uploaded zip archive in a worker thread, rejecting invalid ones with a 400."""
+    try:
+        return await asyncio.to_thread(read_zip_entries, archive, max_entries, max_bytes)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -0,0 +1,32 @@
+import array
+import io
+import sys
+import wave
+
+def pcm_to_wav(pcm: bytes, sample_rate: int = 16000, channels: int = 1, sample_width: int = 2) -> bytes:
+    """Wrap raw little-endian PCM samples in a WAV container."""
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(channels)
+        wav_file.setsampwidth(sample_width)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(pcm)
+    return buffer.getvalue()
+
+def quietest_offset(pcm: bytes, start: int, end: int, sample_rate: int = 16000, frame_ms: int = 20) -> int:
+    """Return the byte offset of the quietest frame of 16-bit mono PCM between start and end.
+
+    Used to cut a stream into segments between words rather than through
+    them. Offsets are frame aligned; end is returned when the range holds
+    less than one frame.
+    """
+    frame_bytes = sample_rate * frame_ms // 1000 * 2
+    best_offset, best_energy = end, None
+    for offset in range(start - start % 2, end - frame_bytes + 1, frame_bytes):
+        samples = array.array("h", pcm[offset:offset + frame_bytes])
+        if sys.byteorder == "big":
+            samples.byteswap()
+        energy = sum(abs(sample) for sample in samples)
+        if best_energy is None or energy < best_energy:
+            best_offset, best_energy = offset, energy
+    return best_offset
@@ -0,0 +1,127 @@
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, List, Sequence, Tuple, TypeVar, Union
+
+import httpx
+from fastapi import HTTPException
+
+from config.logging_config import logger
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+def is_retryable(error: Exception) -> bool:
+    """Connection problems, timeouts and upstream 5xx responses are worth retrying.
+
+    An HTTPException raised while handling an upstream error (as the TTS
+    service does) is judged by that underlying error.
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    if isinstance(error, HTTPException):
+        cause = error.__cause__ or error.__context__
+        return cause is not None and is_retryable(cause)
+    return isinstance(error, httpx.TransportError)
+
+async def _call_with_retries(
+    func: Callable[[T], Awaitable[R]],
+    index: int,
+    item: T,
+    semaphore: asyncio.Semaphore,
+    retries: int,
+    retry_backoff: float
+) -> R:
+    for attempt in range(retries + 1):
+        try:
+            async with semaphore:
+                return await func(item)
+        except Exception as e:
+            if attempt == retries or not is_retryable(e):
+                raise
+            delay = retry_backoff * 2 ** attempt
+            logger.warning(f"Item {index} failed ({str(e) or type(e).__name__}), retrying in {delay:.2f} seconds")
+        # Back off without holding a slot so other items keep flowing
+        await asyncio.sleep(delay)
+
+async def map_concurrently(
+    func: Callable[[T], Awaitable[R]],
+    items: Sequence[T],
+    concurrency: int,
+    retries: int = 0,
+    retry_backoff: float = 0.5,
+    return_exceptions: bool = False
+) -> List[R]:
+    """Run func over items with at most `concurrency` calls in flight.
+
+    Results are returned in the order of items, regardless of completion
+    order. Each item is retried up to `retries` times on retryable errors,
+    with exponential backoff. If any item finally fails, the remaining calls
+    are cancelled and the error is raised, unless return_exceptions is set,
+    in which case the error takes the item's place in the results.
+    """
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+    tasks = [
+        asyncio.create_task(_call_with_retries(func, index, item, semaphore, retries, retry_backoff))
+        for index, item in enumerate(items)
+    ]
+    try:
+        return await asyncio.gather(*tasks, return_exceptions=return_exceptions)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+async def iterate_concurrently(
+    func: Callable[[T], Awaitable[R]],
+    items: Sequence[T],
+    concurrency: int,
+    retries: int = 0,
+    retry_backoff: float = 0.5
+) -> AsyncIterator[R]:
+    """Like map_concurrently, but yield each result as soon as it and all earlier ones are done.
+
+    Results are yielded in the order of items while later items keep running,
+    so a consumer can stream output progressively. A failure is raised when
+    its turn comes; closing the iterator cancels the calls still in flight.
+    """
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+    tasks = [
+        asyncio.create_task(_call_with_retries(func, index, item, semaphore, retries, retry_backoff))
+        for index, item in enumerate(items)
+    ]
+    try:
+        for task in tasks:
+            yield await task
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+async def iterate_as_completed(
+    func: Callable[[T], Awaitable[R]],
+    items: Sequence[T],
+    concurrency: int,
+    retries: int = 0,
+    retry_backoff: float = 0.5
+) -> AsyncIterator[Tuple[int, Union[R, Exception]]]:
+    """Run func over items like map_concurrently, yielding (index, result) pairs as calls complete.
+
+    A failed item yields its exception in place of a result, so one failure
+    does not stop the others. Closing the iterator cancels the calls still
+    in flight.
+    """
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+    async def run(index: int, item: T) -> Tuple[int, Union[R, Exception]]:
+        try:
+            return index, await _call_with_retries(func, index, item, semaphore, retries, retry_backoff)
+        except Exception as e:
+            return index, e
+
+    tasks = [asyncio.create_task(run(index, item)) for index, item in enumerate(items)]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
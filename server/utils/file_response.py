@@ -0,0 +1,98 @@
+import os
+import re
+from typing import BinaryIO, Iterator, Optional
+
+from fastapi import Request
+from fastapi.responses import Response, StreamingResponse
+
+_RANGE_PATTERN = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+def _file_chunks(f: BinaryIO, start: int, end: int, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    with f:
+        f.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = f.read(min(chunk_size, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+def _parse_range(range_header: str, size: int) -> Optional[tuple]:
+    """Return (start, end) for a single byte range, or None if it cannot be served as one.
+
+    Raises ValueError when the range is syntactically valid but unsatisfiable.
+    """
+    match = _RANGE_PATTERN.match(range_header.strip())
+    if not match:
+        return None  # Multiple or malformed ranges are answered with the full body
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        # Suffix range: the final N bytes
+        length = int(last)
+        if length == 0:
+            raise ValueError("Empty suffix range")
+        return max(size - length, 0), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError("Range not satisfiable")
+    return start, end
+
+def ranged_file_response(
+    request: Request,
+    path: str,
+    media_type: str,
+    etag: Optional[str] = None,
+    headers: Optional[dict] = None
+) -> Response:
+    """Serve a file with Accept-Ranges/Range, If-Range and If-None-Match support.
+
+    ``etag`` should identify the file content (e.g. its cache key); it is sent as
+    a strong validator. Without it, Range requests are still honoured but
+    If-Range never matches. The file is opened before returning, so it may be
+    deleted while the response streams; raises FileNotFoundError if it is
+    already gone.
+    """
+    f = open(path, "rb")
+    size = os.fstat(f.fileno()).st_size
+    response_headers = dict(headers or {})
+    response_headers["Accept-Ranges"] = "bytes"
+    if etag:
+        response_headers["ETag"] = f'"{etag}"'
+
+    if_none_match = request.headers.get("if-none-match")
+    if etag and if_none_match and (if_none_match.strip() == "*" or response_headers["ETag"] in [
+        tag.strip().removeprefix("W/") for tag in if_none_match.split(",")
+    ]):
+        f.close()
+        return Response(status_code=304, headers={k: v for k, v in response_headers.items() if k != "Content-Disposition"})
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    # A stale If-Range validator means the client's partial copy is outdated: send everything
+    if range_header and (not if_range or (etag and if_range.strip() == response_headers["ETag"])):
+        try:
+            byte_range = _parse_range(range_header, size)
+        except ValueError:
+            f.close()
+            return Response(status_code=416, headers={**response_headers, "Content-Range": f"bytes */{size}"})
+        if byte_range:
+            start, end = byte_range
+            response_headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+            response_headers["Content-Length"] = str(end - start + 1)
+            return StreamingResponse(
+                _file_chunks(f, start, end),
+                status_code=206,
+                media_type=media_type,
+                headers=response_headers
+            )
+
+    response_headers["Content-Length"] = str(size)
+    return StreamingResponse(
+        _file_chunks(f, 0, size - 1),
+        media_type=media_type,
+        headers=response_headers
+    )
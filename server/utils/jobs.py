@@ -0,0 +1,245 @@
+import asyncio
+import json
+import sqlite3
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from time import time
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from config.gateway_config import config as gateway_config
+from config.logging_config import logger
+from utils.fanout import map_concurrently
+from utils.pdf import extract_selected_pages
+
+# A page handler receives the job parameters and a single-page PDF and returns that page's result
+PageHandler = Callable[[dict, bytes], Awaitable[dict]]
+
+TERMINAL_STATUSES = ("completed", "failed")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    operation TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL,
+    error TEXT,
+    input BLOB,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS job_pages (
+    job_id TEXT NOT NULL REFERENCES jobs(id),
+    page_number INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    finished_at REAL,
+    PRIMARY KEY (job_id, page_number)
+);
+"""
+
+class JobStore:
+    """SQLite store for document jobs, their input PDF and per-page results.
+
+    Every finished page is committed as soon as it completes, so a restart
+    only has to redo the pages that were still pending. The input PDF is
+    dropped once a job reaches a terminal status.
+    """
+
+    def __init__(self, path: str):
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def create_job(self, operation: str, params: dict, input_pdf: bytes, page_numbers: List[int]) -> str:
+        job_id = uuid.uuid4().hex
+        now = time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO jobs (id, operation, params, status, input, created_at, updated_at) VALUES (?, ?, ?, 'queued', ?, ?, ?)",
+                (job_id, operation, json.dumps(params), input_pdf, now, now)
+            )
+            self._conn.executemany(
+                "INSERT INTO job_pages (job_id, page_number, status) VALUES (?, ?, 'pending')",
+                [(job_id, page_number) for page_number in page_numbers]
+            )
+        return job_id
+
+    def unfinished_job_ids(self) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id FROM jobs WHERE status IN ('queued', 'running') ORDER BY created_at"
+            ).fetchall()
+        return [row["id"] for row in rows]
+
+    def get_job(self, job_id: str, include_input: bool = False) -> Optional[dict]:
+        with self._lock:
+            job = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if job is None:
+                return None
+            pages = self._conn.execute(
+                "SELECT page_number, status, result, error FROM job_pages WHERE job_id = ? ORDER BY page_number",
+                (job_id,)
+            ).fetchall()
+        return {
+            "job_id": job["id"],
+            "operation": job["operation"],
+            "params": json.loads(job["params"]),
+            "status": job["status"],
+            "error": job["error"],
+            "created_at": job["created_at"],
+            "updated_at": job["updated_at"],
+            "input": job["input"] if include_input else None,
+            "pages": [
+                {
+                    "page_number": page["page_number"],
+                    "status": page["status"],
+                    "result": json.loads(page["result"]) if page["result"] else None,
+                    "error": page["error"]
+                } for page in pages
+            ]
+        }
+
+    def set_status(self, job_id: str, status: str, error: Optional[str] = None):
+        with self._lock, self._conn:
+            if status in TERMINAL_STATUSES:
+                self._conn.execute(
+                    "UPDATE jobs SET status = ?, error = ?, input = NULL, updated_at = ? WHERE id = ?",
+                    (status, error, time(), job_id)
+                )
+            else:
+                self._conn.execute(
+                    "UPDATE jobs SET status = ?, error = ?, updated_at = ? WHERE id = ?",
+                    (status, error, time(), job_id)
+                )
+
+    def finish_page(self, job_id: str, page_number: int, result: Optional[dict] = None, error: Optional[str] = None):
+        now = time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE job_pages SET status = ?, result = ?, error = ?, finished_at = ? WHERE job_id = ? AND page_number = ?",
+                ("failed" if error else "completed", json.dumps(result) if result is not None else None, error, now, job_id, page_number)
+            )
+            self._conn.execute("UPDATE jobs SET updated_at = ? WHERE id = ?", (now, job_id))
+
+class JobManager:
+    """Runs queued document jobs on a fixed number of workers.
+
+    Each job processes its pending pages through the handler registered for
+    its operation, with the same bounded per-page fan-out and retries as the
+    synchronous endpoints. Jobs left queued or running by a previous process
+    are picked up again on start.
+    """
+
+    def __init__(self, db_path: str, workers: int):
+        self.db_path = db_path
+        self.workers = workers
+        self._handlers: Dict[str, PageHandler] = {}
+        self._store: Optional[JobStore] = None
+        # Store calls run here, so stop() can wait for the ones in flight before closing the database
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def operations(self) -> List[str]:
+        return list(self._handlers)
+
+    def register(self, operation: str, handler: PageHandler):
+        self._handlers[operation] = handler
+
+    async def _call(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def start(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="job-store")
+        self._store = await self._call(JobStore, self.db_path)
+        self._queue = asyncio.Queue()
+        for job_id in await self._call(self._store.unfinished_job_ids):
+            logger.info(f"Resuming job {job_id}")
+            self._queue.put_nowait(job_id)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(max(self.workers, 1))]
+
+    async def stop(self):
+        # Interrupted jobs stay queued/running in the store and resume on the next start
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._executor is not None:
+            # A cancelled worker may have left a store call running in the executor
+            await asyncio.to_thread(self._executor.shutdown, wait=True)
+            self._executor = None
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+    async def submit(self, operation: str, params: dict, input_pdf: bytes, page_numbers: List[int]) -> str:
+        job_id = await self._call(self._store.create_job, operation, params, input_pdf, page_numbers)
+        self._queue.put_nowait(job_id)
+        logger.info(f"Queued job {job_id}: {operation}, {len(page_numbers)} pages")
+        return job_id
+
+    async def get(self, job_id: str) -> Optional[dict]:
+        return await self._call(self._store.get_job, job_id)
+
+    async def _worker(self):
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run_job(job_id)
+            except Exception as e:
+                logger.error(f"Job {job_id} failed: {str(e)}")
+                await self._call(self._store.set_status, job_id, "failed", str(e))
+            finally:
+                self._queue.task_done()
+
+    async def _run_job(self, job_id: str):
+        job = await self._call(self._store.get_job, job_id, True)
+        if job is None or job["status"] in TERMINAL_STATUSES:
+            return
+        handler = self._handlers.get(job["operation"])
+        if handler is None:
+            raise ValueError(f"Unknown job operation: {job['operation']}")
+
+        start_time = time()
+        await self._call(self._store.set_status, job_id, "running")
+        pending = [page["page_number"] for page in job["pages"] if page["status"] == "pending"]
+        if pending:
+            page_pdfs = await asyncio.to_thread(extract_selected_pages, job["input"], ",".join(map(str, pending)))
+
+            async def run_page(page: tuple):
+                page_number, page_pdf = page
+                result = await handler(job["params"], page_pdf)
+                await self._call(self._store.finish_page, job_id, page_number, result)
+
+            outcomes = await map_concurrently(
+                run_page,
+                page_pdfs,
+                concurrency=gateway_config.pdf_page_concurrency,
+                retries=gateway_config.pdf_page_retries,
+                retry_backoff=gateway_config.pdf_page_retry_backoff,
+                return_exceptions=True
+            )
+            for (page_number, _), outcome in zip(page_pdfs, outcomes):
+                if isinstance(outcome, Exception):
+                    logger.error(f"Job {job_id} page {page_number} failed: {str(outcome)}")
+                    await self._call(self._store.finish_page, job_id, page_number, None, str(outcome) or type(outcome).__name__)
+
+        pages = (await self._call(self._store.get_job, job_id))["pages"]
+        if pages and all(page["status"] == "failed" for page in pages):
+            await self._call(self._store.set_status, job_id, "failed", "All pages failed")
+            logger.error(f"Job {job_id} failed: all {len(pages)} pages failed")
+            return
+        await self._call(self._store.set_status, job_id, "completed")
+        logger.info(f"Job {job_id} completed in {time() - start_time:.2f} seconds, pages processed: {len(pending)}")
+
+job_manager = JobManager(gateway_config.job_db_path, gateway_config.job_workers)
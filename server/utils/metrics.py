@@ -0,0 +1,48 @@
+from collections import defaultdict
+
+# In-memory metrics storage, exposed through /v1/metrics
+METRICS = {
+    "cancelled_requests": 0,
+    "cancelled_upstream_seconds": 0.0,
+    "cancelled_by_endpoint": defaultdict(int),
+    "translate_batches": 0,
+    "translate_batched_requests": 0,
+    "translate_batched_sentences": 0,
+    "translate_max_batch_sentences": 0,
+    "translate_batch_wait_seconds": 0.0,
+    "translate_max_batch_wait_seconds": 0.0,
+    "translate_duplicate_sentences": 0
+}
+
+def record_cancellation(endpoint: str, elapsed: float):
+    """Count upstream work abandoned because the client disconnected.
+
+    ``elapsed`` is how long the upstream call had been running; the GPU time
+    saved is whatever the call would have needed beyond that.
+    """
+    METRICS["cancelled_requests"] += 1
+    METRICS["cancelled_upstream_seconds"] += elapsed
+    METRICS["cancelled_by_endpoint"][endpoint] += 1
+
+def record_translation_batch(requests: int, sentences: int, waits: list):
+    """Record one batched upstream translate call.
+
+    ``waits`` holds how long each request in the batch waited for it to be
+    sent; mean batch size and wait follow from the totals.
+    """
+    METRICS["translate_batches"] += 1
+    METRICS["translate_batched_requests"] += requests
+    METRICS["translate_batched_sentences"] += sentences
+    METRICS["translate_max_batch_sentences"] = max(METRICS["translate_max_batch_sentences"], sentences)
+    METRICS["translate_batch_wait_seconds"] += sum(waits)
+    METRICS["translate_max_batch_wait_seconds"] = max(METRICS["translate_max_batch_wait_seconds"], *waits)
+
+def record_translation_duplicates(count: int):
+    """Count sentences answered from a duplicate in the same batch instead of being translated again."""
+    METRICS["translate_duplicate_sentences"] += count
+
+def metrics_snapshot() -> dict:
+    return {
+        key: dict(value) if isinstance(value, dict) else value
+        for key, value in METRICS.items()
+    }
@@ -0,0 +1,118 @@
+import hashlib
+import os
+from typing import AsyncIterator, Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from config.gateway_config import config as gateway_config
+from config.logging_config import logger
+from utils.file_response import ranged_file_response
+
+class OutputCache:
+    """Disk cache for generated outputs (PDFs, audio), keyed by a hash of the request.
+
+    Entries are written to a ``.part`` file while they stream and only become
+    visible once complete, so a failed or cancelled download never leaves a
+    truncated entry behind. The least recently used entries are pruned when the
+    cache grows beyond ``max_bytes``.
+    """
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        if self.enabled:
+            os.makedirs(directory, exist_ok=True)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.directory)
+
+    @staticmethod
+    def key_for(*parts) -> str:
+        digest = hashlib.sha256()
+        for part in parts:
+            data = part if isinstance(part, bytes) else str(part).encode("utf-8")
+            # Length prefix keeps ("ab", "c") and ("a", "bc") distinct
+            digest.update(len(data).to_bytes(8, "big"))
+            digest.update(data)
+        return digest.hexdigest()
+
+    def path_for(self, key: str, suffix: str) -> str:
+        return os.path.join(self.directory, f"{key}{suffix}")
+
+    def get(self, key: str, suffix: str) -> Optional[str]:
+        if not self.enabled:
+            return None
+        path = self.path_for(key, suffix)
+        try:
+            os.utime(path)  # Mark as recently used
+        except FileNotFoundError:
+            return None
+        return path
+
+    def file_response(
+        self,
+        request: Request,
+        key: str,
+        suffix: str,
+        media_type: str,
+        headers: Optional[dict] = None
+    ) -> Optional[Response]:
+        """Serve the entry for key with ranged_file_response, or return None when it is not cached."""
+        path = self.get(key, suffix)
+        if path is None:
+            return None
+        try:
+            return ranged_file_response(request, path, media_type, etag=key, headers=headers)
+        except FileNotFoundError:
+            # Pruned by another request after the lookup
+            return None
+
+    async def tee(self, chunks: AsyncIterator[bytes], key: str, suffix: str) -> AsyncIterator[bytes]:
+        """Yield chunks unchanged while writing them to the cache entry for key."""
+        path = self.path_for(key, suffix)
+        part_path = f"{path}.{os.getpid()}.{id(chunks)}.part"
+        committed = False
+        try:
+            with open(part_path, "wb") as f:
+                async for chunk in chunks:
+                    f.write(chunk)
+                    yield chunk
+            os.replace(part_path, path)
+            committed = True
+            logger.info(f"Cached generated output: {path}")
+        finally:
+            if not committed and os.path.exists(part_path):
+                os.unlink(part_path)
+        self.prune()
+
+    async def store(self, chunks: AsyncIterator[bytes], key: str, suffix: str) -> str:
+        """Write chunks to the cache entry for key and return its path."""
+        async for _ in self.tee(chunks, key, suffix):
+            pass
+        return self.path_for(key, suffix)
+
+    def prune(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(".part"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+                total -= size
+                logger.info(f"Pruned cached output: {path}")
+            except OSError as e:
+                logger.error(f"Failed to prune cached output {path}: {str(e)}")
+
+output_cache = OutputCache(gateway_config.output_cache_dir, gateway_config.output_cache_max_mb * 1024 * 1024)
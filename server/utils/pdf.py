@@ -0,0 +1,215 @@
+import asyncio
+import io
+from typing import Optional
+
+from fastapi import HTTPException
+from PyPDF2 import PdfReader, PdfWriter
+from PyPDF2.generic import ArrayObject, DictionaryObject, IndirectObject, NameObject
+
+def _read_pdf(pdf_bytes: bytes) -> PdfReader:
+    try:
+        reader = PdfReader(io.BytesIO(pdf_bytes))
+        if reader.is_encrypted:
+            raise ValueError("Encrypted PDFs are not supported")
+        len(reader.pages)  # Forces the page tree to be parsed
+        return reader
+    except ValueError:
+        raise
+    except Exception as e:
+        # PyPDF2 raises a variety of errors for malformed documents
+        raise ValueError(f"Invalid PDF file: {str(e)}") from e
+
+def _page_to_pdf(reader: PdfReader, index: int) -> bytes:
+    writer = PdfWriter()
+    writer.add_page(reader.pages[index])
+    output = io.BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+def extract_page(pdf_bytes: bytes, page_number: int) -> bytes:
+    """Return a standalone PDF containing only page_number (1-based) of pdf_bytes.
+
+    Raises ValueError if the document cannot be read or the page does not exist.
+    """
+    reader = _read_pdf(pdf_bytes)
+    page_count = len(reader.pages)
+    if page_number < 1 or page_number > page_count:
+        raise ValueError(f"Page number {page_number} is out of range, PDF has {page_count} pages")
+    return _page_to_pdf(reader, page_number - 1)
+
+def split_pages(pdf_bytes: bytes) -> list[bytes]:
+    """Split pdf_bytes into one standalone PDF per page, in page order."""
+    reader = _read_pdf(pdf_bytes)
+    if not reader.pages:
+        raise ValueError("PDF has no pages")
+    return [_page_to_pdf(reader, index) for index in range(len(reader.pages))]
+
+def parse_page_selection(selection: str, page_count: int) -> list[int]:
+    """Parse a selection such as "1-5,8" into sorted, unique 1-based page numbers.
+
+    Raises ValueError for malformed selections and pages outside the document.
+    """
+    page_numbers = set()
+    for part in selection.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        bounds = part.split("-")
+        if len(bounds) > 2 or not all(bound.strip().isdigit() for bound in bounds):
+            raise ValueError(f"Invalid page selection: '{part}'")
+        first, last = int(bounds[0]), int(bounds[-1])
+        if first < 1 or first > last:
+            raise ValueError(f"Invalid page range: '{part}'")
+        if last > page_count:
+            raise ValueError(f"Page number {last} is out of range, PDF has {page_count} pages")
+        page_numbers.update(range(first, last + 1))
+    if not page_numbers:
+        raise ValueError("Page selection cannot be empty")
+    return sorted(page_numbers)
+
+def select_page_numbers(pdf_bytes: bytes, selection: Optional[str] = None) -> list[int]:
+    """Return the page numbers in selection, or every page of the document when selection is None."""
+    page_count = len(_read_pdf(pdf_bytes).pages)
+    if selection is None:
+        if not page_count:
+            raise ValueError("PDF has no pages")
+        return list(range(1, page_count + 1))
+    return parse_page_selection(selection, page_count)
+
+def extract_selected_pages(pdf_bytes: bytes, selection: str) -> list[tuple[int, bytes]]:
+    """Return (page_number, single-page PDF) pairs for the pages in selection."""
+    reader = _read_pdf(pdf_bytes)
+    page_numbers = parse_page_selection(selection, len(reader.pages))
+    return [(page_number, _page_to_pdf(reader, page_number - 1)) for page_number in page_numbers]
+
+class PdfStreamWriter:
+    """Assemble a PDF from other PDFs' pages while emitting it incrementally.
+
+    Each call to add_pages returns the serialized objects of the appended
+    pages, so the document can be streamed as its pages become available;
+    finish returns the page tree, catalog and cross-reference table that
+    complete it. Annotations are dropped, as their links point into the
+    source documents.
+    """
+
+    _CATALOG = 1
+    _PAGE_TREE = 2
+
+    def __init__(self):
+        self._offsets = {}
+        self._position = 0
+        self._next_number = self._PAGE_TREE + 1
+        self._page_numbers = []
+
+    def _emit(self, data: bytes) -> bytes:
+        self._position += len(data)
+        return data
+
+    def _allocate(self) -> int:
+        number = self._next_number
+        self._next_number += 1
+        return number
+
+    def _write_object(self, number: int, obj) -> bytes:
+        self._offsets[number] = self._position
+        output = io.BytesIO()
+        output.write(f"{number} 0 obj\n".encode())
+        obj.write_to_stream(output, None)
+        output.write(b"\nendobj\n")
+        return self._emit(output.getvalue())
+
+    def header(self) -> bytes:
+        return self._emit(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n")
+
+    def add_pages(self, pdf_bytes: bytes) -> bytes:
+        """Append every page of pdf_bytes and return their serialized objects."""
+        reader = _read_pdf(pdf_bytes)
+        numbers = {}
+        pending = []
+
+        def renumber(obj):
+            # Point references at this document's object numbers, queueing each referenced object once
+            if isinstance(obj, IndirectObject):
+                key = (obj.idnum, obj.generation)
+                if key not in numbers:
+                    numbers[key] = self._allocate()
+                    pending.append((numbers[key], obj.get_object()))
+                return IndirectObject(numbers[key], 0, None)
+            if isinstance(obj, DictionaryObject):
+                for name in list(obj.keys()):
+                    obj[name] = renumber(obj[name])
+            elif isinstance(obj, ArrayObject):
+                for index, value in enumerate(obj):
+                    obj[index] = renumber(value)
+            return obj
+
+        page_objects = []
+        for page in reader.pages:
+            number = self._allocate()
+            if page.indirect_reference is not None:
+                numbers[(page.indirect_reference.idnum, page.indirect_reference.generation)] = number
+            for name in ("/Parent", "/Annots", "/B"):
+                page.pop(NameObject(name), None)
+            page_objects.append((number, page))
+            self._page_numbers.append(number)
+
+        output = []
+        for number, page in page_objects:
+            renumber(page)
+            page[NameObject("/Parent")] = IndirectObject(self._PAGE_TREE, 0, None)
+            output.append(self._write_object(number, page))
+        while pending:
+            number, obj = pending.pop()
+            output.append(self._write_object(number, renumber(obj)))
+        return b"".join(output)
+
+    def finish(self) -> bytes:
+        """Return the trailing page tree, catalog, cross-reference table and trailer."""
+        kids = " ".join(f"{number} 0 R" for number in self._page_numbers)
+        output = []
+        for number, body in (
+            (self._PAGE_TREE, f"<< /Type /Pages /Kids [{kids}] /Count {len(self._page_numbers)} >>"),
+            (self._CATALOG, f"<< /Type /Catalog /Pages {self._PAGE_TREE} 0 R >>")
+        ):
+            self._offsets[number] = self._position
+            output.append(self._emit(f"{number} 0 obj\n{body}\nendobj\n".encode()))
+
+        xref_position = self._position
+        size = self._next_number
+        xref = [f"xref\n0 {size}\n", "0000000000 65535 f \n"]
+        xref.extend(f"{self._offsets[number]:010d} 00000 n \n" for number in range(1, size))
+        xref.append(f"trailer\n<< /Size {size} /Root {self._CATALOG} 0 R >>\nstartxref\n{xref_position}\n%%EOF\n")
+        output.append(self._emit("".join(xref).encode()))
+        return b"".join(output)
+
+async def single_page_pdf(pdf_bytes: bytes, page_number: int) -> bytes:
+    """Slice one page out of an uploaded PDF so only that page is sent upstream.
+
+    Parsing runs in a worker thread to keep the event loop free. Unreadable
+    PDFs and out-of-range pages are rejected with a 400.
+    """
+    try:
+        return await asyncio.to_thread(extract_page, pdf_bytes, page_number)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+async def split_pdf_pages(pdf_bytes: bytes) -> list[bytes]:
+    """Split an uploaded PDF into single-page PDFs in a worker thread, rejecting invalid PDFs with a 400."""
+    try:
+        return await asyncio.to_thread(split_pages, pdf_bytes)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+async def selected_page_pdfs(pdf_bytes: bytes, selection: str) -> list[tuple[int, bytes]]:
+    """Slice the pages in selection (e.g. "1-5,8") out of an uploaded PDF, rejecting invalid selections with a 400."""
+    try:
+        return await asyncio.to_thread(extract_selected_pages, pdf_bytes, selection)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+async def resolve_page_selection(pdf_bytes: bytes, selection: Optional[str] = None) -> list[int]:
+    """Validate an uploaded PDF and page selection in a worker thread, rejecting invalid ones with a 400."""
+    try:
+        return await asyncio.to_thread(select_page_numbers, pdf_bytes, selection)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
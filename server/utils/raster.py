@@ -0,0 +1,83 @@
+import asyncio
+import io
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple
+
+from pdf2image import convert_from_bytes
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from config.gateway_config import config as gateway_config
+
+IMAGE_MIME_TYPES = {"png": "image/png", "jpeg": "image/jpeg"}
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+def render_page(pdf_bytes: bytes, page_number: int, dpi: int, image_format: str) -> bytes:
+    """Render one page of a PDF to PNG or JPEG bytes (runs in a worker process)."""
+    images = convert_from_bytes(pdf_bytes, dpi=dpi, first_page=page_number, last_page=page_number)
+    if not images:
+        raise ValueError(f"Page {page_number} could not be rendered")
+    buffer = io.BytesIO()
+    images[0].convert("RGB").save(buffer, format=image_format.upper())
+    return buffer.getvalue()
+
+def downsize_image(image: bytes, max_side: int, jpeg_quality: int) -> Tuple[bytes, str]:
+    """Shrink an image so its longer side is at most max_side (runs in a worker process).
+
+    Returns (image_bytes, mime_type). Images already within the limit are
+    returned as uploaded; larger ones are re-encoded as JPEG after applying
+    their EXIF orientation. Raises ValueError for data that is not an image.
+    """
+    try:
+        with Image.open(io.BytesIO(image)) as img:
+            mime_type = Image.MIME.get(img.format, "application/octet-stream")
+            if max_side <= 0 or max(img.size) <= max_side:
+                return image, mime_type
+            # Let the JPEG decoder scale down while decoding instead of decoding full size
+            img.draft("RGB", (max_side, max_side))
+            resized = ImageOps.exif_transpose(img)
+            resized.thumbnail((max_side, max_side), Image.LANCZOS)
+            buffer = io.BytesIO()
+            resized.convert("RGB").save(buffer, format="JPEG", quality=jpeg_quality)
+            return buffer.getvalue(), "image/jpeg"
+    except UnidentifiedImageError:
+        raise ValueError("Invalid image: unrecognized image format")
+    except (OSError, Image.DecompressionBombError) as e:
+        raise ValueError(f"Invalid image: {str(e)}")
+
+def get_pool() -> ProcessPoolExecutor:
+    """Return the shared process pool used for rasterization and image resizing."""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=gateway_config.raster_workers or None)
+    return _pool
+
+def shutdown_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(cancel_futures=True)
+        _pool = None
+
+async def rasterize_page(pdf_bytes: bytes, page_number: int = 1) -> tuple:
+    """Render a PDF page in the process pool without blocking the event loop.
+
+    Returns (image_bytes, mime_type) using RASTER_DPI and RASTER_FORMAT.
+    """
+    image_format = gateway_config.raster_format.lower()
+    if image_format not in IMAGE_MIME_TYPES:
+        raise ValueError(f"Unsupported raster format: {gateway_config.raster_format}")
+    loop = asyncio.get_running_loop()
+    image = await loop.run_in_executor(
+        get_pool(), render_page, pdf_bytes, page_number, gateway_config.raster_dpi, image_format
+    )
+    return image, IMAGE_MIME_TYPES[image_format]
+
+async def resize_image(image: bytes) -> Tuple[bytes, str]:
+    """Downsize an uploaded image in the process pool using IMAGE_MAX_SIDE and IMAGE_JPEG_QUALITY.
+
+    Returns (image_bytes, mime_type); raises ValueError for invalid images.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_pool(), downsize_image, image, gateway_config.image_max_side, gateway_config.image_jpeg_quality
+    )
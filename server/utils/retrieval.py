@@ -0,0 +1,86 @@
+import math
+import re
+import unicodedata
+from collections import Counter, OrderedDict
+from typing import List, Optional
+
+from config.gateway_config import config as gateway_config
+
+# \w alone splits Indic words at vowel signs and viramas (combining marks), so the
+# Indic blocks are included explicitly, along with the zero-width (non-)joiners. The
+# danda and double danda (U+0964/U+0965) end sentences and are left out
+_TOKEN_PATTERN = re.compile(r"[\w\u0900-\u0963\u0966-\u0DFF\u200c\u200d]+")
+
+# Question words would otherwise outweigh the content terms of a short prompt
+STOPWORDS = frozenset(
+    "a an and are as at be by do does for from how in is it its of on or that the "
+    "this to was what when where which who why with".split()
+)
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens that keep Indic words intact."""
+    text = unicodedata.normalize("NFC", text).lower()
+    tokens = (token.replace("\u200c", "").replace("\u200d", "") for token in _TOKEN_PATTERN.findall(text))
+    return [token for token in tokens if token and token != "_" and token not in STOPWORDS]
+
+class BM25Index:
+    """Okapi BM25 ranking over a small set of documents (the pages of one PDF)."""
+
+    def __init__(self, documents: List[str], k1: float = 1.5, b: float = 0.75):
+        self.documents = documents
+        self.k1 = k1
+        self.b = b
+        self.term_counts = [Counter(tokenize(document)) for document in documents]
+        self.lengths = [sum(counts.values()) for counts in self.term_counts]
+        self.average_length = (sum(self.lengths) / len(self.lengths)) if self.lengths else 0.0
+        document_frequency = Counter()
+        for counts in self.term_counts:
+            document_frequency.update(counts.keys())
+        total = len(documents)
+        self.idf = {
+            term: math.log(1 + (total - frequency + 0.5) / (frequency + 0.5))
+            for term, frequency in document_frequency.items()
+        }
+
+    def scores(self, query: str) -> List[float]:
+        terms = [term for term in set(tokenize(query)) if term in self.idf]
+        scores = []
+        for counts, length in zip(self.term_counts, self.lengths):
+            norm = self.k1 * (1 - self.b + self.b * length / (self.average_length or 1))
+            scores.append(sum(
+                self.idf[term] * counts[term] * (self.k1 + 1) / (counts[term] + norm)
+                for term in terms if term in counts
+            ))
+        return scores
+
+    def top_k(self, query: str, k: int) -> List[int]:
+        """Return the indices of up to k best matching documents, best first.
+
+        Documents that match no query term are left out, unless nothing
+        matches at all; then the first k documents are returned.
+        """
+        scores = self.scores(query)
+        ranked = sorted(range(len(scores)), key=lambda index: (-scores[index], index))
+        matched = [index for index in ranked if scores[index] > 0]
+        return (matched or ranked)[:k]
+
+class IndexCache:
+    """Keeps the indexes of recently used documents so follow-up prompts skip extraction."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, BM25Index]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[BM25Index]:
+        index = self._entries.get(key)
+        if index is not None:
+            self._entries.move_to_end(key)
+        return index
+
+    def put(self, key: str, index: BM25Index):
+        self._entries[key] = index
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+page_indexes = IndexCache(gateway_config.retrieval_cache_size)
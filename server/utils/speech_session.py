@@ -0,0 +1,205 @@
+import asyncio
+import json
+import os
+from time import time
+from typing import List
+
+import httpx
+from fastapi import WebSocket, WebSocketDisconnect
+from starlette.websockets import WebSocketState
+
+from config.gateway_config import config as gateway_config
+from config.logging_config import logger
+from utils.audio import pcm_to_wav, quietest_offset
+from utils.fanout import map_concurrently
+from utils.upstream import get_client, open_stream
+
+# Segments end at the quietest frame of their last half second, between words where possible
+CUT_WINDOW_SECONDS = 0.5
+
+async def transcribe_pcm(pcm: bytes, language: str) -> str:
+    """Transcribe 16-bit mono PCM at ws_sample_rate with the upstream ASR."""
+    response = await get_client().post(
+        f"{os.getenv('EXTERNAL_API_BASE_URL')}/v1/transcribe/?language={language}",
+        files={"file": ("speech.wav", pcm_to_wav(pcm, gateway_config.ws_sample_rate), "audio/x-wav")},
+        headers={"accept": "application/json"}
+    )
+    response.raise_for_status()
+    return response.json().get("text", "")
+
+class IncrementalTranscriber:
+    """Transcribes a growing PCM stream in consecutive segments, sending each stretch of audio to ASR once.
+
+    Each segment holds at most max_segment_bytes of audio not transcribed
+    yet, so the ASR load of a session grows linearly with its length rather
+    than re-transcribing the whole buffer for every partial transcript.
+    """
+
+    def __init__(self, language: str, sample_rate: int, max_segment_bytes: int):
+        self.language = language
+        self.sample_rate = sample_rate
+        self.max_segment_bytes = max_segment_bytes - max_segment_bytes % 2
+        self.cut_window_bytes = int(CUT_WINDOW_SECONDS * sample_rate) * 2
+        self.committed = 0  # Bytes of the stream covered by transcribed segments
+        self.texts: List[str] = []
+
+    @property
+    def text(self) -> str:
+        return " ".join(text for text in self.texts if text)
+
+    def _segment_end(self, pcm: bytes, start: int, final: bool) -> int:
+        if final and len(pcm) - start <= self.max_segment_bytes:
+            return len(pcm)
+        end = min(len(pcm), start + self.max_segment_bytes)
+        end -= (end - start) % 2
+        cut = quietest_offset(pcm, max(start, end - self.cut_window_bytes), end, self.sample_rate)
+        return cut if cut > start else end
+
+    async def transcribe_next(self, pcm: bytearray) -> str:
+        """Transcribe the next segment of the stream and return the transcript so far."""
+        start = self.committed
+        end = self._segment_end(pcm, start, final=False)
+        text = await transcribe_pcm(bytes(pcm[start:end]), self.language)
+        self.committed = end
+        self.texts.append(text.strip())
+        return self.text
+
+    async def finish(self, pcm: bytes) -> str:
+        """Transcribe the audio not covered by earlier segments and return the full transcript.
+
+        Must not run while a transcribe_next call is in flight.
+        """
+        segments = []
+        start = self.committed
+        while start < len(pcm):
+            end = self._segment_end(pcm, start, final=True)
+            segments.append(pcm[start:end])
+            start = end
+        # At most ws_max_audio_seconds / ws_max_segment_seconds segments, usually just one
+        texts = await map_concurrently(
+            lambda segment: transcribe_pcm(segment, self.language),
+            segments,
+            concurrency=len(segments)
+        )
+        self.committed = len(pcm)
+        self.texts.extend(text.strip() for text in texts)
+        return self.text
+
+async def run_speech_to_speech_session(websocket: WebSocket, language: str, allowed_languages: List[str]):
+    """Serve one full-duplex speech-to-speech session.
+
+    The client streams binary frames of 16-bit mono PCM (ws_sample_rate Hz) while the user
+    speaks and sends {"type": "end"} when done. The server pushes
+    {"type": "partial_transcript"} messages while audio arrives, then relays the synthesized
+    audio as binary frames, followed by {"type": "transcript"} and {"type": "done"}.
+    Failures are reported as {"type": "error", "detail": ...}.
+    """
+    await websocket.accept()
+    if language not in allowed_languages:
+        await websocket.send_json({"type": "error", "detail": f"Language must be one of {allowed_languages}"})
+        await websocket.close(code=1008)
+        return
+
+    logger.info("Processing speech-to-speech WebSocket session", extra={
+        "endpoint": "/v1/ws/speech_to_speech",
+        "language": language,
+        "client_ip": websocket.client.host
+    })
+
+    sample_rate = gateway_config.ws_sample_rate
+    bytes_per_second = sample_rate * 2
+    partial_every = int(gateway_config.ws_partial_interval_seconds * bytes_per_second)
+    max_audio_bytes = gateway_config.ws_max_audio_seconds * bytes_per_second
+    transcriber = IncrementalTranscriber(language, sample_rate, int(gateway_config.ws_max_segment_seconds * bytes_per_second))
+    send_lock = asyncio.Lock()
+    pcm = bytearray()
+    partial_task = None
+    transcript_task = None
+    response = None
+
+    async def send_json(message: dict):
+        async with send_lock:
+            await websocket.send_json(message)
+
+    async def close_with_error(detail: str, code: int):
+        # Nobody is left to tell when the client has already gone away
+        if websocket.client_state != WebSocketState.CONNECTED or websocket.application_state != WebSocketState.CONNECTED:
+            return
+        try:
+            await send_json({"type": "error", "detail": detail})
+            await websocket.close(code=code)
+        except (WebSocketDisconnect, RuntimeError):
+            pass
+
+    async def push_partial():
+        # Only one partial transcription is in flight at a time; newer audio waits for the next one
+        try:
+            text = await transcriber.transcribe_next(pcm)
+            await send_json({"type": "partial_transcript", "text": text})
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning(f"Partial transcription failed: {str(e)}")
+
+    async def final_transcript(audio: bytes) -> str:
+        if partial_task is not None:
+            await asyncio.gather(partial_task, return_exceptions=True)
+        return await transcriber.finish(audio)
+
+    start_time = time()
+    try:
+        while True:
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+            if message.get("bytes"):
+                pcm.extend(message["bytes"])
+                if len(pcm) > max_audio_bytes:
+                    await close_with_error(f"Audio exceeds {gateway_config.ws_max_audio_seconds} seconds", 1009)
+                    return
+                if len(pcm) - transcriber.committed >= partial_every and (partial_task is None or partial_task.done()):
+                    partial_task = asyncio.create_task(push_partial())
+            elif message.get("text"):
+                try:
+                    control = json.loads(message["text"])
+                except ValueError:
+                    control = {}
+                if control.get("type") == "end":
+                    break
+
+        if not pcm:
+            await close_with_error("No audio received", 1003)
+            return
+
+        audio = bytes(pcm)
+        # Only the audio after the last partial segment is left to transcribe, alongside the reply
+        transcript_task = asyncio.create_task(final_transcript(audio))
+        response = await open_stream(
+            "POST",
+            f"{os.getenv('EXTERNAL_API_BASE_URL')}/v1/speech_to_speech?language={language}",
+            files={"file": ("speech.wav", pcm_to_wav(audio, sample_rate), "audio/x-wav")},
+            headers={"accept": "application/json"}
+        )
+        async for chunk in response.aiter_bytes(gateway_config.stream_chunk_size):
+            if chunk:
+                async with send_lock:
+                    await websocket.send_bytes(chunk)
+
+        await send_json({"type": "transcript", "text": await transcript_task})
+        await send_json({"type": "done"})
+        logger.info(f"Speech-to-speech WebSocket session completed in {time() - start_time:.2f} seconds")
+        await websocket.close()
+
+    except WebSocketDisconnect:
+        logger.info("Speech-to-speech WebSocket client disconnected")
+    except httpx.TimeoutException:
+        logger.error("External speech-to-speech API timed out")
+        await close_with_error("External API timeout", 1011)
+    except (httpx.HTTPError, ValueError) as e:
+        logger.error(f"External speech-to-speech API error: {str(e)}")
+        await close_with_error(f"External API error: {str(e)}", 1011)
+    finally:
+        tasks = [task for task in (partial_task, transcript_task) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if response is not None:
+            await response.aclose()
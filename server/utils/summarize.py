@@ -0,0 +1,145 @@
+from time import time
+from typing import Awaitable, Callable, List
+
+from fastapi import HTTPException
+
+from config.gateway_config import config as gateway_config
+from config.logging_config import logger
+from utils.fanout import map_concurrently
+from utils.upstream import post_upstream
+from utils.text import chunk_text_by_length
+
+# Called with the text to summarize and whether this is the final (root) summary
+SummarizeFn = Callable[[str, bool], Awaitable[str]]
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count from the character length.
+
+    Indic scripts take more tokens per character than English, so
+    SUMMARY_CHARS_PER_TOKEN is set low enough for them; English text is
+    overestimated, which only makes the groups smaller.
+    """
+    return len(text) // gateway_config.summary_chars_per_token + 1
+
+def max_chars_for_tokens(max_tokens: int) -> int:
+    """Longest text whose estimate_tokens is at most max_tokens."""
+    return max(max_tokens * gateway_config.summary_chars_per_token - 1, 1)
+
+def truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text to fit within max_tokens, at a word boundary where possible."""
+    max_chars = max_chars_for_tokens(max_tokens)
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars]
+    boundary = cut.rstrip().rfind(" ")
+    return cut[:boundary] if boundary > max_chars // 2 else cut
+
+def pack_texts(texts: List[str], max_tokens: int) -> List[str]:
+    """Join consecutive texts into groups that each fit within max_tokens.
+
+    A single text that is too large on its own is split into chunks by
+    length, whatever the length of its words.
+    """
+    groups, current = [], ""
+    for text in texts:
+        pieces = [text] if estimate_tokens(text) <= max_tokens else chunk_text_by_length(
+            text, max_chars_for_tokens(max_tokens)
+        )
+        for piece in pieces:
+            candidate = f"{current}\n\n{piece}" if current else piece
+            if current and estimate_tokens(candidate) > max_tokens:
+                groups.append(current)
+                candidate = piece
+            current = candidate
+    if current:
+        groups.append(current)
+    return groups
+
+async def map_reduce_summarize(texts: List[str], summarize: SummarizeFn, max_input_tokens: int) -> str:
+    """Summarize texts of any length without exceeding the model context.
+
+    Texts are packed into groups that fit max_input_tokens and summarized in
+    parallel; the summaries are packed and summarized again, level by level,
+    until a single group remains for the final summary. Each level divides
+    the number of groups, so latency grows with the logarithm of the input
+    size rather than linearly.
+    """
+    texts = [text for text in texts if text.strip()]
+    if not texts:
+        return ""
+
+    start_time = time()
+    groups = pack_texts(texts, max_input_tokens)
+    level = 0
+    while len(groups) > 1:
+        summaries = await map_concurrently(
+            lambda group: summarize(group, False),
+            groups,
+            concurrency=gateway_config.pdf_page_concurrency,
+            retries=gateway_config.pdf_page_retries,
+            retry_backoff=gateway_config.pdf_page_retry_backoff
+        )
+        level += 1
+        packed = pack_texts(summaries, max_input_tokens)
+        if len(packed) >= len(groups):
+            # Summaries are not getting shorter; merge them pairwise, each cut to half the
+            # budget, so the tree still converges without exceeding the context
+            logger.warning(f"Summaries did not shrink at level {level}, merging pairwise with truncation")
+            half = max(max_input_tokens // 2, 1)
+            packed = [
+                truncate_to_tokens("\n\n".join(truncate_to_tokens(summary, half) for summary in summaries[i:i + 2]), max_input_tokens)
+                for i in range(0, len(summaries), 2)
+            ]
+        logger.info(f"Summary level {level}: {len(groups)} groups reduced to {len(packed)}")
+        groups = packed
+
+    summary = await summarize(groups[0], True)
+    logger.info(f"Map-reduce summary completed in {time() - start_time:.2f} seconds, levels: {level}")
+    return summary
+
+# Used for the intermediate levels of a map-reduce summary; the user's prompt is applied at the root
+SECTION_SUMMARY_PROMPT = "Summarize the following text, keeping its key facts, names and numbers."
+
+async def summarize_pages_text(
+    page_texts: List[str],
+    prompt: str,
+    src_lang: str,
+    tgt_lang: str,
+    chat_url: str,
+    section_prompt: str = SECTION_SUMMARY_PROMPT
+) -> str:
+    """Summarize extracted page text with map-reduce so that no upstream call exceeds the model context.
+
+    chat_url is an upstream chat endpoint taking {prompt, src_lang, tgt_lang}
+    and returning {response}. Intermediate summaries use section_prompt and
+    stay in the source language; only the final summary applies the user's
+    prompt and is produced in the target language. Raises a 400 when the
+    prompt leaves no room for the text.
+    """
+    async def summarize(text: str, final: bool) -> str:
+        response = await post_upstream(
+            None,
+            chat_url,
+            json={
+                "prompt": f"{prompt if final else section_prompt}\n\n{text}",
+                "src_lang": src_lang,
+                "tgt_lang": tgt_lang if final else src_lang
+            },
+            headers={
+                "accept": "application/json",
+                "Content-Type": "application/json"
+            }
+        )
+        response.raise_for_status()
+        return response.json().get("response", "")
+
+    instruction = max(prompt, section_prompt, key=len)
+    # Leave room in the context for the instruction and the generated summary, and keep
+    # each prompt within the length the upstream chat accepts
+    max_input_tokens = min(
+        gateway_config.summary_context_tokens - gateway_config.summary_max_tokens - estimate_tokens(instruction),
+        (gateway_config.summary_max_prompt_chars - len(instruction) - 2) // gateway_config.summary_chars_per_token
+    )
+    if max_input_tokens < 1:
+        raise HTTPException(status_code=400, detail="Prompt is too long to leave room for the document text")
+    return await map_reduce_summarize(page_texts, summarize, max_input_tokens)
@@ -1,3 +1,64 @@
+import re
+
 def chunk_text(text: str, chunk_size: int = 15) -> list[str]:
     words = text.split()
-    return [' '.join(words[i:i + chunk_size]) for i in range(0, len(words), chunk_size)]
\ No newline at end of file
+    return [' '.join(words[i:i + chunk_size]) for i in range(0, len(words), chunk_size)]
+
+def chunk_text_by_length(text: str, max_chars: int) -> list[str]:
+    """Split text into chunks of at most max_chars characters, breaking between words.
+
+    Words longer than max_chars on their own are split across chunks.
+    """
+    chunks = []
+    current = ""
+    for word in text.split():
+        while len(word) > max_chars:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(word[:max_chars])
+            word = word[max_chars:]
+        candidate = f"{current} {word}" if current else word
+        if len(candidate) > max_chars:
+            chunks.append(current)
+            candidate = word
+        current = candidate
+    if current:
+        chunks.append(current)
+    return chunks
+
+# Danda and double danda always end a sentence; Latin punctuation (with any closing
+# quotes or brackets) does when followed by whitespace or the end of the text
+_SENTENCE_END = re.compile(r"[\u0964\u0965]+|[.!?]+[\"'\u201d\u2019)\]]*(?=\s|$)")
+_WHITESPACE = re.compile(r"\s*")
+_LAST_WORD = re.compile(r"(\w+)$")
+# Titles that are followed by a name rather than ending a sentence
+_ABBREVIATIONS = frozenset({"dr", "mr", "mrs", "ms", "prof", "sr", "jr", "st", "smt", "vs", "fig", "dept"})
+
+def split_sentences(text: str) -> tuple[str, list[tuple[str, str]]]:
+    """Split text into sentences, keeping the whitespace around them.
+
+    Returns the leading whitespace and a list of (sentence, following
+    whitespace) pairs, so "".join of them rebuilds the text exactly. A
+    period followed by a lowercase Latin letter (an abbreviation such as
+    "e.g. this") or following a title such as "Dr." does not end a sentence.
+    """
+    leading = _WHITESPACE.match(text).group()
+    segments = []
+    start = len(leading)
+    for match in _SENTENCE_END.finditer(text, start):
+        whitespace = _WHITESPACE.match(text, match.end()).group()
+        following = text[match.end() + len(whitespace):match.end() + len(whitespace) + 1]
+        if match.group()[0] in ".!?" and following.isascii() and following.islower():
+            continue
+        if match.group() == "." and following:
+            word = _LAST_WORD.search(text, start, match.start())
+            if word and word.group().lower() in _ABBREVIATIONS:
+                continue
+        segments.append((text[start:match.end()], whitespace))
+        start = match.end() + len(whitespace)
+    remainder = text[start:]
+    if remainder:
+        sentence = remainder.rstrip()
+        segments.append((sentence, remainder[len(sentence):]))
+    return leading, segments
@@ -0,0 +1,96 @@
+import asyncio
+import io
+import unicodedata
+from collections import Counter
+from typing import Optional
+
+from PyPDF2 import PdfReader
+
+from config.gateway_config import config as gateway_config
+
+SCRIPT_RANGES = {
+    "Deva": (0x0900, 0x097F),
+    "Taml": (0x0B80, 0x0BFF),
+    "Telu": (0x0C00, 0x0C7F),
+    "Knda": (0x0C80, 0x0CFF),
+    "Mlym": (0x0D00, 0x0D7F),
+    "Cyrl": (0x0400, 0x04FF),
+    "Latn": (0x0000, 0x024F),
+}
+INDIC_SCRIPTS = ("Deva", "Taml", "Telu", "Knda", "Mlym")
+
+LANGUAGE_SCRIPTS = {
+    "kannada": "Knda",
+    "hindi": "Deva",
+    "tamil": "Taml",
+    "telugu": "Telu",
+    "malayalam": "Mlym",
+    "english": "Latn",
+}
+
+def script_for_language(language: Optional[str]) -> Optional[str]:
+    """Map a language code (kan_Knda) or name (kannada) to its script, if known."""
+    if not language:
+        return None
+    if "_" in language:
+        script = language.split("_")[-1]
+        return script if script in SCRIPT_RANGES else None
+    return LANGUAGE_SCRIPTS.get(language.lower())
+
+def _script_of(char: str) -> Optional[str]:
+    code_point = ord(char)
+    for script, (first, last) in SCRIPT_RANGES.items():
+        if first <= code_point <= last:
+            return script
+    return None
+
+def is_usable_text(text: str, script: Optional[str] = None) -> bool:
+    """Decide whether an embedded text layer is good enough to skip OCR.
+
+    Scanned pages have little or no text; broken font encodings show up as
+    replacement, private-use or control characters, as letters in the wrong
+    script (legacy Kannada fonts often map to Latin glyphs), or as Indic
+    vowel signs detached from the consonant they belong to.
+    """
+    chars = [char for char in text if not char.isspace()]
+    if len(chars) < gateway_config.pdf_text_layer_min_chars:
+        return False
+
+    garbage = sum(1 for char in chars if char == "\ufffd" or unicodedata.category(char) in ("Co", "Cc", "Cs"))
+    if 1 - garbage / len(chars) < gateway_config.pdf_text_layer_min_coverage:
+        return False
+
+    letters = [char for char in chars if unicodedata.category(char)[0] in ("L", "M")]
+    if not letters:
+        return False
+    scripts = Counter(_script_of(char) for char in letters)
+    if script and scripts[script] / len(letters) < gateway_config.pdf_text_layer_min_script_ratio:
+        return False
+
+    marks = [
+        index for index, char in enumerate(text)
+        if unicodedata.category(char) in ("Mn", "Mc") and _script_of(char) in INDIC_SCRIPTS
+    ]
+    orphaned = sum(1 for index in marks if index == 0 or unicodedata.category(text[index - 1])[0] not in ("L", "M"))
+    if marks and orphaned / len(marks) > gateway_config.pdf_text_layer_max_orphan_marks:
+        return False
+    return True
+
+def read_page_text(page_pdf: bytes) -> str:
+    """Return the embedded text of the first page of a PDF, or "" if it has none."""
+    try:
+        return PdfReader(io.BytesIO(page_pdf)).pages[0].extract_text() or ""
+    except Exception:
+        return ""
+
+async def usable_text_layer(page_pdf: bytes, language: Optional[str] = None) -> Optional[str]:
+    """Return the embedded text of a single-page PDF if it can replace OCR, otherwise None.
+
+    Without a known language the script check cannot catch legacy-font
+    mojibake, so the text layer is not trusted and the page goes to OCR.
+    """
+    script = script_for_language(language)
+    if not gateway_config.pdf_text_layer_enabled or script is None:
+        return None
+    text = await asyncio.to_thread(read_page_text, page_pdf)
+    return text.strip() if is_usable_text(text, script) else None
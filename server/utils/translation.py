@@ -0,0 +1,189 @@
+import asyncio
+import os
+from time import time
+from typing import Dict, List, Set, Tuple
+
+import httpx
+
+from config.gateway_config import config as gateway_config
+from config.logging_config import logger
+from utils.fanout import map_concurrently
+from utils.metrics import record_translation_batch, record_translation_duplicates
+from utils.text import split_sentences
+from utils.upstream import post_upstream
+
+# Short sentences are bucketed together regardless of their relative length
+MIN_BUCKET_CHARS = 16
+
+async def post_translate(sentences: List[str], src_lang: str, tgt_lang: str) -> List[str]:
+    """Translate sentences with a single upstream call.
+
+    Raises httpx errors from the upstream, and ValueError when the response
+    does not hold one translation per sentence.
+    """
+    response = await post_upstream(
+        None,
+        f"{os.getenv('EXTERNAL_API_BASE_URL')}/v1/translate",
+        json={"sentences": sentences, "src_lang": src_lang, "tgt_lang": tgt_lang},
+        headers={
+            "accept": "application/json",
+            "Content-Type": "application/json"
+        }
+    )
+    response.raise_for_status()
+    translations = response.json().get("translations", [])
+    if len(translations) != len(sentences):
+        raise ValueError(f"Expected {len(sentences)} translations, got {len(translations)}")
+    return translations
+
+def length_buckets(sentences: List[str], bucket_size: int) -> List[List[str]]:
+    """Group sentences of similar length, shortest first, so upstream batches carry little padding.
+
+    A bucket is closed when it holds bucket_size sentences or the next
+    sentence is more than twice as long as its shortest one.
+    """
+    buckets: List[List[str]] = []
+    for sentence in sorted(sentences, key=len):
+        bucket = buckets[-1] if buckets else None
+        if bucket is None or len(bucket) >= bucket_size or len(sentence) > 2 * max(len(bucket[0]), MIN_BUCKET_CHARS):
+            buckets.append([sentence])
+        else:
+            bucket.append(sentence)
+    return buckets
+
+async def translate_deduplicated(sentences: List[str], src_lang: str, tgt_lang: str) -> List[str]:
+    """Translate sentences, sending each distinct sentence upstream once, in length buckets.
+
+    The result has one translation per input sentence, in input order, just
+    as a single upstream call would return.
+    """
+    unique = list(dict.fromkeys(sentences))
+    record_translation_duplicates(len(sentences) - len(unique))
+    buckets = length_buckets(unique, gateway_config.translate_bucket_size)
+    results = await map_concurrently(
+        lambda bucket: post_translate(bucket, src_lang, tgt_lang),
+        buckets,
+        concurrency=gateway_config.translate_bucket_concurrency
+    )
+    translated = {
+        sentence: translation
+        for bucket, translations in zip(buckets, results)
+        for sentence, translation in zip(bucket, translations)
+    }
+    return [translated[sentence] for sentence in sentences]
+
+class TranslationBatcher:
+    """Coalesces concurrent translate calls for the same language pair into one upstream request.
+
+    Calls for a (src_lang, tgt_lang) pair wait up to `window` seconds for
+    others to join them; the batch is sent as soon as the window closes or
+    it holds `max_batch_size` sentences, and each caller gets back its own
+    slice of the translations. Each batch is deduplicated and split into
+    length buckets before it is sent. A window of 0 disables batching.
+    """
+
+    def __init__(self, window: float, max_batch_size: int):
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._pending: Dict[Tuple[str, str], list] = {}
+        self._timers: Dict[Tuple[str, str], asyncio.Task] = {}
+        self._dispatches: Set[asyncio.Task] = set()
+
+    async def translate(self, sentences: List[str], src_lang: str, tgt_lang: str) -> List[str]:
+        if self.window <= 0:
+            return await translate_deduplicated(sentences, src_lang, tgt_lang)
+
+        pair = (src_lang, tgt_lang)
+        if sum(len(batch) for batch, _, _ in self._pending.get(pair, [])) + len(sentences) > self.max_batch_size:
+            # Send what is already waiting rather than letting this call push the batch past the limit
+            self._flush(pair)
+        future = asyncio.get_running_loop().create_future()
+        pending = self._pending.setdefault(pair, [])
+        pending.append((sentences, future, time()))
+        if sum(len(batch) for batch, _, _ in pending) >= self.max_batch_size:
+            self._flush(pair)
+        elif pair not in self._timers:
+            self._timers[pair] = asyncio.create_task(self._flush_after_window(pair))
+        # A caller that goes away cancels only its own future; the batch goes ahead for the others
+        return await future
+
+    async def _flush_after_window(self, pair: Tuple[str, str]):
+        await asyncio.sleep(self.window)
+        self._flush(pair)
+
+    def _flush(self, pair: Tuple[str, str]):
+        timer = self._timers.pop(pair, None)
+        if timer is not None and timer is not asyncio.current_task():
+            timer.cancel()
+        items = [item for item in self._pending.pop(pair, []) if not item[1].done()]
+        if not items:
+            return
+        # Dispatch outside the callers' tasks so no single caller's cancellation aborts the batch
+        task = asyncio.create_task(self._dispatch(pair, items))
+        self._dispatches.add(task)
+        task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(self, pair: Tuple[str, str], items: list):
+        sentences = [sentence for batch, _, _ in items for sentence in batch]
+        dispatched_at = time()
+        record_translation_batch(len(items), len(sentences), [dispatched_at - enqueued_at for _, _, enqueued_at in items])
+        try:
+            translations = await translate_deduplicated(sentences, *pair)
+        except Exception as e:
+            logger.error(f"Batched translation failed for {pair[0]}->{pair[1]} ({len(items)} requests): {str(e)}")
+            if len(items) > 1 and not isinstance(e, httpx.TimeoutException):
+                # One bad input should not fail every request it was batched with
+                await asyncio.gather(*(self._dispatch_alone(pair, item) for item in items))
+                return
+            for _, future, _ in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        logger.info(f"Batched translation {pair[0]}->{pair[1]}: {len(items)} requests, {len(sentences)} sentences in {time() - dispatched_at:.2f} seconds")
+        offset = 0
+        for batch, future, _ in items:
+            if not future.done():
+                future.set_result(translations[offset:offset + len(batch)])
+            offset += len(batch)
+
+    async def _dispatch_alone(self, pair: Tuple[str, str], item: tuple):
+        batch, future, _ = item
+        if future.done():
+            return
+        try:
+            translations = await translate_deduplicated(batch, *pair)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+            return
+        if not future.done():
+            future.set_result(translations)
+
+translation_batcher = TranslationBatcher(gateway_config.translate_batch_window, gateway_config.translate_max_batch_size)
+
+async def translate_sentences(sentences: List[str], src_lang: str, tgt_lang: str) -> List[str]:
+    """Translate sentences through the batcher, one translation per input.
+
+    Inputs holding several sentences (whole paragraphs) are split on danda,
+    double danda and Latin sentence punctuation; the pieces are translated in
+    the same batch and joined back with the original whitespace, so long
+    inputs spread across length buckets and repeated sentences are shared.
+    """
+    layouts = []
+    for sentence in sentences:
+        leading, parts = split_sentences(sentence) if gateway_config.translate_split_sentences else ("", [])
+        if not parts:
+            leading, parts = "", [(sentence, "")]
+        layouts.append((leading, parts))
+
+    translations = await translation_batcher.translate(
+        [segment for _, parts in layouts for segment, _ in parts], src_lang, tgt_lang
+    )
+    results = []
+    offset = 0
+    for leading, parts in layouts:
+        translated = translations[offset:offset + len(parts)]
+        offset += len(parts)
+        results.append(leading + "".join(text + whitespace for text, (_, whitespace) in zip(translated, parts)))
+    return results
@@ -0,0 +1,145 @@
+import asyncio
+from time import time
+from typing import AsyncIterator, Awaitable, Optional, TypeVar
+
+import anyio
+import httpx
+from fastapi import HTTPException, Request
+
+from config.gateway_config import config as gateway_config
+from config.logging_config import logger
+from utils.metrics import record_cancellation
+
+_client: Optional[httpx.AsyncClient] = None
+_STREAM_END = object()
+T = TypeVar("T")
+
+# Non-standard status (as used by nginx) for a request the client abandoned
+CLIENT_CLOSED_REQUEST = 499
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared async HTTP client used for all upstream calls."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=gateway_config.upstream_timeout,
+            limits=httpx.Limits(
+                max_connections=gateway_config.upstream_max_connections,
+                max_keepalive_connections=gateway_config.upstream_max_keepalive_connections
+            )
+        )
+    return _client
+
+async def close_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+async def cancel_on_disconnect(request: Optional[Request], work: Awaitable[T]) -> T:
+    """Await upstream work, cancelling it as soon as the client disconnects.
+
+    Closing the upstream connection lets the upstream server stop generating
+    for a client that is no longer listening. Cancellations are counted in the
+    gateway metrics. Without a request (e.g. background jobs) work is awaited
+    as-is.
+    """
+    if request is None:
+        return await work
+
+    async def watch_disconnect():
+        while not await request.is_disconnected():
+            await asyncio.sleep(gateway_config.disconnect_poll_interval)
+
+    start_time = time()
+    work_task = asyncio.ensure_future(work)
+    watcher = asyncio.create_task(watch_disconnect())
+    try:
+        await asyncio.wait({work_task, watcher}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        watcher.cancel()
+        if not work_task.done():
+            work_task.cancel()
+            # Let the cancelled call release its upstream connection
+            await asyncio.gather(work_task, return_exceptions=True)
+    if not work_task.cancelled():
+        return work_task.result()
+
+    elapsed = time() - start_time
+    record_cancellation(request.url.path, elapsed)
+    logger.info(f"Client disconnected after {elapsed:.2f} seconds, cancelled upstream call for {request.url.path}")
+    raise HTTPException(status_code=CLIENT_CLOSED_REQUEST, detail="Client closed request")
+
+async def post_upstream(request: Optional[Request], url: str, **kwargs) -> httpx.Response:
+    """POST to an upstream service, abandoning the call if the client goes away."""
+    return await cancel_on_disconnect(request, get_client().post(url, **kwargs))
+
+async def open_stream(method: str, url: str, **kwargs) -> httpx.Response:
+    """Send an upstream request and return the response with its body still unread.
+
+    Raises httpx.HTTPStatusError (after releasing the connection) when the
+    upstream answers with an error status.
+    """
+    client = get_client()
+    upstream_request = client.build_request(method, url, **kwargs)
+    response = await client.send(upstream_request, stream=True)
+    if response.is_error:
+        await response.aread()
+        await response.aclose()
+        response.raise_for_status()
+    return response
+
+async def relay_stream(
+    request: Request,
+    response: httpx.Response,
+    chunks: Optional[AsyncIterator[bytes]] = None,
+    max_buffered_chunks: Optional[int] = None
+) -> AsyncIterator[bytes]:
+    """Relay an upstream streaming response to the client.
+
+    A reader task pulls upstream chunks into a bounded queue, so a slow client
+    holds at most ``max_buffered_chunks`` chunks in memory and the upstream read
+    pauses until the client catches up. When the client disconnects, or the
+    response is cancelled, the reader is cancelled and the upstream connection
+    is closed.
+
+    ``chunks`` overrides the iterator read from the upstream, e.g. to tee the
+    body into a cache while it is relayed.
+    """
+    if chunks is None:
+        chunks = response.aiter_bytes(gateway_config.stream_chunk_size)
+    queue: asyncio.Queue = asyncio.Queue(maxsize=max_buffered_chunks or gateway_config.stream_buffer_chunks)
+
+    async def read_upstream():
+        try:
+            async for chunk in chunks:
+                if chunk:
+                    await queue.put(chunk)
+            await queue.put(_STREAM_END)
+        except httpx.HTTPError as e:
+            await queue.put(e)
+        finally:
+            if hasattr(chunks, "aclose"):
+                await chunks.aclose()
+
+    start_time = time()
+    reader = asyncio.create_task(read_upstream())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _STREAM_END:
+                break
+            if isinstance(item, Exception):
+                logger.error(f"Upstream stream failed: {str(item)}")
+                break
+            if await request.is_disconnected():
+                logger.info(f"Client disconnected, cancelling upstream stream: {response.request.url}")
+                record_cancellation(request.url.path, time() - start_time)
+                break
+            yield item
+    finally:
+        reader.cancel()
+        # Shielded so cleanup still runs when the response task itself is cancelled
+        with anyio.CancelScope(shield=True):
+            await asyncio.gather(reader, return_exceptions=True)
+            await response.aclose()
@@ -0,0 +1,53 @@
+import base64
+import os
+from typing import Optional
+
+from fastapi import HTTPException, Request
+
+from config.gateway_config import config as gateway_config
+from config.logging_config import logger
+from utils.raster import rasterize_page
+from utils.upstream import post_upstream
+
+PAGE_EXTRACTION_PROMPT = "Return the plain text representation of this document as if you were reading it naturally"
+
+def vision_enabled() -> bool:
+    """Pages go straight to the vision model when an OpenAI-compatible upstream is configured."""
+    return bool(os.getenv("EXTERNAL_VISION_API_BASE_URL"))
+
+async def vision_completion(request: Optional[Request], prompt: str, image: bytes, mime_type: str) -> str:
+    """Ask the vision model about an image through /v1/chat/completions."""
+    payload = {
+        "model": gateway_config.vision_model,
+        "messages": [
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": prompt},
+                    {
+                        "type": "image_url",
+                        "image_url": {
+                            "url": f"data:{mime_type};base64,{base64.b64encode(image).decode('utf-8')}"
+                        }
+                    }
+                ]
+            }
+        ],
+        "max_tokens": gateway_config.vision_max_tokens
+    }
+    external_url = f"{os.getenv('EXTERNAL_VISION_API_BASE_URL').rstrip('/')}/v1/chat/completions"
+    response = await post_upstream(request, external_url, json=payload, headers={"Content-Type": "application/json"})
+    response.raise_for_status()
+    try:
+        return response.json()["choices"][0]["message"]["content"]
+    except (KeyError, IndexError, TypeError) as e:
+        raise ValueError(f"Unexpected vision API response: {str(e)}")
+
+async def vision_extract_text(request: Optional[Request], page_pdf: bytes, prompt: str = PAGE_EXTRACTION_PROMPT) -> str:
+    """Render a single-page PDF in the gateway and extract its text with the vision model."""
+    try:
+        image, mime_type = await rasterize_page(page_pdf)
+    except Exception as e:
+        logger.error(f"PDF page rendering failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Failed to render PDF page: {str(e)}")
+    return await vision_completion(request, prompt, image, mime_type)
@@ -0,0 +1,190 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+
+from pdf_inspect import check_pdf, inspect_pdf
+
+# Bulk summarization of a folder of PDFs.
+#
+# "document" mode sends each PDF to /v1/document_summary_v0 (the text of every
+# page plus a summary of the whole document, guided by --prompt), which both
+# gateways serve; "pages" mode sends it to /v1/summarize-pdf for a summary of
+# each page, which only the vLLM gateway (server/main_vllm.py) serves. Each
+# result is appended to the output JSONL as soon as it arrives; PDFs whose
+# content hash already has a result for the same mode are skipped, so the same
+# command can be re-run to pick up new or failed documents.
+#
+#   python src/bulk-pdf-summary.py reports/ summaries.jsonl --mode document --prompt "Summarize the document in 3 sentences"
+
+ENDPOINTS = {
+    "document": "/v1/document_summary_v0",
+    "pages": "/v1/summarize-pdf"
+}
+
+def find_pdfs(directory):
+    paths = []
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        paths.extend(os.path.join(root, name) for name in sorted(files) if name.lower().endswith(".pdf"))
+    return paths
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def load_done(output_path, mode):
+    """Return the content hashes that already have a successful result for mode in the output."""
+    done = set()
+    if os.path.exists(output_path):
+        with open(output_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if record.get("mode") == mode and not record.get("error"):
+                    done.add(record["sha256"])
+    return done
+
+def summarize_pdf(session, url, path, page_count, args):
+    """Send one PDF to the API, retrying server errors and timeouts with backoff."""
+    if args.mode == "document":
+        data = {"src_lang": args.src_lang, "tgt_lang": args.tgt_lang, "prompt": args.prompt}
+    else:
+        data = {"pages": f"1-{page_count}"}
+
+    for attempt in range(args.retries + 1):
+        try:
+            with open(path, "rb") as f:
+                response = session.post(
+                    url,
+                    files={"file": (os.path.basename(path), f, "application/pdf")},
+                    data=data,
+                    headers={"accept": "application/json"},
+                    timeout=args.timeout
+                )
+            response.raise_for_status()
+            return response.json()
+        except requests.exceptions.RequestException as e:
+            # Client errors (unreadable PDF, bad prompt) will not succeed on a retry
+            status = e.response.status_code if e.response is not None else None
+            if attempt == args.retries or (status is not None and status < 500):
+                raise
+            delay = 2 ** attempt
+            print(f"\n{os.path.basename(path)} failed ({e}), retrying in {delay} seconds", file=sys.stderr)
+            time.sleep(delay)
+
+def main():
+    parser = argparse.ArgumentParser(description="Summarize every PDF in a folder through the dwani.ai PDF API.")
+    parser.add_argument("directory", help="Folder to scan (recursively) for PDFs")
+    parser.add_argument("output", help="JSONL file that results are appended to")
+    parser.add_argument("--mode", choices=list(ENDPOINTS), default="document",
+                        help="document: page text and one summary per PDF; pages: one summary per page")
+    parser.add_argument("--src-lang", default="eng_Latn", help="Source language code (document mode)")
+    parser.add_argument("--tgt-lang", default="eng_Latn", help="Target language code (document mode)")
+    parser.add_argument("--prompt", default="Summarize the document in 3 sentences", help="Summary prompt (document mode)")
+    parser.add_argument("--max-size-mb", type=float, default=50, help="Skip PDFs larger than this")
+    parser.add_argument("--concurrency", type=int, default=4, help="PDFs in flight at the same time")
+    parser.add_argument("--retries", type=int, default=3, help="Retries per failed PDF")
+    parser.add_argument("--timeout", type=float, default=600, help="Seconds to wait for each PDF")
+    args = parser.parse_args()
+
+    base_url = os.getenv("DWANI_AI_API_BASE_URL")
+    if not base_url:
+        raise ValueError("DWANI_AI_API_BASE_URL environment variable is not set")
+    url = f"{base_url.rstrip('/')}{ENDPOINTS[args.mode]}"
+
+    paths = find_pdfs(args.directory)
+    done = load_done(args.output, args.mode)
+    pending = []
+    for path in paths:
+        sha256 = file_sha256(path)
+        # Identical PDFs are summarized once
+        if sha256 not in done:
+            done.add(sha256)
+            pending.append((path, sha256))
+    print(f"Found {len(paths)} PDFs, {len(pending)} to process", file=sys.stderr)
+
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=args.concurrency, pool_maxsize=args.concurrency)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    processed = failed = pages_processed = 0
+    start_time = time.time()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor, \
+            open(args.output, "a", encoding="utf-8") as output:
+
+        def write_record(path, sha256, page_count, result=None, error=None):
+            nonlocal processed, failed, pages_processed
+            record = {
+                "path": os.path.relpath(path, args.directory),
+                "sha256": sha256,
+                "mode": args.mode,
+                "page_count": page_count,
+                "result": result,
+                "error": error
+            }
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+            output.flush()
+            if error:
+                failed += 1
+                print(f"\n{record['path']}: {error}", file=sys.stderr)
+            else:
+                processed += 1
+                pages_processed += page_count
+            rate = pages_processed / max((time.time() - start_time) / 60, 1e-6)
+            print(f"\rProcessed {processed}/{len(pending)} PDFs, failed {failed} ({rate:.1f} pages/min)", end="", file=sys.stderr)
+
+        futures = {}
+        for path, sha256 in pending:
+            valid, message = check_pdf(path, max_size_mb=args.max_size_mb)
+            if not valid:
+                write_record(path, sha256, 0, error=message)
+                continue
+            page_count = inspect_pdf(path).page_count
+            if page_count == 0:
+                # Nothing to summarize, and "pages=1-0" would be rejected by the server
+                write_record(path, sha256, 0, error="PDF has no pages")
+                continue
+            futures[executor.submit(summarize_pdf, session, url, path, page_count, args)] = (path, sha256, page_count)
+
+        try:
+            for future in as_completed(futures):
+                path, sha256, page_count = futures[future]
+                try:
+                    write_record(path, sha256, page_count, result=future.result())
+                except requests.exceptions.HTTPError as e:
+                    if e.response is not None and e.response.status_code == 404:
+                        # Every other PDF would fail the same way; stop without recording them as failed
+                        hint = ", use --mode document" if args.mode == "pages" else ""
+                        print(f"\n{ENDPOINTS[args.mode]} is not served by {base_url}{hint}", file=sys.stderr)
+                        executor.shutdown(cancel_futures=True)
+                        sys.exit(1)
+                    write_record(path, sha256, page_count, error=str(e))
+                except Exception as e:
+                    write_record(path, sha256, page_count, error=str(e))
+        except KeyboardInterrupt:
+            for future in futures:
+                future.cancel()
+            print(f"\nInterrupted; results so far are saved in {args.output}, run again to resume", file=sys.stderr)
+            sys.exit(130)
+
+    minutes = (time.time() - start_time) / 60
+    print(
+        f"\nProcessed {processed} PDFs ({failed} failed), {pages_processed} pages in {minutes:.1f} minutes "
+        f"({pages_processed / max(minutes, 1e-6):.1f} pages/min), output: {args.output}",
+        file=sys.stderr
+    )
+
+if __name__ == "__main__":
+    main()
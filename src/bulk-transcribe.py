@@ -0,0 +1,180 @@
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+import requests
+
+# Bulk transcription of a directory of recordings through /v1/transcribe/.
+#
+# Recordings are normalized to 16-bit mono WAV in a process pool (with ffmpeg,
+# when it is on PATH) and uploaded with bounded concurrency over one pooled
+# session. Each result is appended to the output JSONL as soon as it arrives;
+# files whose content hash already has a result there are skipped, so the same
+# command can be re-run to pick up new or failed recordings.
+#
+#   python src/bulk-transcribe.py recordings/ transcripts.jsonl --language kannada
+
+LANGUAGES = ["malayalam", "tamil", "telugu", "hindi", "kannada"]
+AUDIO_EXTENSIONS = (".wav", ".mp3", ".flac", ".ogg", ".m4a", ".webm", ".aac")
+
+def find_recordings(directory, extensions):
+    paths = []
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        paths.extend(os.path.join(root, name) for name in sorted(files) if name.lower().endswith(extensions))
+    return paths
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def prepare_audio(path, sample_rate, normalize):
+    """Return (file name, content, content type) to upload for a recording (runs in a worker process)."""
+    if normalize:
+        result = subprocess.run(
+            ["ffmpeg", "-v", "error", "-i", path, "-ac", "1", "-ar", str(sample_rate), "-sample_fmt", "s16", "-f", "wav", "pipe:1"],
+            capture_output=True,
+            check=True
+        )
+        return os.path.splitext(os.path.basename(path))[0] + ".wav", result.stdout, "audio/x-wav"
+    with open(path, "rb") as f:
+        return os.path.basename(path), f.read(), "application/octet-stream"
+
+def transcribe(session, url, upload, retries, timeout):
+    file_name, content, content_type = upload
+    for attempt in range(retries + 1):
+        try:
+            response = session.post(
+                url,
+                files={"file": (file_name, content, content_type)},
+                headers={"accept": "application/json"},
+                timeout=timeout
+            )
+            response.raise_for_status()
+            return response.json().get("text", "")
+        except requests.exceptions.RequestException as e:
+            # Client errors (bad audio) will not succeed on a retry
+            status = e.response.status_code if e.response is not None else None
+            if attempt == retries or (status is not None and status < 500):
+                raise
+            time.sleep(2 ** attempt)
+
+def load_done_hashes(output_path):
+    """Return the content hashes that already have a successful transcript in the output."""
+    done = set()
+    if os.path.exists(output_path):
+        with open(output_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if not record.get("error"):
+                    done.add(record["sha256"])
+    return done
+
+def main():
+    parser = argparse.ArgumentParser(description="Transcribe every recording in a directory through the dwani.ai ASR API.")
+    parser.add_argument("directory", help="Directory to scan (recursively) for recordings")
+    parser.add_argument("output", help="JSONL file that transcripts are appended to")
+    parser.add_argument("--language", default="kannada", choices=LANGUAGES, help="Language of the recordings")
+    parser.add_argument("--concurrency", type=int, default=4, help="Uploads in flight at the same time")
+    parser.add_argument("--workers", type=int, default=None, help="Processes for hashing and normalizing audio (default: one per CPU)")
+    parser.add_argument("--sample-rate", type=int, default=16000, help="Sample rate of the normalized audio")
+    parser.add_argument("--no-normalize", action="store_true", help="Upload recordings as they are")
+    parser.add_argument("--retries", type=int, default=3, help="Retries per failed upload")
+    parser.add_argument("--timeout", type=float, default=300, help="Seconds to wait for each transcription")
+    args = parser.parse_args()
+
+    base_url = os.getenv("DWANI_AI_API_BASE_URL")
+    if not base_url:
+        raise ValueError("DWANI_AI_API_BASE_URL environment variable is not set")
+    url = f"{base_url.rstrip('/')}/v1/transcribe/?language={args.language}"
+
+    normalize = not args.no_normalize
+    if normalize and shutil.which("ffmpeg") is None:
+        print("ffmpeg not found, uploading recordings without normalizing them", file=sys.stderr)
+        normalize = False
+
+    paths = find_recordings(args.directory, AUDIO_EXTENSIONS)
+    done = load_done_hashes(args.output)
+    start_time = time.time()
+
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=args.concurrency, pool_maxsize=args.concurrency)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    transcribed = failed = 0
+    with ProcessPoolExecutor(max_workers=args.workers) as processes, \
+            ThreadPoolExecutor(max_workers=args.concurrency) as uploads, \
+            open(args.output, "a", encoding="utf-8") as output:
+        hashes = list(processes.map(file_sha256, paths, chunksize=8))
+        pending = []
+        for path, sha256 in zip(paths, hashes):
+            # Identical recordings are transcribed once
+            if sha256 not in done:
+                done.add(sha256)
+                pending.append((path, sha256))
+        print(f"Found {len(paths)} recordings, {len(pending)} to transcribe", file=sys.stderr)
+
+        def write_record(path, sha256, text=None, error=None):
+            nonlocal transcribed, failed
+            record = {
+                "path": os.path.relpath(path, args.directory),
+                "sha256": sha256,
+                "language": args.language,
+                "text": text,
+                "error": error
+            }
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+            output.flush()
+            if error:
+                failed += 1
+                print(f"\n{record['path']}: {error}", file=sys.stderr)
+            else:
+                transcribed += 1
+            print(f"\rTranscribed {transcribed}/{len(pending)}, failed {failed}", end="", file=sys.stderr)
+
+        # Bound the recordings held in memory between normalizing and uploading
+        window = args.concurrency * 2
+        in_flight = {}
+        queue = iter(pending)
+        while True:
+            while len(in_flight) < window:
+                item = next(queue, None)
+                if item is None:
+                    break
+                in_flight[processes.submit(prepare_audio, item[0], args.sample_rate, normalize)] = ("prepare", item)
+            if not in_flight:
+                break
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                stage, (path, sha256) = in_flight.pop(future)
+                try:
+                    result = future.result()
+                except subprocess.CalledProcessError as e:
+                    write_record(path, sha256, error=f"Normalization failed: {e.stderr.decode(errors='replace').strip()}")
+                except Exception as e:
+                    write_record(path, sha256, error=str(e))
+                else:
+                    if stage == "prepare":
+                        upload = uploads.submit(transcribe, session, url, result, args.retries, args.timeout)
+                        in_flight[upload] = ("upload", (path, sha256))
+                    else:
+                        write_record(path, sha256, text=result)
+
+    elapsed = time.time() - start_time
+    print(f"\nTranscribed {transcribed} recordings ({failed} failed) in {elapsed:.1f} seconds, output: {args.output}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import requests
+
+# Bulk translation of TXT (one sentence per line), JSONL or CSV files through /v1/translate.
+#
+# Each distinct sentence is translated once. Finished translations are appended
+# to a checkpoint file as every batch completes, so an interrupted run picks up
+# where it stopped when started again with the same arguments. Checkpoint
+# entries record their language pair and are only reused for the same pair.
+#
+#   python src/bulk-translate.py input.jsonl output.jsonl --src-lang eng_Latn --tgt-lang kan_Knda --field text
+
+def detect_format(path):
+    extension = os.path.splitext(path)[1].lower().lstrip(".")
+    return extension if extension in ("txt", "jsonl", "csv") else "txt"
+
+def read_records(path, file_format):
+    """Yield records from the input file: strings for TXT, dicts for JSONL and CSV."""
+    with open(path, encoding="utf-8", newline="") as f:
+        if file_format == "csv":
+            yield from csv.DictReader(f)
+        elif file_format == "jsonl":
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            for line in f:
+                yield line.rstrip("\r\n")
+
+def record_text(record, field):
+    return record if isinstance(record, str) else str(record.get(field) or "")
+
+def load_checkpoint(path, src_lang, tgt_lang):
+    """Return the translations saved by earlier runs for this language pair.
+
+    Entries for other language pairs, or without one, are ignored, as is a
+    partially written last line.
+    """
+    translations = {}
+    skipped = 0
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if entry.get("src_lang") != src_lang or entry.get("tgt_lang") != tgt_lang:
+                    skipped += 1
+                    continue
+                translations[entry["source"]] = entry["translation"]
+        with open(path, "rb+") as f:
+            # Terminate a line cut off by an interruption so new entries start on their own line
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+    if skipped:
+        print(f"Ignoring {skipped} checkpoint entries from {path} for a different language pair", file=sys.stderr)
+    return translations
+
+def translate_batch(session, url, sentences, src_lang, tgt_lang, retries, timeout):
+    payload = {"sentences": sentences, "src_lang": src_lang, "tgt_lang": tgt_lang}
+    for attempt in range(retries + 1):
+        try:
+            response = session.post(url, json=payload, headers={"accept": "application/json"}, timeout=timeout)
+            response.raise_for_status()
+            translations = response.json()["translations"]
+            if len(translations) != len(sentences):
+                raise ValueError(f"Expected {len(sentences)} translations, got {len(translations)}")
+            return translations
+        except (requests.exceptions.RequestException, ValueError, KeyError) as e:
+            if attempt == retries:
+                raise
+            delay = 2 ** attempt
+            print(f"Batch failed ({e}), retrying in {delay} seconds", file=sys.stderr)
+            time.sleep(delay)
+
+def translate_all(args, url, translations, checkpoint):
+    """Translate every sentence of the input that is not in translations yet."""
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=args.concurrency, pool_maxsize=args.concurrency)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    queued = set()
+    batch = []
+    in_flight = {}
+    lines_read = 0
+    translated = 0
+    start_time = time.time()
+
+    def collect(done):
+        nonlocal translated
+        for future in done:
+            sentences = in_flight.pop(future)
+            for sentence, translation in zip(sentences, future.result()):
+                translations[sentence] = translation
+                entry = {"src_lang": args.src_lang, "tgt_lang": args.tgt_lang, "source": sentence, "translation": translation}
+                checkpoint.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            checkpoint.flush()
+            translated += len(sentences)
+        rate = translated / max(time.time() - start_time, 1e-6)
+        print(f"\rRead {lines_read} lines, translated {translated} new sentences ({rate:.1f}/s)", end="", file=sys.stderr)
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+        def submit(sentences):
+            # Keep a bounded number of batches in flight so memory stays flat on huge inputs
+            if len(in_flight) >= args.concurrency * 2:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                collect(done)
+            future = executor.submit(
+                translate_batch, session, url, sentences, args.src_lang, args.tgt_lang, args.retries, args.timeout
+            )
+            in_flight[future] = sentences
+
+        for record in read_records(args.input, args.format):
+            lines_read += 1
+            text = record_text(record, args.field)
+            if not text.strip() or text in translations or text in queued:
+                continue
+            queued.add(text)
+            batch.append(text)
+            if len(batch) >= args.batch_size:
+                submit(batch)
+                batch = []
+        if batch:
+            submit(batch)
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            collect(done)
+    print(file=sys.stderr)
+    return lines_read, translated
+
+def write_output(args, translations):
+    """Write the input back out with translations, in the input's format and order."""
+    partial_path = f"{args.output}.part"
+    with open(partial_path, "w", encoding="utf-8", newline="") as f:
+        writer = None
+        for record in read_records(args.input, args.format):
+            text = record_text(record, args.field)
+            translation = translations.get(text, text if not text.strip() else "")
+            if args.format == "txt":
+                f.write(translation + "\n")
+            elif args.format == "jsonl":
+                f.write(json.dumps({**record, args.output_field: translation}, ensure_ascii=False) + "\n")
+            else:
+                if writer is None:
+                    writer = csv.DictWriter(f, fieldnames=[*record.keys(), args.output_field])
+                    writer.writeheader()
+                writer.writerow({**record, args.output_field: translation})
+    os.replace(partial_path, args.output)
+
+def main():
+    parser = argparse.ArgumentParser(description="Translate a TXT, JSONL or CSV file through the dwani.ai translate API.")
+    parser.add_argument("input", help="Input file (.txt: one sentence per line, .jsonl or .csv: see --field)")
+    parser.add_argument("output", help="Output file, written in the same format as the input")
+    parser.add_argument("--src-lang", required=True, help="Source language code (e.g., eng_Latn)")
+    parser.add_argument("--tgt-lang", required=True, help="Target language code (e.g., kan_Knda)")
+    parser.add_argument("--format", choices=["txt", "jsonl", "csv"], help="Input format (default: from the file extension)")
+    parser.add_argument("--field", default="text", help="JSONL key or CSV column holding the text to translate")
+    parser.add_argument("--output-field", default="translation", help="JSONL key or CSV column for the translation")
+    parser.add_argument("--batch-size", type=int, default=32, help="Sentences per /v1/translate call")
+    parser.add_argument("--concurrency", type=int, default=4, help="Calls in flight at the same time")
+    parser.add_argument("--retries", type=int, default=3, help="Retries per failed batch")
+    parser.add_argument("--timeout", type=float, default=120, help="Seconds to wait for each call")
+    parser.add_argument("--checkpoint", help="Checkpoint file (default: OUTPUT.checkpoint.jsonl)")
+    args = parser.parse_args()
+
+    base_url = os.getenv("DWANI_AI_API_BASE_URL")
+    if not base_url:
+        raise ValueError("DWANI_AI_API_BASE_URL environment variable is not set")
+    url = f"{base_url.rstrip('/')}/v1/translate"
+    args.format = args.format or detect_format(args.input)
+    checkpoint_path = args.checkpoint or f"{args.output}.checkpoint.jsonl"
+
+    translations = load_checkpoint(checkpoint_path, args.src_lang, args.tgt_lang)
+    if translations:
+        print(f"Resuming with {len(translations)} translations from {checkpoint_path}", file=sys.stderr)
+
+    start_time = time.time()
+    try:
+        with open(checkpoint_path, "a", encoding="utf-8") as checkpoint:
+            lines_read, translated = translate_all(args, url, translations, checkpoint)
+    except KeyboardInterrupt:
+        print(f"\nInterrupted; progress is saved in {checkpoint_path}, run again to resume", file=sys.stderr)
+        sys.exit(130)
+    except Exception as e:
+        print(f"\nTranslation failed: {e}; progress is saved in {checkpoint_path}, run again to resume", file=sys.stderr)
+        sys.exit(1)
+
+    write_output(args, translations)
+    print(f"Translated {lines_read} lines ({translated} new unique sentences) in {time.time() - start_time:.1f} seconds, output: {args.output}", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
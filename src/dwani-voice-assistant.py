@@ -6,6 +6,9 @@ from pydub import AudioSegment
 import logging
 import time
 import atexit
+import json
+from urllib.parse import urlencode, urlsplit, urlunsplit
+from websockets.sync.client import connect
 
 # Setup logging
 logging.basicConfig(
@@ -28,7 +31,7 @@ METRICS = {
 
 # Cleanup temporary files
 def cleanup():
-    for file in ["converted_audio.wav", "output_audio.wav"]:
+    for file in ["converted_audio.wav", "output_audio.wav", "output_audio_stream.mp3"]:
         if os.path.exists(file):
             os.remove(file)
 atexit.register(cleanup)
@@ -171,13 +174,128 @@ def process_audio(audio, language):
         log_metrics(language)
         return None, f"Error: {str(e)}"
 
+WS_SCHEMES = {"http": "ws", "https": "wss"}
+
+class StreamingSession:
+    """One recording streamed to the /v1/ws/speech_to_speech WebSocket endpoint."""
+
+    def __init__(self, language):
+        base_url = os.getenv("DWANI_AI_API_BASE_URL")
+        if not base_url:
+            raise ValueError("DWANI_AI_API_BASE_URL environment variable is not set")
+        parts = urlsplit(base_url)
+        ws_scheme = WS_SCHEMES.get(parts.scheme)
+        if ws_scheme is None:
+            raise ValueError(f"DWANI_AI_API_BASE_URL must be an http or https URL, got {base_url}")
+        ws_url = urlunsplit((
+            ws_scheme,
+            parts.netloc,
+            f"{parts.path.rstrip('/')}/v1/ws/speech_to_speech",
+            urlencode({"language": language.lower()}),
+            ""
+        ))
+        self.connection = connect(ws_url, open_timeout=10)
+        self.language = language
+        self.start_time = time.time()
+        self.partial_transcript = ""
+
+    def send_chunk(self, sample_rate, samples):
+        """Resample a microphone chunk to 16kHz mono PCM and forward it."""
+        segment = AudioSegment(
+            data=samples.tobytes(),
+            sample_width=samples.dtype.itemsize,
+            frame_rate=sample_rate,
+            channels=samples.shape[1] if samples.ndim > 1 else 1
+        )
+        segment = segment.set_frame_rate(16000).set_channels(1).set_sample_width(2)
+        try:
+            self.connection.send(segment.raw_data)
+            self._drain()
+        except Exception:
+            # The session is dropped after an error, so do not leave its connection open
+            self.connection.close()
+            raise
+
+    def _drain(self):
+        # Pick up partial transcripts without blocking the microphone stream
+        while True:
+            try:
+                message = self.connection.recv(timeout=0)
+            except TimeoutError:
+                return
+            self._handle(message)
+
+    def _handle(self, message):
+        if isinstance(message, bytes):
+            return message
+        event = json.loads(message)
+        if event["type"] in ("partial_transcript", "transcript"):
+            self.partial_transcript = event["text"]
+        elif event["type"] == "error":
+            raise RuntimeError(event["detail"])
+        return event
+
+    def finish(self, output_path):
+        """Signal end of speech and write the synthesized audio to output_path."""
+        self.connection.send(json.dumps({"type": "end"}))
+        try:
+            with open(output_path, "wb") as f:
+                while True:
+                    event = self._handle(self.connection.recv(timeout=60))
+                    if isinstance(event, bytes):
+                        f.write(event)
+                    elif event["type"] == "done":
+                        return self.partial_transcript
+        finally:
+            self.connection.close()
+
+def stream_audio(chunk, language, session):
+    if chunk is None:
+        return session, ""
+    try:
+        if session is None:
+            METRICS["total_requests"] += 1
+            session = StreamingSession(language)
+        sample_rate, samples = chunk
+        session.send_chunk(sample_rate, samples)
+        return session, f"Listening... {session.partial_transcript}"
+    except Exception as e:
+        logger.error(f"Error streaming audio: {str(e)}, Language={language}")
+        return None, f"Error: {str(e)}"
+
+def finish_stream(language, session):
+    if session is None:
+        return None, None, "Error: No audio was streamed."
+    try:
+        output_audio_path = "output_audio_stream.mp3"
+        transcript = session.finish(output_audio_path)
+        METRICS["successful_requests"] += 1
+        total_time = time.time() - session.start_time
+        METRICS["total_processing_time"] += total_time
+        METRICS["request_count_for_avg"] += 1
+        logger.info(f"Successful streaming request: Total time={total_time:.2f}s, Language={language}")
+        log_metrics(language)
+        return None, output_audio_path, f"Processing complete. You said: {transcript}"
+    except Exception as e:
+        METRICS["failed_requests"] += 1
+        total_time = time.time() - session.start_time
+        METRICS["total_processing_time"] += total_time
+        METRICS["request_count_for_avg"] += 1
+        logger.error(f"Error finishing stream: {str(e)}, Total time={total_time:.2f}s, Language={language}")
+        log_metrics(language)
+        return None, None, f"Error: {str(e)}"
+
+def select_mode(mode):
+    streaming = mode == "Streaming (WebSocket)"
+    return gr.update(visible=not streaming), gr.update(visible=not streaming), gr.update(visible=streaming)
+
 # Gradio interface
 with gr.Blocks() as demo:
     gr.Markdown("""
     # dwani.ai - Voice Assistant for India
     1. Select a language (Kannada, Tamil, or Hindi).
     2. Record audio using the microphone.
-    3. Click 'Process Audio' to send it to the API.
+    3. Click 'Process Audio' to send it to the API, or pick 'Streaming (WebSocket)' mode to send audio while you speak.
     4. Listen to the processed audio in the output section.
     **Note**: Ensure your audio is clear and in the selected language.
     """)
@@ -187,8 +305,15 @@ with gr.Blocks() as demo:
         label="Select Language",
         value="Kannada"  # Default value
     )
+    mode_radio = gr.Radio(
+        choices=["Record and upload", "Streaming (WebSocket)"],
+        label="Mode",
+        value="Record and upload"
+    )
     audio_input = gr.Audio(sources=["microphone"], type="filepath", label="Record Audio")
+    stream_input = gr.Audio(sources=["microphone"], type="numpy", streaming=True, label="Speak", visible=False)
     process_button = gr.Button("Process Audio")
+    session_state = gr.State(None)
     audio_output = gr.Audio(label="Processed Audio", type="filepath")
     status_message = gr.Textbox(label="Status", interactive=False)
     reset_button = gr.Button("Reset")
@@ -198,6 +323,22 @@ with gr.Blocks() as demo:
         inputs=[audio_input, language_dropdown],
         outputs=[audio_output, status_message]
     )
+    mode_radio.change(
+        fn=select_mode,
+        inputs=mode_radio,
+        outputs=[audio_input, process_button, stream_input]
+    )
+    stream_input.stream(
+        fn=stream_audio,
+        inputs=[stream_input, language_dropdown, session_state],
+        outputs=[session_state, status_message],
+        stream_every=0.5
+    )
+    stream_input.stop_recording(
+        fn=finish_stream,
+        inputs=[language_dropdown, session_state],
+        outputs=[session_state, audio_output, status_message]
+    )
     reset_button.click(
         fn=lambda: (None, None, "", "Kannada"),
         outputs=[audio_input, audio_output, status_message, language_dropdown]
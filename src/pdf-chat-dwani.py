@@ -1,22 +1,8 @@
 import gradio as gr
 import requests
-from PyPDF2 import PdfReader
 import os
 
-# Function to validate PDF file
-def is_valid_pdf(file_path):
-    try:
-        # If file_path is a string (Gradio provides a temporary file path)
-        if isinstance(file_path, str) and os.path.exists(file_path):
-            with open(file_path, "rb") as f:
-                pdf = PdfReader(f)
-                if len(pdf.pages) > 0:
-                    return True, f"Valid PDF with {len(pdf.pages)} pages"
-                return False, "Invalid PDF: No pages found"
-        else:
-            return False, "Invalid PDF: File path is not valid"
-    except Exception as e:
-        return False, f"Invalid PDF: {str(e)}"
+from pdf_inspect import check_pdf
 
 # Function to send the POST request to the API
 def extract_text_from_pdf(pdf_file, page_number, src_lang, tgt_lang, prompt):
@@ -24,7 +10,7 @@ def extract_text_from_pdf(pdf_file, page_number, src_lang, tgt_lang, prompt):
         return "Error: No file uploaded. Please upload a PDF file."
 
     # Validate the PDF
-    valid, message = is_valid_pdf(pdf_file)
+    valid, message = check_pdf(pdf_file)
     if not valid:
         return f"Error: {message}. Please upload a valid PDF file or repair the current one."
 
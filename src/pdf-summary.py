@@ -1,24 +1,8 @@
 import gradio as gr
 import requests
-from PyPDF2 import PdfReader
 import os
 
-# Function to validate PDF file
-def is_valid_pdf(file_path):
-    try:
-        if isinstance(file_path, str) and os.path.exists(file_path):
-            file_size = os.path.getsize(file_path) / (1024 * 1024)  # Size in MB
-            if file_size > 50:  # Limit to 50 MB
-                return False, "PDF file is too large (max 50 MB)"
-            with open(file_path, "rb") as f:
-                pdf = PdfReader(f)
-                if len(pdf.pages) > 0:
-                    return True, f"Valid PDF with {len(pdf.pages)} pages"
-                return False, "Invalid PDF: No pages found"
-        else:
-            return False, "Invalid PDF: File path is not valid"
-    except Exception as e:
-        return False, f"Invalid PDF: {str(e)}"
+from pdf_inspect import check_pdf
 
 # Function to send the POST request to the API
 def extract_text_from_pdf(pdf_file, src_lang, tgt_lang, prompt):
@@ -26,7 +10,7 @@ def extract_text_from_pdf(pdf_file, src_lang, tgt_lang, prompt):
         return "Error: No file uploaded. Please upload a PDF file.", ""
 
     # Validate the PDF
-    valid, message = is_valid_pdf(pdf_file)
+    valid, message = check_pdf(pdf_file, max_size_mb=50)  # Limit to 50 MB
     if not valid:
         return f"Error: {message}. Please upload a valid PDF file or repair the current one.", ""
 
@@ -0,0 +1,108 @@
+import hashlib
+import os
+import tempfile
+import uuid
+from collections import OrderedDict
+from typing import NamedTuple
+
+from PyPDF2 import PdfReader
+
+# Bytes hashed from each end of the file; with the size and mtime this identifies an upload
+SAMPLE_BYTES = 64 * 1024
+MAX_CACHED = 128
+MAX_PREVIEWS = 64
+PREVIEW_DIR = os.path.join(tempfile.gettempdir(), "pdf-previews")
+
+class PdfInfo(NamedTuple):
+    page_count: int
+    size_bytes: int
+
+_cache: "OrderedDict[tuple, PdfInfo]" = OrderedDict()
+
+def file_key(file_path):
+    """Return a cache key for a file: a hash of its size, head and tail, and its mtime."""
+    stat = os.stat(file_path)
+    digest = hashlib.sha256(str(stat.st_size).encode())
+    with open(file_path, "rb") as f:
+        digest.update(f.read(SAMPLE_BYTES))
+        if stat.st_size > SAMPLE_BYTES:
+            f.seek(max(stat.st_size - SAMPLE_BYTES, SAMPLE_BYTES))
+            digest.update(f.read())
+    return digest.hexdigest(), stat.st_mtime_ns
+
+def inspect_pdf(file_path):
+    """Return the page count and size of a PDF, reading it at most once per version of the file.
+
+    Only the cross-reference table, trailer and page tree root are parsed: the
+    page count comes from the root's /Count instead of walking every page.
+    Raises on files that are not readable PDFs.
+    """
+    key = file_key(file_path)
+    info = _cache.get(key)
+    if info is not None:
+        _cache.move_to_end(key)
+        return info
+
+    with open(file_path, "rb") as f:
+        reader = PdfReader(f)
+        page_count = int(reader.trailer["/Root"]["/Pages"]["/Count"])
+    info = PdfInfo(page_count=page_count, size_bytes=os.path.getsize(file_path))
+    _cache[key] = info
+    while len(_cache) > MAX_CACHED:
+        _cache.popitem(last=False)
+    return info
+
+def check_pdf(file_path, max_size_mb=None):
+    """Validate an uploaded PDF, returning (valid, message)."""
+    try:
+        if not (isinstance(file_path, str) and os.path.exists(file_path)):
+            return False, "Invalid PDF: File path is not valid"
+        if max_size_mb is not None and os.path.getsize(file_path) / (1024 * 1024) > max_size_mb:
+            return False, f"PDF file is too large (max {max_size_mb} MB)"
+        info = inspect_pdf(file_path)
+        if info.page_count > 0:
+            return True, f"Valid PDF with {info.page_count} pages"
+        return False, "Invalid PDF: No pages found"
+    except Exception as e:
+        return False, f"Invalid PDF: {str(e)}"
+
+def prune_previews(keep=MAX_PREVIEWS):
+    """Delete all but the `keep` most recently used previews."""
+    previews = []
+    for name in os.listdir(PREVIEW_DIR):
+        if not name.endswith(".png"):
+            continue
+        path = os.path.join(PREVIEW_DIR, name)
+        try:
+            previews.append((os.stat(path).st_mtime, path))
+        except FileNotFoundError:
+            continue
+    for _, path in sorted(previews, reverse=True)[keep:]:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+def preview_image(file_path, page_number=1):
+    """Return the path of a PNG preview of one page, rendering it only the first time it is asked for.
+
+    At most MAX_PREVIEWS previews are kept; the least recently used are deleted.
+    """
+    digest, mtime = file_key(file_path)
+    image_path = os.path.join(PREVIEW_DIR, f"{digest[:16]}-{mtime}-{page_number}.png")
+    try:
+        os.utime(image_path)  # Mark as recently used
+        return image_path
+    except FileNotFoundError:
+        pass
+
+    # pdf2image needs poppler, so it is only imported by clients that show previews
+    from pdf2image import convert_from_path
+
+    images = convert_from_path(file_path, first_page=page_number, last_page=page_number)
+    os.makedirs(PREVIEW_DIR, exist_ok=True)
+    partial_path = f"{image_path}.{uuid.uuid4().hex}.tmp"
+    images[0].save(partial_path, "PNG")
+    os.replace(partial_path, image_path)
+    prune_previews()
+    return image_path
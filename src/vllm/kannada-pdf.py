@@ -1,10 +1,13 @@
 import gradio as gr
-import PyPDF2
-from pdf2image import convert_from_path
 import requests
 import os
+import sys
 import tempfile
 
+# Shared client helpers live in src/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pdf_inspect import inspect_pdf, preview_image
+
 base_url = os.getenv("DWANI_AI_API_BASE_URL")
 
 
@@ -17,16 +20,10 @@ def process_pdf(pdf_file, page_number, prompt, src_lang):
         # Use the file path from Gradio
         input_pdf_path = pdf_file
 
-        # Preview the input PDF's first page
-        with open(input_pdf_path, "rb") as file:
-            pdf = PyPDF2.PdfReader(file)
-            num_pages = len(pdf.pages)
-            input_info = f"Input PDF Info:\n- Number of pages: {num_pages}"
-
-        # Convert the first page of input PDF to an image
-        input_images = convert_from_path(input_pdf_path, first_page=1, last_page=1)
-        input_image_path = os.path.join(tempfile.gettempdir(), "input_preview.png")
-        input_images[0].save(input_image_path, "PNG")
+        # Preview the input PDF's first page (cached, so resubmitting the same file is free)
+        num_pages = inspect_pdf(input_pdf_path).page_count
+        input_info = f"Input PDF Info:\n- Number of pages: {num_pages}"
+        input_image_path = preview_image(input_pdf_path)
 
         endpoint = "/v1/indic-custom-prompt-kannada-pdf"
 
@@ -59,15 +56,9 @@ def process_pdf(pdf_file, page_number, prompt, src_lang):
             f.write(response.content)
 
         # Extract info from the output PDF
-        with open(output_pdf_path, "rb") as file:
-            output_pdf = PyPDF2.PdfReader(file)
-            output_num_pages = len(output_pdf.pages)
-            output_info = f"Output PDF Info:\n- Number of pages: {output_num_pages}"
-
-        # Convert the first page of the output PDF to an image
-        output_images = convert_from_path(output_pdf_path, first_page=1, last_page=1)
-        output_image_path = os.path.join(tempfile.gettempdir(), "output_preview.png")
-        output_images[0].save(output_image_path, "PNG")
+        output_num_pages = inspect_pdf(output_pdf_path).page_count
+        output_info = f"Output PDF Info:\n- Number of pages: {output_num_pages}"
+        output_image_path = preview_image(output_pdf_path)
 
         return input_info, input_image_path, output_info, output_image_path
     except Exception as e: